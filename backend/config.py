@@ -1,6 +1,7 @@
 # backend/config.py
 import os
 from datetime import datetime, date
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 
@@ -32,6 +33,11 @@ CURRENT_DATE = get_current_context_date()
 # 5. KBO 도메인 상수 (전 구단 확장)
 TEAMS = ['삼성', 'KIA', 'LG', 'KT', '두산', 'SSG', '롯데', '한화', '키움', 'NC']
 
+# 경기 일정 관련 상수 (라이브 폴링, 예측 제출 마감 확인에서 공용)
+KST = ZoneInfo("Asia/Seoul")
+DEFAULT_GAME_TIME = "18:30"          # 시작 시각 정보가 없을 때 가정하는 평일 경기 시작 시각
+FINAL_STATUSES = ("종료", "취소")     # 결과가 없어도 더 이상 기다릴 필요가 없는 경기 상태
+
 # AI 모델 피처 정의
 FEATURE_CONFIG = {
     "categorical": ["home_team", "away_team"],
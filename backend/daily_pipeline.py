@@ -11,6 +11,9 @@ GitHub Actions에서 매일 새벽 1시(KST)에 실행됩니다.
 5. 리그 순위 업데이트
 6. 어제 예측 점수 정산
 7. 주간 랭킹 초기화 (월요일)
+8. 시즌 확률 스냅샷 저장 (포스트시즌 진출/순위 분포)
+9. 새로 끝난 경기의 박스스코어 수집
+10. 점수 아웃박스 처리 (API 서버가 반영하지 못한 점수 이벤트)
 """
 import os
 import sys
@@ -26,6 +29,9 @@ from services.crawler_service import CrawlerService
 from services.feature_service import FeatureService
 from services.model_service import ModelService
 from services.ranking_service import RankingService
+from services.simulation_service import SimulationService
+from services.box_score_service import BoxScoreService
+from services.score_outbox import ScoreOutbox
 
 
 def update_team_rankings(conn=None):
@@ -35,7 +41,7 @@ def update_team_rankings(conn=None):
     Args:
         conn: 외부 트랜잭션 connection (관리자 모드용). None이면 자체 트랜잭션 사용.
     """
-    print(f"\n[5/7] 📊 리그 순위 업데이트...")
+    print(f"\n[5/9] 📊 리그 순위 업데이트...")
     try:
         # 1. 각 팀별 승/패/무 집계
         standings_query = text("""
@@ -200,6 +206,19 @@ def update_team_rankings(conn=None):
         return 0
 
 
+def features_outdated() -> bool:
+    """kbo_games에 마지막 피처 재구축 이후 추가/변경된 경기 결과가 있으면 True (판단할 수 없으면 True)"""
+    try:
+        with engine.connect() as conn:
+            return bool(conn.execute(text("""
+                SELECT (SELECT MAX(updated_at) FROM kbo_games)
+                       > COALESCE((SELECT MAX(created_at) FROM match_features), '-infinity'::timestamp)
+            """)).scalar())
+    except Exception as e:
+        print(f"   ⚠️ 피처 갱신 시점 확인 실패 (재구축 진행): {e}")
+        return True
+
+
 def run_daily_pipeline():
     """일일 파이프라인을 순차적으로 실행합니다."""
     today = CURRENT_DATE
@@ -212,7 +231,7 @@ def run_daily_pipeline():
     results = {}
     
     # Step 1: 경기 결과 및 일정 스크래핑
-    print(f"\n[1/7] 📡 경기 데이터 스크래핑...")
+    print(f"\n[1/9] 📡 경기 데이터 스크래핑...")
     try:
         scrape_result = CrawlerService.update_daily_pipeline()
         results['scrape'] = scrape_result
@@ -221,18 +240,32 @@ def run_daily_pipeline():
         print(f"   ❌ 스크래핑 실패: {e}")
         results['scrape'] = {"error": str(e)}
     
+    # 경기 결과가 바뀐 경우에만 결과 기반 단계(피처/순위)를 다시 계산
+    # (스크래핑 실패 시에는 판단할 수 없으므로 기존처럼 실행)
+    # 이번 실행의 변경분뿐 아니라, 라이브 폴링 등 다른 실행이 반영한 결과가 피처보다 새로우면 다시 계산
+    scrape = results['scrape']
+    results_changed = (
+        "error" in scrape
+        or bool(scrape.get("changed_game_ids"))
+        or features_outdated()
+    )
+    
     # Step 2: 피처 재구축
-    print(f"\n[2/7] 🔧 피처 재구축...")
-    try:
-        feature_count = FeatureService.build_all_features()
-        results['features'] = feature_count
-        print(f"   ✅ 피처 재구축 완료: {feature_count}개 경기")
-    except Exception as e:
-        print(f"   ❌ 피처 재구축 실패: {e}")
-        results['features'] = {"error": str(e)}
+    if results_changed:
+        print(f"\n[2/9] 🔧 피처 재구축...")
+        try:
+            feature_count = FeatureService.build_all_features()
+            results['features'] = feature_count
+            print(f"   ✅ 피처 재구축 완료: {feature_count}개 경기")
+        except Exception as e:
+            print(f"   ❌ 피처 재구축 실패: {e}")
+            results['features'] = {"error": str(e)}
+    else:
+        print(f"\n[2/9] ⏭️ 피처 재구축 스킵 (변경된 경기 결과 없음)")
+        results['features'] = "skipped"
     
     # Step 3: AI 예측 실행
-    print(f"\n[3/7] 🤖 AI 예측 실행...")
+    print(f"\n[3/9] 🤖 AI 예측 실행...")
     try:
         predictions = ModelService.predict_all_games()
         results['predictions'] = len(predictions)
@@ -242,7 +275,7 @@ def run_daily_pipeline():
         results['predictions'] = {"error": str(e)}
     
     # Step 4: 어제 예측 점수 정산
-    print(f"\n[4/7] 📊 점수 정산 ({yesterday})...")
+    print(f"\n[4/9] 📊 점수 정산 ({yesterday})...")
     try:
         settle_result = RankingService.settle_daily_points(yesterday)
         results['settle'] = settle_result
@@ -252,23 +285,58 @@ def run_daily_pipeline():
         results['settle'] = {"error": str(e)}
     
     # Step 5: 리그 순위 업데이트
-    team_count = update_team_rankings()
-    results['standings'] = team_count
+    if results_changed:
+        team_count = update_team_rankings()
+        results['standings'] = team_count
+    else:
+        print(f"\n[5/9] ⏭️ 리그 순위 업데이트 스킵 (변경된 경기 결과 없음)")
+        results['standings'] = "skipped"
     
     # Step 6: 주간 랭킹 초기화 (월요일인 경우)
     if today.weekday() == 0:  # Monday
-        print(f"\n[6/7] 🔄 주간 랭킹 초기화 (월요일)...")
+        print(f"\n[6/9] 🔄 주간 랭킹 초기화 (월요일)...")
         try:
-            reset_result = RankingService.reset_weekly_ranking()
+            reset_result = RankingService.reset_weekly_ranking(today)
             results['weekly_reset'] = reset_result
             print(f"   ✅ 주간 랭킹 초기화 완료")
         except Exception as e:
             print(f"   ❌ 주간 랭킹 초기화 실패: {e}")
             results['weekly_reset'] = {"error": str(e)}
     else:
-        print(f"\n[6/7] ⏭️ 주간 랭킹 초기화 스킵 (월요일 아님)")
+        print(f"\n[6/9] ⏭️ 주간 랭킹 초기화 스킵 (월요일 아님)")
         results['weekly_reset'] = "skipped"
     
+    # Step 7: 시즌 확률 스냅샷 저장 (차트용 일별 히스토리)
+    print(f"\n[7/9] 🎲 시즌 확률 스냅샷 저장...")
+    try:
+        odds_count = SimulationService.save_odds_snapshot(today)
+        results['season_odds'] = odds_count
+        print(f"   ✅ 시즌 확률 스냅샷 저장 완료: {odds_count}개 팀")
+    except Exception as e:
+        print(f"   ❌ 시즌 확률 스냅샷 저장 실패: {e}")
+        results['season_odds'] = {"error": str(e)}
+    
+    # Step 8: 박스스코어 수집 (아직 수집하지 않은 경기만)
+    print(f"\n[8/9] 📦 박스스코어 수집...")
+    try:
+        box_result = BoxScoreService.ingest()
+        results['box_scores'] = box_result
+        print(f"   ✅ 박스스코어 수집 완료: {box_result}")
+    except Exception as e:
+        print(f"   ❌ 박스스코어 수집 실패: {e}")
+        results['box_scores'] = {"error": str(e)}
+    
+    # Step 9: 점수 아웃박스 처리 (API 서버가 내려가 있는 동안 쌓인 이벤트 반영 + 오래된 기록 정리)
+    print(f"\n[9/9] 📤 점수 아웃박스 처리...")
+    try:
+        outbox_result = ScoreOutbox.drain()
+        outbox_result["purged"] = ScoreOutbox.purge()
+        results['score_outbox'] = outbox_result
+        print(f"   ✅ 점수 아웃박스 처리 완료: {outbox_result}")
+    except Exception as e:
+        print(f"   ❌ 점수 아웃박스 처리 실패: {e}")
+        results['score_outbox'] = {"error": str(e)}
+    
     # 요약 출력
     print(f"\n{'='*60}")
     print(f"📋 파이프라인 실행 요약")
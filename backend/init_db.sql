@@ -16,9 +16,15 @@ CREATE TABLE IF NOT EXISTS kbo_games (
     winning_team VARCHAR(20),
     is_postseason BOOLEAN DEFAULT FALSE,
     sort_text VARCHAR(20) DEFAULT '',
-    created_at TIMESTAMP DEFAULT NOW()
+    row_digest VARCHAR(32),            -- 크롤러 변경 감지용 내용 해시
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW() -- 마지막 삽입/내용 변경 시각 (피처 재구축 판단, 결과 캐시 키)
 );
 
+-- 기존 DB 마이그레이션 (크롤러는 런타임에 DDL을 실행하지 않음)
+ALTER TABLE kbo_games ADD COLUMN IF NOT EXISTS row_digest VARCHAR(32);
+ALTER TABLE kbo_games ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT NOW();
+
 -- 1.2. 업그레이드된 피처 테이블 (Streak, Recent RD 추가)
 CREATE TABLE IF NOT EXISTS match_features (
     game_id VARCHAR(20) PRIMARY KEY,
@@ -71,6 +77,193 @@ CREATE TABLE IF NOT EXISTS user_profiles (
     updated_at TIMESTAMP DEFAULT NOW()
 );
 
+-- 2.1.1. 점수 원장 (주 단위 파티션 점수 이벤트 + 주간 집계)
+-- 모든 점수 증가분을 주(week_start, 월요일) 단위 파티션에 append-only로 기록하고, 주간 합계는 score_weekly_totals에 함께 누적
+-- 주간 초기화는 score_ledger_state.current_week를 바꾸는 것으로 끝나며(start_score_week), 지난 주 랭킹은 주간 집계로 조회
+-- user_profiles.weekly_score는 더 이상 갱신하지 않음 (이번 주 점수는 score_weekly_totals의 current_week 행)
+CREATE TABLE IF NOT EXISTS score_ledger_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),   -- 단일 행
+    current_week DATE NOT NULL,                       -- 점수 이벤트가 기록되는 주 (월요일)
+    switched_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS score_events (
+    id BIGSERIAL,
+    week_start DATE NOT NULL,
+    user_id TEXT NOT NULL,
+    score_type VARCHAR(20) NOT NULL,
+    delta INTEGER NOT NULL,
+    source VARCHAR(20),                  -- 'quiz', 'prediction' 등 이벤트 출처
+    created_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (week_start, id)
+) PARTITION BY RANGE (week_start);
+
+-- 주 파티션이 아직 없는 이벤트를 받는 기본 파티션
+CREATE TABLE IF NOT EXISTS score_events_default PARTITION OF score_events DEFAULT;
+
+CREATE TABLE IF NOT EXISTS score_weekly_totals (
+    week_start DATE NOT NULL,
+    user_id TEXT NOT NULL,
+    weekly_score INTEGER NOT NULL DEFAULT 0,
+    prediction_score INTEGER NOT NULL DEFAULT 0,
+    quiz_score INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (week_start, user_id)
+);
+
+-- 주 파티션 생성 (이미 있거나, 기본 파티션에 해당 주 이벤트가 이미 들어가 있으면 건너뜀)
+CREATE OR REPLACE FUNCTION ensure_score_week_partition(p_week DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    part_name TEXT := 'score_events_' || to_char(p_week, 'YYYYMMDD');
+BEGIN
+    IF to_regclass(part_name) IS NOT NULL
+       OR EXISTS (SELECT 1 FROM score_events_default WHERE week_start = p_week) THEN
+        RETURN;
+    END IF;
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF score_events FOR VALUES FROM (%L) TO (%L)',
+        part_name, p_week, p_week + 7
+    );
+END;
+$$;
+
+-- 주간 전환 (supabase_config.reset_weekly_scores): 현재 주 키만 바꾸고 이번 주/다음 주 파티션을 미리 생성
+-- 같은 주로 다시 호출해도 결과가 같음
+CREATE OR REPLACE FUNCTION start_score_week(p_week DATE)
+RETURNS DATE
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    p_week := date_trunc('week', p_week)::DATE;
+    PERFORM ensure_score_week_partition(p_week);
+    PERFORM ensure_score_week_partition(p_week + 7);
+    INSERT INTO score_ledger_state (id, current_week) VALUES (TRUE, p_week)
+    ON CONFLICT (id) DO UPDATE SET current_week = EXCLUDED.current_week, switched_at = NOW();
+    RETURN p_week;
+END;
+$$;
+
+-- 원장 도입 시 1회: 이번 주를 시작하고 기존 user_profiles.weekly_score를 이번 주 집계로 이관
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM score_ledger_state) THEN
+        PERFORM start_score_week(CURRENT_DATE);
+        INSERT INTO score_weekly_totals (week_start, user_id, weekly_score)
+        SELECT s.current_week, p.user_id, p.weekly_score
+        FROM user_profiles p CROSS JOIN score_ledger_state s
+        WHERE p.weekly_score > 0
+        ON CONFLICT DO NOTHING;
+    END IF;
+END;
+$$;
+
+-- 2.1.2. 점수 원자적 일괄 증가 함수 (supabase_config.increment_user_scores / 예측 정산)
+-- 아웃박스 이벤트별 반영 기록 (apply_score_deltas 멱등성 키, 보관 기간 후 ScoreOutbox.purge가 삭제)
+CREATE TABLE IF NOT EXISTS score_applied_outbox (
+    outbox_id BIGINT PRIMARY KEY,        -- score_outbox.id
+    applied_at TIMESTAMP DEFAULT NOW()
+);
+
+-- deltas: [{"user_id", "nickname", "score_type", "delta", "source"(선택), "outbox_id"(선택)}, ...]
+-- 유저별로 합산한 뒤 한 번의 INSERT ... ON CONFLICT로 증가시키므로 동시 호출에도 증가분이 유실되지 않음
+-- outbox_id가 있는 증가분은 score_applied_outbox에 먼저 기록하고, 이미 반영된 id는 건너뜀
+-- (디스패처가 RPC 성공 후 완료 기록 전에 중단되어 같은 이벤트를 다시 보내도 한 번만 반영)
+-- 증가분은 현재 주의 점수 원장(score_events)과 주간 집계(score_weekly_totals)에도 같은 트랜잭션에서 기록
+-- 주간 weekly_score는 score_type이 'weekly_score'인 증가분만 반영 (기존 upsert_user_score 동작과 동일)
+CREATE OR REPLACE FUNCTION apply_score_deltas(deltas JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH raw AS (
+        SELECT e->>'user_id' AS user_id,
+               NULLIF(e->>'nickname', '') AS nickname,
+               e->>'score_type' AS score_type,
+               (e->>'delta')::INTEGER AS delta,
+               NULLIF(e->>'source', '') AS source,
+               NULLIF(e->>'outbox_id', '')::BIGINT AS outbox_id
+        FROM jsonb_array_elements(deltas) AS e
+    ),
+    fresh AS (
+        INSERT INTO score_applied_outbox (outbox_id)
+        SELECT DISTINCT outbox_id FROM raw WHERE outbox_id IS NOT NULL
+        ON CONFLICT (outbox_id) DO NOTHING
+        RETURNING outbox_id
+    ),
+    d AS (
+        SELECT raw.* FROM raw
+        WHERE raw.outbox_id IS NULL
+           OR raw.outbox_id IN (SELECT outbox_id FROM fresh)
+    ),
+    wk AS (
+        SELECT COALESCE(
+            (SELECT current_week FROM score_ledger_state),
+            date_trunc('week', CURRENT_DATE)::DATE
+        ) AS week_start
+    ),
+    logged AS (
+        INSERT INTO score_events (week_start, user_id, score_type, delta, source)
+        SELECT wk.week_start, d.user_id, d.score_type, d.delta, d.source
+        FROM d CROSS JOIN wk
+        RETURNING 1
+    ),
+    agg AS (
+        SELECT user_id,
+               COALESCE(MAX(nickname), LEFT(user_id, 8)) AS nickname,
+               COALESCE(SUM(delta) FILTER (WHERE score_type = 'weekly_score'), 0) AS weekly,
+               COALESCE(SUM(delta) FILTER (WHERE score_type = 'prediction_score'), 0) AS prediction,
+               COALESCE(SUM(delta) FILTER (WHERE score_type = 'quiz_score'), 0) AS quiz
+        FROM d
+        GROUP BY user_id
+    ),
+    weekly AS (
+        INSERT INTO score_weekly_totals (week_start, user_id, weekly_score, prediction_score, quiz_score, updated_at)
+        SELECT wk.week_start, agg.user_id, agg.weekly, agg.prediction, agg.quiz, NOW()
+        FROM agg CROSS JOIN wk
+        ORDER BY agg.user_id
+        ON CONFLICT (week_start, user_id) DO UPDATE SET
+            weekly_score = score_weekly_totals.weekly_score + EXCLUDED.weekly_score,
+            prediction_score = score_weekly_totals.prediction_score + EXCLUDED.prediction_score,
+            quiz_score = score_weekly_totals.quiz_score + EXCLUDED.quiz_score,
+            updated_at = NOW()
+        RETURNING 1
+    ),
+    upserted AS (
+        INSERT INTO user_profiles (user_id, nickname, prediction_score, quiz_score, updated_at)
+        SELECT user_id, nickname, prediction, quiz, NOW()
+        FROM agg
+        ORDER BY user_id  -- 동시 호출 간 교착 방지를 위해 항상 같은 순서로 잠금
+        ON CONFLICT (user_id) DO UPDATE SET
+            prediction_score = COALESCE(user_profiles.prediction_score, 0) + EXCLUDED.prediction_score,
+            quiz_score = COALESCE(user_profiles.quiz_score, 0) + EXCLUDED.quiz_score,
+            updated_at = NOW()
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM upserted;
+$$;
+
+-- 2.1.3. 점수 반영 아웃박스 (services/score_outbox.py)
+-- 점수 이벤트를 요청 트랜잭션 안에서 기록하고, 백그라운드 디스패처가 일괄로 apply_score_deltas에 반영
+CREATE TABLE IF NOT EXISTS score_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    nickname VARCHAR(50),
+    score_type VARCHAR(20) NOT NULL,
+    delta INTEGER NOT NULL,
+    source VARCHAR(20),                  -- 'quiz' 등 이벤트 출처
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    claimed_until TIMESTAMP,             -- 디스패처가 처리 중인 이벤트의 임대 만료 시각
+    dispatched_at TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_score_outbox_pending
+    ON score_outbox (next_attempt_at) WHERE dispatched_at IS NULL;
+
 -- 2.2. 유저 승리 예측 기록
 CREATE TABLE IF NOT EXISTS user_predictions (
     user_id TEXT NOT NULL,
@@ -82,6 +275,125 @@ CREATE TABLE IF NOT EXISTS user_predictions (
     PRIMARY KEY (user_id, game_id)
 );
 
+-- 2.2.1. 경기별 팬 예측 집계 (services/crowd_picks.py)
+-- user_predictions 트리거가 예측 생성/변경(팀 변경)/삭제 시 해당 팀 카운터를 증감 (GROUP BY 없이 바로 조회)
+CREATE TABLE IF NOT EXISTS game_crowd_picks (
+    game_id VARCHAR(20) NOT NULL,
+    team VARCHAR(20) NOT NULL,
+    picks INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (game_id, team)
+);
+
+CREATE OR REPLACE FUNCTION track_crowd_picks()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE game_crowd_picks SET picks = picks - 1
+        WHERE game_id = OLD.game_id AND team = OLD.predicted_winner;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO game_crowd_picks (game_id, team, picks)
+        VALUES (NEW.game_id, NEW.predicted_winner, 1)
+        ON CONFLICT (game_id, team) DO UPDATE SET picks = game_crowd_picks.picks + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- 트리거 설치 시 1회: 기존 예측으로 카운터를 채움 (설치와 같은 트랜잭션에서 쓰기를 막고 실행)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_crowd_picks_insert_delete') THEN
+        LOCK TABLE user_predictions IN SHARE ROW EXCLUSIVE MODE;
+        INSERT INTO game_crowd_picks (game_id, team, picks)
+        SELECT game_id, predicted_winner, COUNT(*)
+        FROM user_predictions
+        GROUP BY game_id, predicted_winner
+        ON CONFLICT (game_id, team) DO UPDATE SET picks = EXCLUDED.picks;
+
+        CREATE TRIGGER trg_crowd_picks_insert_delete
+            AFTER INSERT OR DELETE ON user_predictions
+            FOR EACH ROW EXECUTE FUNCTION track_crowd_picks();
+        -- 같은 팀으로 다시 저장하는 upsert는 카운터를 건드리지 않음
+        CREATE TRIGGER trg_crowd_picks_switch
+            AFTER UPDATE OF predicted_winner ON user_predictions
+            FOR EACH ROW
+            WHEN (OLD.predicted_winner IS DISTINCT FROM NEW.predicted_winner)
+            EXECUTE FUNCTION track_crowd_picks();
+    END IF;
+END;
+$$;
+
+-- 2.2.2. 정산 시점 팬 예측 스냅샷 (팬 다수 선택 vs AI 적중률 통계용, RankingService.settle_daily_points)
+CREATE TABLE IF NOT EXISTS game_crowd_snapshots (
+    game_id VARCHAR(20) PRIMARY KEY,
+    game_date DATE NOT NULL,
+    home_team VARCHAR(20) NOT NULL,
+    away_team VARCHAR(20) NOT NULL,
+    home_picks INTEGER NOT NULL,
+    away_picks INTEGER NOT NULL,
+    crowd_pick VARCHAR(20),              -- 팬 다수 선택 팀 (동률이거나 예측이 없으면 NULL)
+    ai_pick VARCHAR(20),
+    winning_team VARCHAR(20) NOT NULL,
+    settled_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_crowd_snapshots_date ON game_crowd_snapshots(game_date);
+
+-- 2.2.3. 유저별 예측 통계 (RankingService.settle_daily_points가 정산과 같은 문장에서 증분 갱신)
+-- 프로필 조회는 PK 한 행만 읽음 (user_predictions 이력을 다시 집계하지 않음)
+-- 연속 적중은 정산 순서(경기 날짜, 같은 날은 game_id 순)를 기준으로 이어짐
+CREATE TABLE IF NOT EXISTS user_prediction_stats (
+    user_id TEXT PRIMARY KEY,
+    total_predictions INTEGER NOT NULL DEFAULT 0,   -- 정산된 예측 수 (무승부 제외)
+    correct_predictions INTEGER NOT NULL DEFAULT 0,
+    beat_ai INTEGER NOT NULL DEFAULT 0,             -- AI가 틀린(또는 예측이 없던) 경기를 맞춘 수
+    current_streak INTEGER NOT NULL DEFAULT 0,      -- 현재 연속 적중
+    best_streak INTEGER NOT NULL DEFAULT 0,         -- 최고 연속 적중
+    last_settled_date DATE,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- 통계 도입 전 정산 이력 이관 (테이블이 비어 있을 때 1회)
+WITH hist AS (
+    SELECT up.user_id, up.is_correct, g.game_date,
+           (up.is_correct AND a.predicted_winner IS DISTINCT FROM g.winning_team) AS beat_ai,
+           ROW_NUMBER() OVER (PARTITION BY up.user_id ORDER BY g.game_date, up.game_id) AS rn,
+           ROW_NUMBER() OVER (PARTITION BY up.user_id ORDER BY g.game_date, up.game_id)
+             - ROW_NUMBER() OVER (PARTITION BY up.user_id, up.is_correct ORDER BY g.game_date, up.game_id) AS run_id
+    FROM user_predictions up
+    JOIN kbo_games g ON g.game_id = up.game_id
+    LEFT JOIN ai_predictions a ON a.game_id = up.game_id
+    WHERE up.is_correct IS NOT NULL
+),
+runs AS (
+    SELECT user_id, MAX(rn) AS last_rn, COUNT(*) AS len
+    FROM hist
+    WHERE is_correct
+    GROUP BY user_id, run_id
+),
+per_user AS (
+    SELECT user_id, COUNT(*) AS total,
+           COUNT(*) FILTER (WHERE is_correct) AS correct,
+           COUNT(*) FILTER (WHERE beat_ai) AS beat_ai,
+           MAX(rn) AS last_rn, MAX(game_date) AS last_date
+    FROM hist
+    GROUP BY user_id
+)
+INSERT INTO user_prediction_stats
+    (user_id, total_predictions, correct_predictions, beat_ai, current_streak, best_streak, last_settled_date)
+SELECT p.user_id, p.total, p.correct, p.beat_ai,
+       COALESCE(MAX(r.len) FILTER (WHERE r.last_rn = p.last_rn), 0),
+       COALESCE(MAX(r.len), 0),
+       p.last_date
+FROM per_user p
+LEFT JOIN runs r ON r.user_id = p.user_id
+WHERE NOT EXISTS (SELECT 1 FROM user_prediction_stats)
+GROUP BY p.user_id, p.total, p.correct, p.beat_ai, p.last_rn, p.last_date
+ON CONFLICT (user_id) DO NOTHING;
+
 -- 2.3. 유저 퀴즈 참여 기록 (일일 제한 확인용)
 CREATE TABLE IF NOT EXISTS user_quizzes (
     id SERIAL PRIMARY KEY,
@@ -95,6 +407,24 @@ CREATE TABLE IF NOT EXISTS user_quizzes (
 
 CREATE INDEX IF NOT EXISTS idx_user_quizzes_date ON user_quizzes(user_id, quiz_date);
 
+-- 2.3.1. 하루 퀴즈 참여 횟수 카운터 (services/quiz_quota.py)
+-- 제한 확인과 증가를 한 번의 upsert로 처리하여 제출마다 user_quizzes를 COUNT하지 않음
+CREATE TABLE IF NOT EXISTS user_quiz_quota (
+    user_id TEXT NOT NULL,
+    quiz_date DATE NOT NULL,
+    used INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (user_id, quiz_date)
+);
+
+-- 카운터 도입 전 최근 참여 기록 이관 (이미 있는 행은 유지)
+INSERT INTO user_quiz_quota (user_id, quiz_date, used)
+SELECT user_id, quiz_date, COUNT(*)
+FROM user_quizzes
+WHERE quiz_date >= CURRENT_DATE - 1
+GROUP BY user_id, quiz_date
+ON CONFLICT DO NOTHING;
+
 ---------------------------------------------------------
 -- 3. 기타 일정 및 순위
 ---------------------------------------------------------
@@ -102,14 +432,22 @@ CREATE INDEX IF NOT EXISTS idx_user_quizzes_date ON user_quizzes(user_id, quiz_d
 CREATE TABLE IF NOT EXISTS kbo_schedule (
     game_id VARCHAR(20) PRIMARY KEY,
     game_date DATE NOT NULL,
+    game_time VARCHAR(5),              -- 경기 시작 시각 (HH:MM, KST)
     home_team VARCHAR(20) NOT NULL,
     away_team VARCHAR(20) NOT NULL,
     game_status VARCHAR(50),
     is_postseason BOOLEAN DEFAULT FALSE,
     sort_text VARCHAR(20) DEFAULT '',
-    created_at TIMESTAMP DEFAULT NOW()
+    row_digest VARCHAR(32),            -- 크롤러 변경 감지용 내용 해시
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW() -- 마지막 삽입/내용 변경 시각 (피처 재구축 판단, 결과 캐시 키)
 );
 
+-- 기존 DB 마이그레이션 (크롤러는 런타임에 DDL을 실행하지 않음)
+ALTER TABLE kbo_schedule ADD COLUMN IF NOT EXISTS game_time VARCHAR(5);
+ALTER TABLE kbo_schedule ADD COLUMN IF NOT EXISTS row_digest VARCHAR(32);
+ALTER TABLE kbo_schedule ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT NOW();
+
 CREATE TABLE IF NOT EXISTS team_rank (
     team_name VARCHAR(20) PRIMARY KEY,
     rank INTEGER NOT NULL,
@@ -124,6 +462,80 @@ CREATE TABLE IF NOT EXISTS team_rank (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+-- 3.1. 일별 시즌 확률 스냅샷 (daily_pipeline.py에서 하루 1회 저장)
+-- rank_dist[i] = (i+1)위로 시즌을 마칠 확률
+CREATE TABLE IF NOT EXISTS season_odds_history (
+    snapshot_date DATE NOT NULL,
+    model_version VARCHAR(40) NOT NULL,
+    team_name VARCHAR(20) NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    expected_wins FLOAT NOT NULL,
+    expected_rank FLOAT NOT NULL,
+    playoff_prob FLOAT NOT NULL,
+    first_prob FLOAT NOT NULL,
+    rank_dist FLOAT[] NOT NULL,
+    n_sims INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (snapshot_date, model_version, team_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_season_odds_team_date ON season_odds_history(team_name, snapshot_date);
+
+-- 3.2. 과거 데이터 시딩 체크포인트 (stack_service/seed_crawler.py)
+-- 수집 완료된 (연도, 월) 페이지를 기록하여 중단 후 재실행 시 이어서 수집
+CREATE TABLE IF NOT EXISTS seed_crawl_checkpoints (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    game_count INTEGER NOT NULL DEFAULT 0,
+    completed_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (year, month)
+);
+
+-- 3.3. 크롤러 원본 페이지 아카이브 (services/page_archive.py)
+-- 수집한 Daum 월별 페이지를 gzip 압축 + 내용 해시(sha256) 기준으로 한 번만 저장하고,
+-- (월, 수집 시각) 인덱스로 파서가 바뀌어도 재수집 없이 재적재할 수 있도록 보관
+CREATE TABLE IF NOT EXISTS crawler_page_blobs (
+    sha256 CHAR(64) PRIMARY KEY,
+    body BYTEA NOT NULL,                 -- gzip 압축된 HTML 본문
+    raw_size INTEGER NOT NULL,           -- 압축 전 크기 (bytes)
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS crawler_page_archive (
+    page_month DATE NOT NULL,            -- 페이지가 담고 있는 월 (1일)
+    fetched_at TIMESTAMP NOT NULL,
+    sha256 CHAR(64) NOT NULL REFERENCES crawler_page_blobs(sha256),
+    PRIMARY KEY (page_month, fetched_at)
+);
+
+-- 3.4. 경기별 박스스코어 (services/box_score_service.py)
+-- Daum 경기 상세 페이지(/match/<game_id>)의 이닝별 득점과 R/H/E/B 합계
+-- status = 'unavailable'이면 상세 페이지에서 스코어보드를 찾지 못한 경기 (증분 수집 시 다시 요청하지 않음)
+CREATE TABLE IF NOT EXISTS kbo_box_scores (
+    game_id VARCHAR(20) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'ok',
+    innings SMALLINT,                    -- 진행된 이닝 수 (연장 포함)
+    home_runs SMALLINT,
+    home_hits SMALLINT,
+    home_errors SMALLINT,
+    home_walks SMALLINT,
+    away_runs SMALLINT,
+    away_hits SMALLINT,
+    away_errors SMALLINT,
+    away_walks SMALLINT,
+    fetched_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS kbo_line_scores (
+    game_id VARCHAR(20) NOT NULL,
+    team_side VARCHAR(4) NOT NULL,       -- 'home' / 'away'
+    inning SMALLINT NOT NULL,
+    runs SMALLINT,                       -- 공격하지 않은 이닝(X, -)은 NULL
+    PRIMARY KEY (game_id, team_side, inning)
+);
+
 ---------------------------------------------------------
 -- 4. 삼성 라이온즈 역사 테이블
 ---------------------------------------------------------
@@ -159,4 +571,9 @@ CREATE TABLE IF NOT EXISTS samfan_quizzes (
 -- 6. 인덱스 설정 (조회 속도 향상)
 ---------------------------------------------------------
 CREATE INDEX IF NOT EXISTS idx_game_date ON kbo_games(game_date);
-CREATE INDEX IF NOT EXISTS idx_user_weekly_score ON user_profiles(weekly_score DESC);
+-- 랭킹 키셋 페이지네이션: (점수, user_id) 순서로 역방향 탐색 (services/ranking_service.py get_ranking_page)
+-- user_profiles.weekly_score는 더 이상 갱신되지 않으므로 주간 순위는 score_weekly_totals 인덱스를 사용
+DROP INDEX IF EXISTS idx_user_weekly_score;
+CREATE INDEX IF NOT EXISTS idx_user_prediction_rank ON user_profiles(prediction_score, user_id);
+CREATE INDEX IF NOT EXISTS idx_user_quiz_rank ON user_profiles(quiz_score, user_id);
+CREATE INDEX IF NOT EXISTS idx_weekly_totals_rank ON score_weekly_totals(week_start, weekly_score, user_id);
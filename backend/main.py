@@ -1,8 +1,13 @@
 # backend/main.py
+from datetime import date
+from typing import List, Optional
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 from sqlalchemy import text
 
+import config as config_module
 from config import ADMIN_MODE, CURRENT_DATE, SEASON_MODE, engine
 from services import (
     crawler_service,
@@ -11,9 +16,15 @@ from services import (
     simulation_service,
     ranking_service,
     performance_service,
-    admin_service
+    admin_service,
+    box_score_service
 )
-from supabase_config import upsert_user_score
+from services.score_outbox import ScoreOutbox
+from services.leaderboard_index import LeaderboardIndex
+from services.quiz_pool import QuizPool, SeenQuizzes, QUIZ_DIFFICULTIES
+from services.quiz_quota import QuizQuota, DAILY_QUIZ_LIMIT
+from services.user_prediction_service import UserPredictionService
+from services.crowd_picks import CrowdPicks
 
 app = FastAPI(title="Laions V2 API", version="2.0.0")
 
@@ -33,6 +44,23 @@ app.include_router(simulation_service.router)
 app.include_router(ranking_service.router)
 app.include_router(performance_service.router)
 app.include_router(admin_service.router)
+app.include_router(box_score_service.router)
+
+
+# 점수 아웃박스 디스패처 (퀴즈 점수 등을 트랜잭션 밖에서 Supabase에 반영)
+# 리더보드 인덱스는 반영 완료된 점수 이벤트로 갱신
+@app.on_event("startup")
+def start_score_dispatcher():
+    LeaderboardIndex.start()
+    ScoreOutbox.add_listener(LeaderboardIndex.apply_events)
+    ScoreOutbox.start_dispatcher()
+
+
+@app.on_event("shutdown")
+def stop_score_dispatcher():
+    ScoreOutbox.stop_dispatcher()
+    LeaderboardIndex.stop()
+
 
 # 3. 시스템 상태 체크 API
 @app.get("/api/health")
@@ -45,33 +73,31 @@ def health_check():
         "db_connected": True
     }
 
-# 4. 퀴즈 API (quizmaker.py로 미리 생성된 퀴즈를 DB에서 조회)
+# 4. 퀴즈 API (quizmaker.py로 미리 생성된 퀴즈를 인메모리 퀴즈 풀에서 출제)
+# 점수 정책
+QUIZ_SCORE_POLICY = {"easy": 5, "medium": 10, "hard": 20}
+
+
+def _grade_quiz(quiz: dict, answer: str) -> tuple:
+    """정답 여부와 획득 점수를 반환합니다."""
+    is_correct = (answer.strip().lower() == quiz["correct_answer"].strip().lower())
+    return is_correct, (QUIZ_SCORE_POLICY.get(quiz["difficulty"], 5) if is_correct else 0)
+
+
 @app.get("/api/quiz")
-def get_quiz(difficulty: str = None):
-    """DB에서 랜덤으로 퀴즈 1개를 반환합니다. (difficulty: easy / medium / hard, 생략 시 전체)"""
+def get_quiz(difficulty: str = None, user_id: str = None):
+    """
+    퀴즈 풀에서 랜덤으로 퀴즈 1개를 반환합니다. (difficulty: easy / medium / hard, 생략 시 전체)
+    user_id를 주면 그 유저가 아직 풀지 않은 퀴즈를 우선 출제합니다.
+    """
     try:
-        with engine.connect() as conn:
-            if difficulty and difficulty.lower() in ("easy", "medium", "hard"):
-                result = conn.execute(
-                    text("SELECT id, question, options, difficulty, source_hint FROM samfan_quizzes WHERE difficulty = :diff ORDER BY RANDOM() LIMIT 1"),
-                    {"diff": difficulty.lower()}
-                ).fetchone()
-            else:
-                result = conn.execute(
-                    text("SELECT id, question, options, difficulty, source_hint FROM samfan_quizzes ORDER BY RANDOM() LIMIT 1")
-                ).fetchone()
-            if not result:
-                raise HTTPException(status_code=404, detail="등록된 퀴즈가 없습니다.")
-            return {
-                "status": "ok",
-                "quiz": {
-                    "id": result[0],
-                    "question": result[1],
-                    "options": result[2],
-                    "difficulty": result[3],
-                    "source_hint": result[4]
-                }
-            }
+        diff = difficulty.lower() if difficulty and difficulty.lower() in QUIZ_DIFFICULTIES else None
+        quiz = QuizPool.pick(diff, user_id=user_id)
+        if not quiz:
+            raise HTTPException(status_code=404, detail="등록된 퀴즈가 없습니다.")
+        return {"status": "ok", "quiz": QuizPool.public(quiz)}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"퀴즈 조회 실패: {str(e)}")
 
@@ -80,34 +106,21 @@ def submit_quiz(user_id: str, quiz_id: int, answer: str, display_name: str = Non
     """사용자의 퀴즈 정답을 확인하고 점수를 부여합니다. (하루 최대 5회 제한)"""
     try:
         with engine.begin() as conn:
-            # 하루 퀴즈 제한 확인 (user_quizzes 테이블)
-            today_str = str(CURRENT_DATE)
-            daily_count = conn.execute(
-                text("SELECT COUNT(*) FROM user_quizzes WHERE user_id = :uid AND quiz_date = :today"),
-                {"uid": user_id, "today": today_str}
-            ).scalar() or 0
+            quiz = QuizPool.get(quiz_id)
+            if not quiz:
+                raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
             
-            DAILY_QUIZ_LIMIT = 5
-            if daily_count >= DAILY_QUIZ_LIMIT:
+            # 하루 퀴즈 제한 확인과 사용 횟수 증가를 한 문장으로 처리 (user_quiz_quota 테이블)
+            today_str = str(CURRENT_DATE)
+            daily_count = QuizQuota.consume(conn, user_id, today_str)
+            if daily_count is None:
                 raise HTTPException(
                     status_code=429,
-                    detail=f"오늘의 퀴즈는 최대 {DAILY_QUIZ_LIMIT}회까지 참여 가능합니다. (현재 {daily_count}회)"
+                    detail=f"오늘의 퀴즈는 최대 {DAILY_QUIZ_LIMIT}회까지 참여 가능합니다. (현재 {QuizQuota.used(conn, user_id, today_str)}회)"
                 )
             
-            result = conn.execute(
-                text("SELECT correct_answer, difficulty FROM samfan_quizzes WHERE id = :id"),
-                {"id": quiz_id}
-            ).fetchone()
-            if not result:
-                raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
-            
-            correct_answer = result[0]
-            difficulty = result[1]
-            is_correct = (answer.strip().lower() == correct_answer.strip().lower())
-            
-            # 점수 정책
-            score_policy = {"easy": 5, "medium": 10, "hard": 20}
-            earned_points = score_policy.get(difficulty, 5) if is_correct else 0
+            correct_answer = quiz["correct_answer"]
+            is_correct, earned_points = _grade_quiz(quiz, answer)
             
             # user_quizzes에 기록 (정답/오답 관계없이 참여 횟수로 기록)
             conn.execute(
@@ -124,24 +137,149 @@ def submit_quiz(user_id: str, quiz_id: int, answer: str, display_name: str = Non
                 }
             )
             
-            # Supabase에 점수 반영 (Firestore 대체)
+            # 점수 이벤트는 같은 트랜잭션에서 아웃박스에 기록 (Supabase 반영은 디스패처가 수행)
             if is_correct and earned_points > 0:
-                nickname = display_name or user_id[:8]
-                upsert_user_score(
-                    user_id=user_id,
-                    nickname=nickname,
-                    score_earned=earned_points,
-                    score_type="quiz_score"
-                )
+                ScoreOutbox.enqueue(conn, [{
+                    "user_id": user_id,
+                    "nickname": display_name or user_id[:8],
+                    "score_type": "quiz_score",
+                    "delta": earned_points,
+                }], source="quiz")
             
-            return {
+            response = {
                 "status": "ok",
                 "is_correct": is_correct,
                 "correct_answer": correct_answer,
                 "earned_points": earned_points,
-                "daily_count": daily_count + 1,
+                "daily_count": daily_count,
                 "daily_limit": DAILY_QUIZ_LIMIT
             }
+        # 커밋 후 푼 퀴즈 비트맵 갱신, 디스패처 깨우기
+        SeenQuizzes.mark(user_id, [quiz_id])
+        if earned_points > 0:
+            ScoreOutbox.notify()
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"정답 제출 실패: {str(e)}")
+
+
+@app.get("/api/quiz/batch")
+def get_quiz_batch(n: int = DAILY_QUIZ_LIMIT, difficulty: str = None, user_id: str = None):
+    """
+    오늘 풀 퀴즈 세트를 한 번에 반환합니다. (서로 다른 퀴즈 최대 n개, user_id를 주면 안 푼 퀴즈 우선)
+    user_id를 주면 오늘 남은 참여 횟수만큼만 반환합니다.
+    """
+    try:
+        diff = difficulty.lower() if difficulty and difficulty.lower() in QUIZ_DIFFICULTIES else None
+        n = max(min(n, DAILY_QUIZ_LIMIT), 0)
+        remaining = None
+        if user_id:
+            with engine.connect() as conn:
+                remaining = max(DAILY_QUIZ_LIMIT - QuizQuota.used(conn, user_id, str(CURRENT_DATE)), 0)
+            n = min(n, remaining)
+        quizzes = QuizPool.pick_many(n, diff, user_id=user_id)
+        if not quizzes and n > 0:
+            raise HTTPException(status_code=404, detail="등록된 퀴즈가 없습니다.")
+        return {
+            "status": "ok",
+            "quizzes": [QuizPool.public(q) for q in quizzes],
+            "remaining": remaining,
+            "daily_limit": DAILY_QUIZ_LIMIT
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"퀴즈 조회 실패: {str(e)}")
+
+
+class QuizAnswer(BaseModel):
+    quiz_id: int
+    answer: str
+
+
+class QuizBatchSubmit(BaseModel):
+    user_id: str
+    display_name: Optional[str] = None
+    answers: List[QuizAnswer]
+
+
+@app.post("/api/quiz/submit/batch")
+def submit_quiz_batch(payload: QuizBatchSubmit):
+    """
+    여러 퀴즈 답안을 한 번에 채점합니다. (하나의 트랜잭션)
+    - 참여 횟수는 답안 수만큼 한 번에 증가 (남은 횟수를 넘으면 전체 거절)
+    - user_quizzes는 한 번의 다중 행 INSERT, 점수는 합계로 아웃박스 이벤트 1건
+    """
+    answers = payload.answers
+    user_id = payload.user_id
+    if not answers:
+        raise HTTPException(status_code=400, detail="제출할 답안이 없습니다.")
+    if len(answers) > DAILY_QUIZ_LIMIT:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {DAILY_QUIZ_LIMIT}개까지 제출할 수 있습니다.")
+    if len({a.quiz_id for a in answers}) != len(answers):
+        raise HTTPException(status_code=400, detail="같은 퀴즈를 중복 제출할 수 없습니다.")
+
+    try:
+        results = []
+        for a in answers:
+            quiz = QuizPool.get(a.quiz_id)
+            if not quiz:
+                raise HTTPException(status_code=404, detail=f"퀴즈를 찾을 수 없습니다. (id: {a.quiz_id})")
+            is_correct, earned_points = _grade_quiz(quiz, a.answer)
+            results.append({
+                "quiz_id": a.quiz_id,
+                "is_correct": is_correct,
+                "correct_answer": quiz["correct_answer"],
+                "earned_points": earned_points
+            })
+        total_points = sum(r["earned_points"] for r in results)
+
+        with engine.begin() as conn:
+            today_str = str(CURRENT_DATE)
+            daily_count = QuizQuota.consume(conn, user_id, today_str, count=len(results))
+            if daily_count is None:
+                used = QuizQuota.used(conn, user_id, today_str)
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"오늘의 퀴즈는 최대 {DAILY_QUIZ_LIMIT}회까지 참여 가능합니다. (현재 {used}회, 남은 횟수 {max(DAILY_QUIZ_LIMIT - used, 0)}회)"
+                )
+
+            conn.execute(
+                text("""
+                    INSERT INTO user_quizzes (user_id, quiz_id, quiz_date, is_correct, score_earned)
+                    SELECT :uid, r.quiz_id, :today, r.is_correct, r.score_earned
+                    FROM unnest(CAST(:qids AS INTEGER[]), CAST(:correct AS BOOLEAN[]), CAST(:points AS INTEGER[]))
+                        AS r(quiz_id, is_correct, score_earned)
+                """),
+                {
+                    "uid": user_id,
+                    "today": today_str,
+                    "qids": [r["quiz_id"] for r in results],
+                    "correct": [r["is_correct"] for r in results],
+                    "points": [r["earned_points"] for r in results]
+                }
+            )
+
+            if total_points > 0:
+                ScoreOutbox.enqueue(conn, [{
+                    "user_id": user_id,
+                    "nickname": payload.display_name or user_id[:8],
+                    "score_type": "quiz_score",
+                    "delta": total_points,
+                }], source="quiz")
+
+        SeenQuizzes.mark(user_id, [r["quiz_id"] for r in results])
+        if total_points > 0:
+            ScoreOutbox.notify()
+        return {
+            "status": "ok",
+            "results": results,
+            "earned_points": total_points,
+            "daily_count": daily_count,
+            "daily_limit": DAILY_QUIZ_LIMIT
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -155,6 +293,10 @@ def get_today_predictions():
     try:
         from services.model_service import ModelService
         preds = ModelService.predict_all_games()
+        # 경기별 팬 예측 집계를 AI 예측 옆에 함께 제공 (짧은 캐시)
+        crowd = CrowdPicks.for_date(CURRENT_DATE)
+        for p in preds:
+            p["crowd"] = crowd.get(p["game_id"])
         return {"status": "ok", "predictions": preds}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"예측 조회 실패: {str(e)}")
@@ -165,14 +307,7 @@ def submit_user_prediction(user_id: str, game_id: str, predicted_winner: str):
     try:
         with engine.begin() as conn:
             # user_profiles 테이블에 사용자 정보가 없으면 자동 생성
-            conn.execute(
-                text("""
-                    INSERT INTO user_profiles (user_id, nickname)
-                    VALUES (:uid, :nick)
-                    ON CONFLICT (user_id) DO NOTHING
-                """),
-                {"uid": user_id, "nick": user_id[:8]}
-            )
+            UserPredictionService.ensure_profile(conn, user_id)
             # user_predictions 테이블에 예측 저장 (중복 시 업데이트)
             conn.execute(
                 text("""
@@ -183,18 +318,72 @@ def submit_user_prediction(user_id: str, game_id: str, predicted_winner: str):
                 """),
                 {"uid": user_id, "gid": game_id, "winner": predicted_winner, "winner2": predicted_winner}
             )
+        UserPredictionService.remember_user(user_id)
         return {"status": "ok", "message": "예측이 저장되었습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"예측 저장 실패: {str(e)}")
 
 
+@app.get("/api/predict/crowd")
+def get_crowd_picks(game_date: date = None):
+    """경기별 팬 예측 비율과 AI 예측을 반환합니다. (game_date 생략 시 오늘)"""
+    try:
+        crowd = CrowdPicks.for_date(game_date or CURRENT_DATE)
+        return {"status": "ok", "game_date": str(game_date or CURRENT_DATE), "games": list(crowd.values())}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"팬 예측 조회 실패: {str(e)}")
+
+
+@app.get("/api/predict/crowd/accuracy")
+def get_crowd_accuracy(start_date: date = None, end_date: date = None):
+    """정산된 경기 기준 팬 다수 선택 vs AI 적중률을 반환합니다."""
+    try:
+        return {"status": "ok", "accuracy": CrowdPicks.accuracy(start_date, end_date)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"적중률 조회 실패: {str(e)}")
+
+
+class SlatePick(BaseModel):
+    game_id: str
+    predicted_winner: str
+
+
+class SlateSubmit(BaseModel):
+    user_id: str
+    game_date: Optional[date] = None
+    display_name: Optional[str] = None
+    picks: List[SlatePick]
+
+
+@app.post("/api/predict/slate")
+def submit_prediction_slate(payload: SlateSubmit):
+    """
+    하루 경기 전체의 예측을 한 번에 저장합니다. (game_date 생략 시 오늘)
+    kbo_schedule로 검증하여 이미 시작한 경기나 잘못된 팀이 있으면 전체를 거절합니다.
+    """
+    game_date = payload.game_date or config_module.CURRENT_DATE
+    try:
+        with engine.begin() as conn:
+            saved = UserPredictionService.submit_slate(
+                conn, payload.user_id, game_date,
+                [p.model_dump() for p in payload.picks],
+                nickname=payload.display_name
+            )
+        UserPredictionService.remember_user(payload.user_id)
+        return {"status": "ok", "game_date": str(game_date), "saved": saved}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"예측 저장 실패: {str(e)}")
+
+
 # 6. 시뮬레이션 리포트 API
 @app.get("/api/performance/simulation-report")
 def get_simulation_report():
     """시뮬레이션 상세 리포트를 반환합니다."""
     try:
         from services.simulation_service import SimulationService
-        projection = SimulationService.get_season_projection()
+        projection = SimulationService.get_cached_season_projection()
         if isinstance(projection, list):
             return {
                 "status": "ok",
@@ -20,6 +20,7 @@ import pandas as pd
 
 from config import engine, CURRENT_DATE, TEAMS, FEATURE_CONFIG
 import config as config_module
+from services.result_cache import ResultCache
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -74,6 +75,9 @@ class AdminService:
                 config_module.ADMIN_MODE = True
                 print(f"🔑 [Admin] 관리자 모드가 활성화되었습니다.")
             
+            # 기준일이 바뀌었으므로 캐싱된 시뮬레이션 결과 폐기
+            ResultCache.invalidate()
+            
             print(f"📅 [Admin] 날짜가 {new_date}(으)로 변경되었습니다.")
             return {
                 "status": "ok",
@@ -92,6 +96,7 @@ class AdminService:
         """
         관리자 모드 파이프라인을 실행합니다.
         하나의 트랜잭션으로 모든 작업을 수행한 후 ROLLBACK하여 DB 변경을 취소합니다.
+        (오프라인 재생은 서버 설정 CRAWLER_REPLAY_DIR로만 지정)
         """
         previous_config = None
         try:
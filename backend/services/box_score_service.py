@@ -0,0 +1,282 @@
+# backend/services/box_score_service.py
+"""
+박스스코어 수집 서비스
+
+일정 페이지에서 얻은 경기별 /match/<game_id> 상세 페이지를 가져와
+이닝별 득점(kbo_line_scores)과 R/H/E/B 합계(kbo_box_scores)를 저장합니다.
+
+- kbo_games에 있지만 kbo_box_scores에 없는 경기만 수집합니다. (증분)
+- 상세 페이지 요청은 동시 요청 수를 제한한 스레드 풀에서, 파싱은 경기 수가 많으면 프로세스 풀에서 수행합니다.
+- 한 번의 수집분을 하나의 트랜잭션으로 일괄 저장합니다.
+- 테이블은 init_db.sql 3.4에서 생성합니다.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import APIRouter, HTTPException
+from lxml import html as lxml_html
+from sqlalchemy import text
+
+from config import engine, TEAMS
+from services.crawler_service import CrawlerService
+
+router = APIRouter(prefix="/api/boxscore", tags=["boxscore"])
+
+DAUM_MATCH_URL = "https://sports.daum.net/match/{game_id}"
+BOX_SCORE_FETCH_WORKERS = 4       # 동시 상세 페이지 요청 수
+BOX_SCORE_BATCH_LIMIT = 200       # 1회 수집 최대 경기 수
+PARSE_POOL_MIN_PAGES = 20         # 이 수 이상일 때만 프로세스 풀로 파싱 (적으면 프로세스 생성 비용이 더 큼)
+TOTAL_COLUMNS = ("R", "H", "E", "B")
+
+
+def _to_int(value: str):
+    value = value.strip()
+    return int(value) if value.isdigit() else None
+
+
+def parse_box_score(html: str):
+    """
+    경기 상세 페이지에서 스코어보드(이닝 번호 + R/H/E 헤더를 가진 표)를 찾아 팀별 행을 반환합니다.
+    (프로세스 풀에서 실행되므로 모듈 수준 함수로 둡니다.)
+
+    Returns:
+        list[dict] | None: [{"team", "innings": [득점 | None], "R", "H", "E", "B"}] (표 순서대로, 보통 원정 → 홈)
+    """
+    try:
+        doc = lxml_html.fromstring(html)
+    except Exception:
+        return None
+
+    for table in doc.iter("table"):
+        header = None
+        team_rows = []
+        for tr in table.iter("tr"):
+            cells = [cell.text_content().strip() for cell in tr if cell.tag in ("th", "td")]
+            if header is None:
+                if "1" in cells and "R" in cells and "H" in cells:
+                    header = cells
+                continue
+            if len(cells) != len(header):
+                continue
+            team = next((t for t in TEAMS if t in cells[0]), None)
+            if team:
+                team_rows.append((team, cells))
+
+        if not header or len(team_rows) < 2:
+            continue
+
+        inning_cols = [i for i, name in enumerate(header) if name.isdigit()]
+        total_cols = {name: header.index(name) for name in TOTAL_COLUMNS if name in header}
+        parsed = []
+        for team, cells in team_rows[:2]:
+            row = {"team": team, "innings": [_to_int(cells[i]) for i in inning_cols]}
+            for name in TOTAL_COLUMNS:
+                row[name] = _to_int(cells[total_cols[name]]) if name in total_cols else None
+            parsed.append(row)
+        return parsed
+    return None
+
+
+class BoxScoreService:
+    @classmethod
+    def get_pending_games(cls, limit: int = BOX_SCORE_BATCH_LIMIT, retry_unavailable: bool = False) -> list:
+        """박스스코어가 아직 없는 종료 경기를 최신순으로 조회합니다."""
+        with engine.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT g.game_id, g.home_team, g.away_team
+                FROM kbo_games g
+                LEFT JOIN kbo_box_scores b ON b.game_id = g.game_id
+                WHERE b.game_id IS NULL
+                   OR (:retry_unavailable AND b.status = 'unavailable')
+                ORDER BY g.game_date DESC, g.game_id DESC
+                LIMIT :limit
+            """), {"limit": limit, "retry_unavailable": retry_unavailable}).fetchall()
+        return [dict(row._mapping) for row in rows]
+
+    @staticmethod
+    def _fetch_match_html(game_id: str):
+        """경기 상세 페이지 HTML을 가져옵니다. 실패 시 None (다음 수집에서 다시 시도)"""
+        try:
+            resp = CrawlerService._get_session().get(DAUM_MATCH_URL.format(game_id=game_id), timeout=15)
+            resp.raise_for_status()
+            return resp.text
+        except Exception as e:
+            print(f"⚠️ [BoxScore] 상세 페이지 요청 실패 ({game_id}): {e}")
+            return None
+
+    @staticmethod
+    def _to_rows(game: dict, parsed) -> tuple:
+        """파싱 결과를 (kbo_box_scores 행, kbo_line_scores 행 리스트)로 변환합니다."""
+        sides = {}
+        for row in parsed or []:
+            if row["team"] == game["home_team"]:
+                sides["home"] = row
+            elif row["team"] == game["away_team"]:
+                sides["away"] = row
+
+        box = {"game_id": game["game_id"], "status": "unavailable", "innings": None}
+        for side in ("home", "away"):
+            for name, column in zip(TOTAL_COLUMNS, ("runs", "hits", "errors", "walks")):
+                box[f"{side}_{column}"] = None
+
+        if len(sides) < 2:
+            return box, []
+
+        lines = []
+        for side, row in sides.items():
+            box.update({
+                f"{side}_runs": row["R"],
+                f"{side}_hits": row["H"],
+                f"{side}_errors": row["E"],
+                f"{side}_walks": row["B"],
+            })
+            for inning, runs in enumerate(row["innings"], 1):
+                lines.append({"gid": game["game_id"], "side": side, "inning": inning, "runs": runs})
+
+        # 양 팀 모두 기록이 없는 뒤쪽 이닝(정규 9회 이후 빈 칸)은 진행 이닝에서 제외
+        played = [l["inning"] for l in lines if l["runs"] is not None]
+        box["innings"] = max(played) if played else None
+        box["status"] = "ok"
+        lines = [l for l in lines if box["innings"] and l["inning"] <= box["innings"]]
+        return box, lines
+
+    @classmethod
+    def _save(cls, boxes: list, lines: list):
+        """박스스코어와 이닝별 득점을 하나의 트랜잭션으로 저장합니다."""
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM kbo_line_scores WHERE game_id = ANY(:ids)"),
+                         {"ids": [b["game_id"] for b in boxes]})
+            conn.execute(text("""
+                INSERT INTO kbo_box_scores (
+                    game_id, status, innings,
+                    home_runs, home_hits, home_errors, home_walks,
+                    away_runs, away_hits, away_errors, away_walks
+                )
+                VALUES (
+                    :game_id, :status, :innings,
+                    :home_runs, :home_hits, :home_errors, :home_walks,
+                    :away_runs, :away_hits, :away_errors, :away_walks
+                )
+                ON CONFLICT (game_id) DO UPDATE SET
+                    status = EXCLUDED.status,
+                    innings = EXCLUDED.innings,
+                    home_runs = EXCLUDED.home_runs, home_hits = EXCLUDED.home_hits,
+                    home_errors = EXCLUDED.home_errors, home_walks = EXCLUDED.home_walks,
+                    away_runs = EXCLUDED.away_runs, away_hits = EXCLUDED.away_hits,
+                    away_errors = EXCLUDED.away_errors, away_walks = EXCLUDED.away_walks,
+                    fetched_at = NOW()
+            """), boxes)
+            if lines:
+                conn.execute(text("""
+                    INSERT INTO kbo_line_scores (game_id, team_side, inning, runs)
+                    VALUES (:gid, :side, :inning, :runs)
+                """), lines)
+
+    @classmethod
+    def ingest(
+        cls,
+        limit: int = BOX_SCORE_BATCH_LIMIT,
+        fetch_workers: int = BOX_SCORE_FETCH_WORKERS,
+        parse_workers: int = None,
+        retry_unavailable: bool = False,
+    ) -> dict:
+        """
+        박스스코어가 없는 경기의 상세 페이지를 수집하여 저장합니다.
+
+        Args:
+            limit: 1회 수집 최대 경기 수
+            fetch_workers: 동시 상세 페이지 요청 수
+            parse_workers: 파싱 프로세스 수 (기본값: CPU 코어 수)
+            retry_unavailable: True면 스코어보드를 찾지 못했던 경기도 다시 수집
+
+        Returns:
+            dict: {"requested", "ok", "unavailable", "failed"}
+        """
+        games = cls.get_pending_games(limit, retry_unavailable)
+        if not games:
+            return {"requested": 0, "ok": 0, "unavailable": 0, "failed": 0}
+
+        # 1. 상세 페이지 수집 (동시 요청 수 제한)
+        with ThreadPoolExecutor(max_workers=max(fetch_workers, 1)) as executor:
+            pages = list(executor.map(cls._fetch_match_html, [g["game_id"] for g in games]))
+        fetched = [(g, html) for g, html in zip(games, pages) if html is not None]
+
+        # 2. 파싱 (페이지가 많으면 프로세스 풀 사용)
+        htmls = [html for _, html in fetched]
+        if len(htmls) >= PARSE_POOL_MIN_PAGES:
+            with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+                parsed = list(executor.map(parse_box_score, htmls, chunksize=8))
+        else:
+            parsed = [parse_box_score(html) for html in htmls]
+
+        # 3. 일괄 저장
+        boxes, lines = [], []
+        for (game, _), result in zip(fetched, parsed):
+            box, game_lines = cls._to_rows(game, result)
+            boxes.append(box)
+            lines.extend(game_lines)
+        if boxes:
+            cls._save(boxes, lines)
+
+        ok = sum(1 for b in boxes if b["status"] == "ok")
+        summary = {
+            "requested": len(games),
+            "ok": ok,
+            "unavailable": len(boxes) - ok,
+            "failed": len(games) - len(fetched),
+        }
+        print(f"📦 [BoxScore] 수집 완료: {summary}")
+        return summary
+
+    @classmethod
+    def get_box_score(cls, game_id: str):
+        """경기의 박스스코어와 이닝별 득점을 조회합니다. 없으면 None."""
+        with engine.connect() as conn:
+            box = conn.execute(text("""
+                SELECT b.*, g.game_date, g.home_team, g.away_team
+                FROM kbo_box_scores b
+                JOIN kbo_games g ON g.game_id = b.game_id
+                WHERE b.game_id = :gid AND b.status = 'ok'
+            """), {"gid": game_id}).mappings().fetchone()
+            if not box:
+                return None
+            lines = conn.execute(text("""
+                SELECT team_side, inning, runs
+                FROM kbo_line_scores
+                WHERE game_id = :gid
+                ORDER BY inning
+            """), {"gid": game_id}).fetchall()
+
+        line_score = {"home": [], "away": []}
+        for row in lines:
+            line_score[row.team_side].append(row.runs)
+        result = {
+            "game_id": box["game_id"],
+            "game_date": str(box["game_date"]),
+            "innings": box["innings"],
+            "line_score": line_score,
+        }
+        for side in ("home", "away"):
+            result[side] = {
+                "team": box[f"{side}_team"],
+                "runs": box[f"{side}_runs"],
+                "hits": box[f"{side}_hits"],
+                "errors": box[f"{side}_errors"],
+                "walks": box[f"{side}_walks"],
+            }
+        return result
+
+
+# --- API Endpoints ---
+
+@router.get("/{game_id}")
+def api_get_box_score(game_id: str):
+    """경기의 박스스코어(이닝별 득점, R/H/E/B)를 반환합니다."""
+    box = BoxScoreService.get_box_score(game_id)
+    if not box:
+        raise HTTPException(status_code=404, detail="박스스코어가 없습니다.")
+    return {"status": "ok", "box_score": box}
+
+
+@router.post("/ingest")
+def api_ingest_box_scores(limit: int = 50):
+    """박스스코어가 없는 경기의 상세 페이지를 수집합니다."""
+    return {"status": "ok", "data": BoxScoreService.ingest(limit=limit)}
@@ -1,15 +1,29 @@
 # backend/services/crawler_service.py
+import calendar
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, date
 from sqlalchemy import text
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from config import engine, CURRENT_DATE, TEAMS
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
+from services.daum_page_cache import DaumPageCache
+from services.page_archive import PageArchive
+from services.page_sources import ArchivedPageSource
 
 router = APIRouter(prefix="/api/crawler", tags=["crawler"])
 
 DAUM_SPORTS_URL = "https://sports.daum.net/schedule/kbo"
 
+# 설정 시 Daum Sports 대신 이 디렉터리의 저장된 HTML 페이지를 사용 (오프라인 재생)
+CRAWLER_REPLAY_DIR = os.getenv("CRAWLER_REPLAY_DIR")
+
 # Daum Sports td_sort 값 → 포스트시즌 여부 매핑
 POSTSEASON_SORT_VALUES = {"와일드카드", "준플레이오프", "플레이오프", "한국시리즈"}
 
@@ -18,27 +32,173 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+# HTTP 연결 풀 크기 (seed_crawler 등 동시 수집 worker 수보다 크게 설정)
+HTTP_POOL_MAXSIZE = 16
+
+# 지난 달 페이지를 '확정(불변)'으로 간주하기까지의 유예 기간 (기록 정정 반영용)
+CLOSED_MONTH_GRACE_DAYS = 3
+
+# 일일 크롤링 구간: (오늘 - CRAWL_DAYS_BACK) ~ (오늘 + CRAWL_DAYS_AHEAD)
+CRAWL_DAYS_BACK = 1
+CRAWL_DAYS_AHEAD = 7
+
+# multi-row UPSERT 한 문장당 최대 행 수
+UPSERT_CHUNK_SIZE = 500
+
+KBO_GAMES_COLUMNS = ["game_id", "game_date", "home_team", "away_team", "home_score", "away_score", "winning_team", "is_postseason", "sort_text"]
+KBO_SCHEDULE_COLUMNS = ["game_id", "game_date", "game_time", "home_team", "away_team", "game_status", "is_postseason", "sort_text"]
+
+# 변경 감지(row_digest) 대상 컬럼 = UPSERT 시 갱신되는 컬럼
+KBO_GAMES_DIGEST_COLUMNS = ["home_score", "away_score", "winning_team", "sort_text"]
+KBO_SCHEDULE_DIGEST_COLUMNS = ["game_time", "game_status", "sort_text"]
+
 
 class CrawlerService:
+    _default_source = None
+    _session = None
+    _session_lock = threading.Lock()
+    _page_cache = DaumPageCache()
+
+    # 본문 해시 → 파싱 결과 (같은 페이지를 반복해서 파싱하지 않도록 프로세스 내 보관)
+    _parsed_games = {}
+    _parsed_games_lock = threading.Lock()
+    _PARSED_GAMES_MAX = 64
+
+    @classmethod
+    def _get_session(cls):
+        """keep-alive 연결을 재사용하는 공용 requests.Session을 반환합니다."""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update(HEADERS)
+                    cls._session = session
+        return cls._session
+
     @staticmethod
-    def _fetch_from_daum(target_date: date):
+    def _is_closed_month(target_date: date, fetched_at: str) -> bool:
         """
-        Daum Sports KBO 일정 페이지를 스크래핑합니다.
-        ?date=YYYYMMDD 파라미터로 특정 날짜 기준 데이터를 가져옵니다.
-        해당 월의 전체 일정이 포함되어 응답됩니다.
+        target_date가 속한 월이 (실제 날짜 기준) 끝났고, 캐시가 월 종료 + 유예 기간 이후에
+        받아진 것이라면 더 이상 바뀌지 않는 페이지로 간주합니다.
+        """
+        last_day = calendar.monthrange(target_date.year, target_date.month)[1]
+        closed_at = date(target_date.year, target_date.month, last_day) + timedelta(days=CLOSED_MONTH_GRACE_DAYS)
+        try:
+            fetched_date = datetime.fromisoformat(fetched_at).date()
+        except (TypeError, ValueError):
+            return False
+        return date.today() > closed_at and fetched_date > closed_at
+
+    @classmethod
+    def _get_default_source(cls):
+        """CRAWLER_REPLAY_DIR이 설정되어 있으면 해당 디렉터리를 기본 페이지 소스로 사용합니다."""
+        if cls._default_source is None and CRAWLER_REPLAY_DIR:
+            cls._default_source = ArchivedPageSource(CRAWLER_REPLAY_DIR)
+            print(f"📂 [Replay] 오프라인 모드: {CRAWLER_REPLAY_DIR}")
+        return cls._default_source
+
+    @classmethod
+    def _fetch_page_html(cls, target_date: date, source=None):
         """
+        Daum Sports KBO 일정 페이지 HTML을 가져옵니다.
+        - source(예: ArchivedPageSource)가 있으면 네트워크 대신 해당 소스에서 읽습니다.
+        - 확정된 지난 달 페이지는 네트워크 요청 없이 로컬 캐시를 사용합니다.
+        - 그 외에는 ETag / Last-Modified 조건부 요청으로 재검증합니다.
+        - 새로 받은 본문(200)은 PageArchive에 보관합니다.
+
+        Returns:
+            tuple: (html, digest) 또는 실패 시 (None, None)
+        """
+        source = source or cls._get_default_source()
+        if source is not None:
+            return source.fetch(target_date)
+
         url = DAUM_SPORTS_URL
-        params = {"date": target_date.strftime("%Y%m%d")}
+        # 페이지는 월 단위이므로 항상 그 달 1일로 요청 (매일 실행해도 같은 캐시 키/조건부 요청을 재사용)
+        date_param = target_date.replace(day=1).strftime("%Y%m%d")
+        key = cls._page_cache.make_key(url, date_param)
+        meta = cls._page_cache.load_meta(key)
+
+        if meta and cls._is_closed_month(target_date, meta.get("fetched_at")):
+            body = cls._page_cache.load_body(key)
+            if body is not None:
+                print(f"💾 Daum Sports 캐시 사용 (확정된 월, 기준일: {target_date})")
+                return body, meta["digest"]
+
+        cond_headers = {}
+        if meta:
+            if meta.get("etag"):
+                cond_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                cond_headers["If-Modified-Since"] = meta["last_modified"]
+
         try:
-            resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+            resp = cls._get_session().get(url, params={"date": date_param}, headers=cond_headers, timeout=15)
+            if resp.status_code == 304 and meta:
+                body = cls._page_cache.load_body(key)
+                if body is not None:
+                    cls._page_cache.touch(key, meta)
+                    print(f"💾 Daum Sports 변경 없음 (304, 기준일: {target_date})")
+                    return body, meta["digest"]
+                # 본문 캐시가 손상된 경우 조건 없이 다시 요청
+                resp = cls._get_session().get(url, params={"date": date_param}, timeout=15)
+
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "lxml")
+            body = resp.text
+            meta = cls._page_cache.save(
+                key, url, date_param, body,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
             print(f"📡 Daum Sports 데이터 수집 성공 (기준일: {target_date})")
-            return soup
+            PageArchive.store(target_date, body, meta["digest"])
+            return body, meta["digest"]
         except Exception as e:
             print(f"⚠️ Daum Sports 스크래핑 오류 ({target_date}): {e}")
+            return None, None
+
+    @classmethod
+    def _fetch_from_daum(cls, target_date: date, source=None):
+        """
+        Daum Sports KBO 일정 페이지를 스크래핑합니다.
+        ?date=YYYYMMDD 파라미터로 특정 날짜 기준 데이터를 가져옵니다.
+        해당 월의 전체 일정이 포함되어 응답됩니다.
+        """
+        html, _ = cls._fetch_page_html(target_date, source)
+        if html is None:
+            return None
+        return BeautifulSoup(html, "lxml")
+
+    @classmethod
+    def fetch_games(cls, target_date: date, source=None):
+        """
+        target_date가 속한 월의 경기 목록을 가져와 파싱합니다.
+        본문이 이전과 같으면(캐시/304) 이전 파싱 결과를 재사용합니다.
+
+        Args:
+            target_date: 기준일 (해당 월 페이지를 가져옴)
+            source: 페이지 소스 (None이면 Daum Sports 또는 CRAWLER_REPLAY_DIR)
+
+        Returns:
+            list[dict] | None: 파싱된 경기 리스트 (수집 실패 시 None)
+        """
+        html, digest = cls._fetch_page_html(target_date, source)
+        if html is None:
             return None
 
+        games = cls._parsed_games.get(digest)
+        if games is None:
+            games = cls._parse_daum_rows_fast(html)
+            with cls._parsed_games_lock:
+                if len(cls._parsed_games) >= cls._PARSED_GAMES_MAX:
+                    cls._parsed_games.pop(next(iter(cls._parsed_games)))
+                cls._parsed_games[digest] = games
+        # 호출자가 dict를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return [dict(g) for g in games]
+
     @staticmethod
     def _parse_daum_rows(soup):
         """
@@ -118,25 +278,179 @@ class CrawlerService:
 
         return games
 
+    @staticmethod
+    def _extract_schedule_fragment(html: str) -> str | None:
+        """페이지 전체에서 <tbody id="scheduleList"> ... </tbody> 구간만 잘라냅니다."""
+        start = html.find('id="scheduleList"')
+        if start == -1:
+            return None
+        start = html.rfind("<tbody", 0, start)
+        end = html.find("</tbody>", start)
+        if start == -1 or end == -1:
+            return None
+        return html[start:end + len("</tbody>")]
+
+    @staticmethod
+    def _text_of(el) -> str:
+        """BeautifulSoup get_text(strip=True)와 같은 규칙으로 텍스트를 추출합니다."""
+        if el is None:
+            return ""
+        return "".join(t.strip() for t in el.itertext() if t.strip())
+
+    @classmethod
+    def _parse_daum_rows_fast(cls, html: str):
+        """
+        _parse_daum_rows와 동일한 결과를 내는 고속 파서입니다.
+        #scheduleList 구간만 lxml로 파싱하고, 각 <tr>의 하위 요소를 한 번만 순회하여
+        필요한 필드를 모두 추출합니다. (CSS 셀렉터를 필드마다 다시 실행하지 않음)
+        """
+        games = []
+        fragment = cls._extract_schedule_fragment(html)
+        if not fragment:
+            print("⚠️ #scheduleList 테이블을 찾을 수 없습니다.")
+            return games
+
+        table = lxml_html.fromstring(f"<table>{fragment}</table>")
+        wanted = ("link_game", "state_game", "td_sort", "td_time", "td_area", "team_home", "team_away")
+
+        for tr in table.iter("tr"):
+            try:
+                game_date_str = tr.get("data-date", "")
+                if not game_date_str:
+                    continue
+
+                game_date = datetime.strptime(game_date_str, "%Y%m%d").date()
+
+                # 1회 순회로 클래스별 첫 요소 수집
+                found = {}
+                for el in tr.iterdescendants():
+                    class_attr = el.get("class") if isinstance(el.tag, str) else None
+                    if not class_attr:
+                        continue
+                    for cls_name in class_attr.split():
+                        if cls_name in wanted and cls_name not in found:
+                            found[cls_name] = el
+
+                link_tag = found.get("link_game")
+                href = link_tag.get("href", "") if link_tag is not None else ""
+                game_id = href.replace("/match/", "") if "/match/" in href else ""
+                if not game_id:
+                    continue
+
+                # 팀 블록 내부에서 팀명/점수 추출
+                team_fields = {}
+                for side in ("team_home", "team_away"):
+                    block = found.get(side)
+                    name_el = score_el = None
+                    if block is not None:
+                        for el in block.iterdescendants():
+                            class_attr = el.get("class") if isinstance(el.tag, str) else None
+                            if not class_attr:
+                                continue
+                            classes = class_attr.split()
+                            if name_el is None and "txt_team" in classes:
+                                name_el = el
+                            if score_el is None and "num_score" in classes:
+                                score_el = el
+                    team_fields[side] = (
+                        cls._text_of(name_el),
+                        cls._text_of(score_el) if score_el is not None else "-",
+                    )
+
+                home_team, home_score_text = team_fields["team_home"]
+                away_team, away_score_text = team_fields["team_away"]
+
+                # 유효한 팀명인지 확인
+                if home_team not in TEAMS or away_team not in TEAMS:
+                    continue
+
+                sort_text = cls._text_of(found.get("td_sort"))
+
+                games.append({
+                    "game_id": game_id,
+                    "game_date": game_date,
+                    "game_time": cls._text_of(found.get("td_time")),
+                    "venue": cls._text_of(found.get("td_area")),
+                    "home_team": home_team,
+                    "away_team": away_team,
+                    "home_score": home_score_text,
+                    "away_score": away_score_text,
+                    "game_status": cls._text_of(found.get("state_game")),
+                    "is_postseason": sort_text in POSTSEASON_SORT_VALUES,
+                    "sort_text": sort_text,
+                })
+            except Exception as e:
+                print(f"⚠️ 행 파싱 중 오류: {e}")
+                continue
+
+        return games
+
     @classmethod
     def _get_conn(cls, conn=None):
-        """외부 connection이 있으면 그대로, 없으면 engine.begin() 컨텍스트 매니저 반환."""
+        """외부 connection이 있으면 그대로(닫지 않음), 없으면 engine.begin() 컨텍스트 매니저 반환."""
         if conn:
-            return conn
+            return nullcontext(conn)
         return engine.begin()
 
-    @classmethod
-    def _upsert_kbo_games(cls, exec_conn, game, home_score, away_score, winning_team):
-        """kbo_games 테이블에 경기 결과를 UPSERT합니다."""
-        exec_conn.execute(text("""
-            INSERT INTO kbo_games (game_id, game_date, home_team, away_team, home_score, away_score, winning_team, is_postseason, sort_text)
-            VALUES (:game_id, :game_date, :home_team, :away_team, :home_score, :away_score, :winning_team, :is_postseason, :sort_text)
-            ON CONFLICT (game_id) DO UPDATE SET
-                home_score = EXCLUDED.home_score,
-                away_score = EXCLUDED.away_score,
-                winning_team = EXCLUDED.winning_team,
-                sort_text = EXCLUDED.sort_text
-        """), {
+    @staticmethod
+    def _bulk_upsert(exec_conn, table: str, columns: list, rows: list, update_columns: list) -> dict:
+        """
+        여러 행을 multi-row INSERT ... ON CONFLICT (game_id) DO UPDATE 한 문장으로 UPSERT합니다.
+        갱신 대상 컬럼 값이 기존과 같은 행은 다시 쓰지 않습니다. (실제로 바뀐 행만 updated_at 갱신)
+
+        Returns:
+            dict: {"inserted": n, "updated": n, "unchanged": n}
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        # 같은 game_id가 한 문장에 두 번 들어가면 ON CONFLICT 오류가 나므로 마지막 값만 사용
+        rows = list({row["game_id"]: row for row in rows}.values())
+
+        set_clause = ", ".join(f"{col} = EXCLUDED.{col}" for col in update_columns) + ", updated_at = NOW()"
+        current = ", ".join(f"{table}.{col}" for col in update_columns)
+        incoming = ", ".join(f"EXCLUDED.{col}" for col in update_columns)
+
+        for offset in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            chunk = rows[offset:offset + UPSERT_CHUNK_SIZE]
+            params = {}
+            values_sql = []
+            for i, row in enumerate(chunk):
+                values_sql.append("(" + ", ".join(f":{col}_{i}" for col in columns) + ")")
+                params.update({f"{col}_{i}": row[col] for col in columns})
+
+            returned = exec_conn.execute(text(f"""
+                INSERT INTO {table} ({", ".join(columns)})
+                VALUES {", ".join(values_sql)}
+                ON CONFLICT (game_id) DO UPDATE SET {set_clause}
+                WHERE ({current}) IS DISTINCT FROM ({incoming})
+                RETURNING (xmax = 0) AS inserted
+            """), params).fetchall()
+
+            inserted = sum(1 for r in returned if r.inserted)
+            counts["inserted"] += inserted
+            counts["updated"] += len(returned) - inserted
+            counts["unchanged"] += len(chunk) - len(returned)
+
+        return counts
+
+    @staticmethod
+    def _to_result_row(game: dict) -> dict | None:
+        """종료된 경기를 kbo_games 행으로 변환합니다. 종료 전이거나 점수가 없으면 None."""
+        if game["game_status"] != "종료" or game["home_score"] == "-":
+            return None
+        try:
+            home_score = int(game["home_score"])
+            away_score = int(game["away_score"])
+        except ValueError:
+            return None
+
+        if home_score > away_score:
+            winning_team = game["home_team"]
+        elif away_score > home_score:
+            winning_team = game["away_team"]
+        else:
+            winning_team = "무승부"
+
+        return {
             "game_id": game["game_id"],
             "game_date": game["game_date"],
             "home_team": game["home_team"],
@@ -146,88 +460,186 @@ class CrawlerService:
             "winning_team": winning_team,
             "is_postseason": game["is_postseason"],
             "sort_text": game["sort_text"],
-        })
+        }
 
-    @classmethod
-    def _upsert_kbo_schedule(cls, exec_conn, game):
-        """kbo_schedule 테이블에 경기 일정을 UPSERT합니다."""
-        exec_conn.execute(text("""
-            INSERT INTO kbo_schedule (game_id, game_date, home_team, away_team, game_status, is_postseason, sort_text)
-            VALUES (:game_id, :game_date, :home_team, :away_team, :game_status, :is_postseason, :sort_text)
-            ON CONFLICT (game_id) DO UPDATE SET
-                game_status = EXCLUDED.game_status,
-                sort_text = EXCLUDED.sort_text
-        """), {
+    @staticmethod
+    def _to_schedule_row(game: dict) -> dict:
+        """경기를 kbo_schedule 행으로 변환합니다."""
+        return {
             "game_id": game["game_id"],
             "game_date": game["game_date"],
+            "game_time": game.get("game_time") or None,
             "home_team": game["home_team"],
             "away_team": game["away_team"],
             "game_status": game["game_status"],
             "is_postseason": game["is_postseason"],
             "sort_text": game["sort_text"],
-        })
+        }
+
+    @staticmethod
+    def _row_digest(row: dict, columns: list) -> str:
+        """갱신 대상 컬럼 값으로 행의 내용 해시를 계산합니다."""
+        payload = "|".join(str(row[col]) for col in columns)
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()
 
     @classmethod
-    def update_daily_pipeline(cls, conn=None):
+    def _diff_rows(cls, exec_conn, table: str, rows: list, digest_columns: list) -> tuple[list, int]:
+        """
+        페이지에서 파싱한 행과 DB에 저장된 row_digest를 메모리에서 비교하여
+        새로 생겼거나 내용이 바뀐 행만 골라냅니다.
+
+        Returns:
+            tuple: (변경/신규 행 리스트(row_digest 포함), 변경 없는 행 수)
+        """
+        if not rows:
+            return [], 0
+        stored = dict(exec_conn.execute(
+            text(f"SELECT game_id, row_digest FROM {table} WHERE game_id = ANY(:ids)"),
+            {"ids": [row["game_id"] for row in rows]},
+        ).fetchall())
+
+        changed = []
+        for row in rows:
+            digest = cls._row_digest(row, digest_columns)
+            if stored.get(row["game_id"]) != digest:
+                changed.append(dict(row, row_digest=digest))
+        return changed, len(rows) - len(changed)
+
+    @classmethod
+    def _upsert_kbo_games(cls, exec_conn, rows: list) -> dict:
+        """kbo_games 테이블에 경기 결과를 일괄 UPSERT합니다. (row_digest 포함 행)"""
+        return cls._bulk_upsert(
+            exec_conn, "kbo_games", KBO_GAMES_COLUMNS + ["row_digest"], rows,
+            update_columns=KBO_GAMES_DIGEST_COLUMNS + ["row_digest"],
+        )
+
+    @classmethod
+    def _upsert_kbo_schedule(cls, exec_conn, rows: list) -> dict:
+        """kbo_schedule 테이블에 경기 일정을 일괄 UPSERT합니다. (row_digest 포함 행)"""
+        return cls._bulk_upsert(
+            exec_conn, "kbo_schedule", KBO_SCHEDULE_COLUMNS + ["row_digest"], rows,
+            update_columns=KBO_SCHEDULE_DIGEST_COLUMNS + ["row_digest"],
+        )
+
+    @classmethod
+    def _write_games(cls, exec_conn, result_rows: list, schedule_rows: list) -> dict:
+        """
+        경기 결과/일정 행을 row_digest와 비교하여 바뀐 행만 UPSERT합니다.
+
+        Returns:
+            dict: {"results": {...}, "schedules": {...},
+                   "changed_game_ids": [...], "changed_schedule_ids": [...]}
+        """
+        summary = {}
+        for key, table, rows, digest_columns, upsert in (
+            ("results", "kbo_games", result_rows, KBO_GAMES_DIGEST_COLUMNS, cls._upsert_kbo_games),
+            ("schedules", "kbo_schedule", schedule_rows, KBO_SCHEDULE_DIGEST_COLUMNS, cls._upsert_kbo_schedule),
+        ):
+            changed, skipped = cls._diff_rows(exec_conn, table, rows, digest_columns)
+            counts = upsert(exec_conn, changed) if changed else {"inserted": 0, "updated": 0, "unchanged": 0}
+            counts["unchanged"] += skipped
+            summary[key] = counts
+            summary["changed_game_ids" if key == "results" else "changed_schedule_ids"] = sorted(
+                {row["game_id"] for row in changed}
+            )
+        return summary
+
+    @staticmethod
+    def _month_page_dates(start: date, end: date) -> list:
+        """
+        [start, end] 구간을 덮는 월별 페이지 요청 날짜 목록을 반환합니다.
+        (Daum 페이지는 월 단위이므로 구간 안의 각 월마다 1일 하나만 사용)
+        """
+        page_dates = []
+        current = start.replace(day=1)
+        while current <= end:
+            page_dates.append(current)
+            last_day = calendar.monthrange(current.year, current.month)[1]
+            current = date(current.year, current.month, last_day) + timedelta(days=1)
+        return page_dates
+
+    @classmethod
+    def fetch_window_games(cls, start: date, end: date, source=None):
+        """
+        크롤링 구간에 필요한 월 페이지들을 동시에 가져와 game_id 기준으로 중복 제거합니다.
+        같은 경기가 여러 페이지에 있으면 경기 날짜와 같은 월의 페이지 값을 우선합니다.
+
+        Returns:
+            tuple: (경기 리스트, 수집 실패한 페이지 날짜 리스트)
+        """
+        page_dates = cls._month_page_dates(start, end)
+        with ThreadPoolExecutor(max_workers=len(page_dates)) as executor:
+            pages = list(zip(page_dates, executor.map(lambda d: cls.fetch_games(d, source), page_dates)))
+
+        failed = [page_date for page_date, games in pages if games is None]
+        return cls._merge_pages([(d, g) for d, g in pages if g is not None]), failed
+
+    @staticmethod
+    def _merge_pages(pages: list) -> list:
+        """
+        (페이지 기준일, 경기 리스트) 목록을 game_id 기준으로 합칩니다.
+        같은 경기가 여러 페이지에 있으면 경기 날짜와 같은 월의 페이지 값을 우선합니다.
+        """
+        games_by_id = {}
+        for page_date, games in pages:
+            for game in games:
+                existing = games_by_id.get(game["game_id"])
+                same_month = (game["game_date"].year, game["game_date"].month) == (page_date.year, page_date.month)
+                if existing is None or same_month:
+                    games_by_id[game["game_id"]] = game
+        return list(games_by_id.values())
+
+    @classmethod
+    def update_daily_pipeline(
+        cls,
+        conn=None,
+        days_back: int = CRAWL_DAYS_BACK,
+        days_ahead: int = CRAWL_DAYS_AHEAD,
+        source=None,
+    ):
         """
         어제 경기 결과를 업데이트하고 오늘 이후 일정을 갱신합니다.
-        Daum Sports에서 오늘 날짜 기준으로 데이터를 가져옵니다.
+        (오늘 - days_back) ~ (오늘 + days_ahead) 구간이 걸친 모든 월 페이지를 동시에 가져오므로,
+        월초에도 지난달 페이지에 있는 어제 경기 결과가 누락되지 않습니다.
+        경기 결과/일정을 각각 한 번의 multi-row UPSERT로, 하나의 트랜잭션 안에서 저장합니다.
+        DB의 row_digest와 비교하여 내용이 바뀐 행만 씁니다.
         
         Args:
             conn: 외부 트랜잭션 connection (관리자 모드용). None이면 자체 트랜잭션 사용.
+            days_back: 결과를 확인할 과거 일수 (기본값: 1, 어제)
+            days_ahead: 일정을 확인할 미래 일수
+            source: 페이지 소스 (예: ArchivedPageSource로 저장된 HTML을 오프라인 재생)
+
+        Returns:
+            dict: {"results": {"inserted", "updated", "unchanged"}, "schedules": {...},
+                   "changed_game_ids": [결과가 새로 생기거나 바뀐 game_id],
+                   "changed_schedule_ids": [일정이 새로 생기거나 바뀐 game_id],
+                   "failed_pages": [수집 실패한 페이지 기준일] (실패가 있을 때만)}
         """
         today = CURRENT_DATE
+        window_start = today - timedelta(days=days_back)
+        window_end = today + timedelta(days=days_ahead)
 
-        # 오늘 날짜 기준으로 데이터 요청 (해당 월 전체 일정이 응답됨)
-        soup = cls._fetch_from_daum(today)
-        if not soup:
+        games, failed_pages = cls.fetch_window_games(window_start, window_end, source)
+        if failed_pages and not games:
             return {"error": "Daum Sports 데이터 수집 실패"}
 
-        games = cls._parse_daum_rows(soup)
-
-        updated_count = 0
-        scheduled_count = 0
-
-        for game in games:
-            game_date = game["game_date"]
-
-            # 1. kbo_games: 종료된 경기만 저장/업데이트
-            if game["game_status"] == "종료" and game["home_score"] != "-":
-                try:
-                    home_score = int(game["home_score"])
-                    away_score = int(game["away_score"])
-                except ValueError:
-                    continue
-
-                if home_score > away_score:
-                    winning_team = game["home_team"]
-                elif away_score > home_score:
-                    winning_team = game["away_team"]
-                else:
-                    winning_team = "무승부"
-
-                if conn:
-                    cls._upsert_kbo_games(conn, game, home_score, away_score, winning_team)
-                else:
-                    with engine.begin() as conn_inner:
-                        cls._upsert_kbo_games(conn_inner, game, home_score, away_score, winning_team)
-                updated_count += 1
+        # 1. kbo_games: 종료된 경기만 / 2. kbo_schedule: 오늘 이후 일정
+        result_rows = [row for row in (cls._to_result_row(g) for g in games) if row]
+        schedule_rows = [cls._to_schedule_row(g) for g in games if g["game_date"] >= today]
 
-            # 2. kbo_schedule: 오늘 이후 일정 저장/업데이트
-            if game_date >= today:
-                if conn:
-                    cls._upsert_kbo_schedule(conn, game)
-                else:
-                    with engine.begin() as conn_inner:
-                        cls._upsert_kbo_schedule(conn_inner, game)
-                scheduled_count += 1
+        with cls._get_conn(conn) as exec_conn:
+            summary = cls._write_games(exec_conn, result_rows, schedule_rows)
 
-        return {"updated_results": updated_count, "new_schedules": scheduled_count}
+        if failed_pages:
+            summary["failed_pages"] = [str(d) for d in failed_pages]
+        return summary
 
 
 # --- API Endpoints ---
 
 @router.post("/daily-update")
 def api_daily_update():
+    """일일 크롤링을 실행합니다. (오프라인 재생은 서버 설정 CRAWLER_REPLAY_DIR 또는 CLI로만 지정)"""
     result = CrawlerService.update_daily_pipeline()
     return {"status": "ok", "data": result}
@@ -0,0 +1,126 @@
+# backend/services/crowd_picks.py
+"""
+경기별 팬 예측 집계 (팬 vs AI)
+
+user_predictions 트리거가 유지하는 game_crowd_picks 카운터(init_db.sql 2.2.1)를 읽어
+경기 카드에 "팬 62% 삼성 vs AI 55%"를 보여줍니다.
+- 날짜별 조회 결과를 CROWD_CACHE_SECONDS 동안 프로세스 안에 캐시 (ai_predictions 결과와 함께)
+- 예측 정산 시 snapshot()이 최종 집계를 game_crowd_snapshots에 저장하여 팬 다수 선택 vs AI 적중률 통계에 사용
+"""
+import threading
+import time
+from sqlalchemy import text
+
+from config import engine
+
+CROWD_CACHE_SECONDS = 15   # 날짜별 집계 캐시 유지 시간
+
+
+class CrowdPicks:
+    _lock = threading.Lock()
+    _cache = {}   # game_date -> (조회 시각, {game_id: 집계})
+
+    @staticmethod
+    def _percent(part: int, total: int):
+        return round(part / total * 100, 1) if total else None
+
+    @classmethod
+    def _load(cls, game_date) -> dict:
+        with engine.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT s.game_id, s.home_team, s.away_team,
+                       COALESCE(h.picks, 0) AS home_picks,
+                       COALESCE(a.picks, 0) AS away_picks,
+                       ai.predicted_winner AS ai_pick,
+                       ai.prediction_prob AS ai_prob
+                FROM kbo_schedule s
+                LEFT JOIN game_crowd_picks h ON h.game_id = s.game_id AND h.team = s.home_team
+                LEFT JOIN game_crowd_picks a ON a.game_id = s.game_id AND a.team = s.away_team
+                LEFT JOIN ai_predictions ai ON ai.game_id = s.game_id
+                WHERE s.game_date = :game_date
+            """), {"game_date": game_date}).fetchall()
+
+        result = {}
+        for row in rows:
+            total = row.home_picks + row.away_picks
+            result[row.game_id] = {
+                "game_id": row.game_id,
+                "home_team": row.home_team,
+                "away_team": row.away_team,
+                "home_picks": row.home_picks,
+                "away_picks": row.away_picks,
+                "total_picks": total,
+                "home_pct": cls._percent(row.home_picks, total),
+                "away_pct": cls._percent(row.away_picks, total),
+                "ai_pick": row.ai_pick,
+                "ai_prob": round(row.ai_prob * 100, 1) if row.ai_prob is not None else None,
+            }
+        return result
+
+    @classmethod
+    def for_date(cls, game_date) -> dict:
+        """날짜의 경기별 팬 예측 집계와 AI 예측을 반환합니다. {game_id: 집계}"""
+        now = time.monotonic()
+        with cls._lock:
+            cached = cls._cache.get(game_date)
+            if cached and now - cached[0] < CROWD_CACHE_SECONDS:
+                return cached[1]
+        data = cls._load(game_date)
+        with cls._lock:
+            cls._cache[game_date] = (now, data)
+            # 지난 날짜 캐시는 남겨두지 않음
+            for key in [k for k, v in cls._cache.items() if now - v[0] >= CROWD_CACHE_SECONDS]:
+                del cls._cache[key]
+        return data
+
+    @staticmethod
+    def snapshot(conn, game_date) -> int:
+        """
+        결과가 나온 경기의 최종 팬 예측 집계를 저장합니다. (호출자 트랜잭션 안에서, 이미 저장된 경기는 유지)
+
+        Returns:
+            int: 새로 저장한 경기 수
+        """
+        return conn.execute(text("""
+            INSERT INTO game_crowd_snapshots
+                (game_id, game_date, home_team, away_team, home_picks, away_picks, crowd_pick, ai_pick, winning_team)
+            SELECT g.game_id, g.game_date, g.home_team, g.away_team,
+                   COALESCE(h.picks, 0), COALESCE(a.picks, 0),
+                   CASE
+                       WHEN COALESCE(h.picks, 0) > COALESCE(a.picks, 0) THEN g.home_team
+                       WHEN COALESCE(a.picks, 0) > COALESCE(h.picks, 0) THEN g.away_team
+                   END,
+                   ai.predicted_winner,
+                   g.winning_team
+            FROM kbo_games g
+            LEFT JOIN game_crowd_picks h ON h.game_id = g.game_id AND h.team = g.home_team
+            LEFT JOIN game_crowd_picks a ON a.game_id = g.game_id AND a.team = g.away_team
+            LEFT JOIN ai_predictions ai ON ai.game_id = g.game_id
+            WHERE g.game_date = :game_date
+              AND g.winning_team IS NOT NULL
+            ON CONFLICT (game_id) DO NOTHING
+        """), {"game_date": game_date}).rowcount
+
+    @staticmethod
+    def accuracy(start_date=None, end_date=None) -> dict:
+        """정산 스냅샷으로 팬 다수 선택과 AI의 적중률을 비교합니다. (무승부 제외)"""
+        with engine.connect() as conn:
+            row = conn.execute(text("""
+                SELECT COUNT(*) FILTER (WHERE crowd_pick IS NOT NULL) AS crowd_games,
+                       COUNT(*) FILTER (WHERE crowd_pick = winning_team) AS crowd_correct,
+                       COUNT(*) FILTER (WHERE ai_pick IS NOT NULL) AS ai_games,
+                       COUNT(*) FILTER (WHERE ai_pick = winning_team) AS ai_correct,
+                       COUNT(*) FILTER (WHERE crowd_pick IS NOT NULL AND ai_pick IS NOT NULL
+                                        AND crowd_pick <> ai_pick) AS disagreements,
+                       COUNT(*) FILTER (WHERE crowd_pick IS NOT NULL AND ai_pick IS NOT NULL
+                                        AND crowd_pick <> ai_pick AND crowd_pick = winning_team) AS crowd_won_disagreements
+                FROM game_crowd_snapshots
+                WHERE winning_team <> '무승부'
+                  AND (CAST(:start_date AS DATE) IS NULL OR game_date >= :start_date)
+                  AND (CAST(:end_date AS DATE) IS NULL OR game_date <= :end_date)
+            """), {"start_date": start_date, "end_date": end_date}).mappings().one()
+
+        result = dict(row)
+        result["crowd_accuracy"] = CrowdPicks._percent(row["crowd_correct"], row["crowd_games"])
+        result["ai_accuracy"] = CrowdPicks._percent(row["ai_correct"], row["ai_games"])
+        return result
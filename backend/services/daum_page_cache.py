@@ -0,0 +1,90 @@
+# backend/services/daum_page_cache.py
+"""
+Daum Sports 일정 페이지 로컬 캐시
+
+(url, date 파라미터)별로 응답 본문을 gzip으로 압축해 디스크에 저장하고,
+ETag / Last-Modified 값을 함께 보관하여 조건부 요청(304 Not Modified)에 사용합니다.
+
+저장 구조 (DAUM_CACHE_DIR):
+    <key>.html.gz   응답 본문 (gzip)
+    <key>.json      메타데이터 {url, date_param, etag, last_modified, digest, fetched_at}
+"""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "daum")
+DAUM_CACHE_DIR = os.getenv("DAUM_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+class DaumPageCache:
+    def __init__(self, cache_dir: str = DAUM_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def make_key(url: str, date_param: str) -> str:
+        """(url, date 파라미터) 조합으로 캐시 키를 생성합니다."""
+        return hashlib.sha1(f"{url}?date={date_param}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def digest(body: str) -> str:
+        """응답 본문의 내용 해시 (변경 감지용)"""
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+
+    def load_meta(self, key: str) -> dict | None:
+        """캐시 메타데이터를 반환합니다. 본문 파일이 없으면 None."""
+        meta_path = self._path(key, ".json")
+        if not os.path.exists(meta_path) or not os.path.exists(self._path(key, ".html.gz")):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load_body(self, key: str) -> str | None:
+        """캐시된 본문을 압축 해제하여 반환합니다."""
+        try:
+            with gzip.open(self._path(key, ".html.gz"), "rt", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_json(self, key: str, meta: dict):
+        # 임시 파일에 쓴 뒤 교체하여 동시 실행 중에도 반쯤 쓰인 파일을 읽지 않도록 함
+        meta_path = self._path(key, ".json")
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+
+    def save(self, key: str, url: str, date_param: str, body: str, etag: str = None, last_modified: str = None) -> dict:
+        """본문과 메타데이터를 저장하고 메타데이터를 반환합니다."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        body_path = self._path(key, ".html.gz")
+        tmp_path = f"{body_path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(body)
+        os.replace(tmp_path, body_path)
+
+        meta = {
+            "url": url,
+            "date_param": date_param,
+            "etag": etag,
+            "last_modified": last_modified,
+            "digest": self.digest(body),
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._write_json(key, meta)
+        return meta
+
+    def touch(self, key: str, meta: dict) -> dict:
+        """304 응답 등으로 재검증된 경우 fetched_at만 갱신합니다."""
+        meta = dict(meta, fetched_at=datetime.now().isoformat(timespec="seconds"))
+        self._write_json(key, meta)
+        return meta
@@ -0,0 +1,340 @@
+# backend/services/leaderboard_index.py
+"""
+인메모리 리더보드 인덱스
+
+API 프로세스 안에 점수 종류(weekly_score, prediction_score, quiz_score)별로
+점수 분포 Fenwick 트리(펜윅 트리)를 유지하여 아래 조회를 O(log n)으로 처리합니다.
+- 상위 N명, 내 순위/백분위, 내 주변 순위
+
+정렬 기준은 점수 내림차순, 동점이면 user_id 내림차순(DB 키셋 페이지네이션과 동일)이며,
+순위는 동점자에게 같은 순위를 주는 방식(1 + 나보다 점수가 높은 유저 수)입니다.
+
+- 시작 시 user_profiles(주간 점수는 score_weekly_totals의 현재 주)에서 전체를 다시 만들고(rebuild), 이후 점수 아웃박스가 반영한 이벤트로 갱신합니다.
+- 다른 프로세스(일일 파이프라인의 예측 정산, 주간 초기화)에서 바뀐 점수는 주기적 재동기화로 반영합니다.
+"""
+import bisect
+import threading
+from sqlalchemy import text
+
+from config import engine
+
+SCORE_TYPES = ("weekly_score", "prediction_score", "quiz_score")
+LEADERBOARD_RESYNC_SECONDS = 300   # DB 전체 재동기화 주기
+INITIAL_SCORE_CAPACITY = 1024      # Fenwick 트리 초기 크기 (점수가 커지면 2배씩 확장)
+
+
+class _FenwickTree:
+    """점수 값별 유저 수를 저장하는 Fenwick 트리 (인덱스 = 점수 + 1)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int):
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index: int) -> int:
+        """1 ~ index 구간 합"""
+        total = 0
+        index = min(index, self.size)
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def find_kth(self, k: int) -> int:
+        """누적 합이 k 이상이 되는 가장 작은 인덱스"""
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] < k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return pos + 1
+
+
+class _ScoreBoard:
+    """한 점수 종류의 순위 인덱스"""
+
+    def __init__(self):
+        self.scores = {}      # user_id -> 점수
+        self.buckets = {}     # 점수 -> 정렬된 user_id 리스트
+        self.tree = _FenwickTree(INITIAL_SCORE_CAPACITY)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def _grow(self, score: int):
+        size = self.tree.size
+        while score + 1 > size:
+            size *= 2
+        tree = _FenwickTree(size)
+        for value, users in self.buckets.items():
+            tree.add(value + 1, len(users))
+        self.tree = tree
+
+    def _remove(self, user_id: str):
+        score = self.scores.pop(user_id, None)
+        if score is None:
+            return
+        bucket = self.buckets[score]
+        bucket.pop(bisect.bisect_left(bucket, user_id))
+        if not bucket:
+            del self.buckets[score]
+        self.tree.add(score + 1, -1)
+
+    def set(self, user_id: str, score: int):
+        score = max(int(score or 0), 0)
+        if self.scores.get(user_id) == score:
+            return
+        self._remove(user_id)
+        if score + 1 > self.tree.size:
+            self._grow(score)
+        self.scores[user_id] = score
+        bisect.insort(self.buckets.setdefault(score, []), user_id)
+        self.tree.add(score + 1, 1)
+
+    def add(self, user_id: str, delta: int):
+        self.set(user_id, self.scores.get(user_id, 0) + delta)
+
+    def rank(self, user_id: str):
+        """1 + 나보다 점수가 높은 유저 수 (없는 유저면 None)"""
+        score = self.scores.get(user_id)
+        if score is None:
+            return None
+        return 1 + len(self.scores) - self.tree.prefix(score + 1)
+
+    def position(self, user_id: str) -> int:
+        """정렬 순서상 0부터 시작하는 위치 (동점이면 user_id 내림차순)"""
+        score = self.scores[user_id]
+        higher = len(self.scores) - self.tree.prefix(score + 1)
+        bucket = self.buckets[score]
+        return higher + len(bucket) - bisect.bisect_right(bucket, user_id)
+
+    def count_before(self, score: int, user_id: str) -> tuple:
+        """(score, user_id)보다 앞에 정렬되는 인원 (점수가 더 높은 수, 같은 점수 중 user_id가 더 큰 수)"""
+        higher = len(self.scores) - self.tree.prefix(score + 1)
+        bucket = self.buckets.get(score, [])
+        return higher, len(bucket) - bisect.bisect_right(bucket, user_id)
+
+    def at(self, position: int) -> tuple:
+        """정렬 순서상 position(0부터) 번째 (user_id, 점수)"""
+        n = len(self.scores)
+        ascending = n - position                     # 점수 오름차순 기준 1부터 시작하는 위치
+        index = self.tree.find_kth(ascending)
+        score = index - 1
+        offset = ascending - self.tree.prefix(index - 1) - 1
+        # 오름차순 기준으로는 같은 점수 안에서 user_id 오름차순이므로 버킷 위치와 같음
+        return self.buckets[score][offset], score
+
+    def slice(self, start: int, count: int) -> list:
+        start = max(start, 0)
+        end = min(start + count, len(self.scores))
+        return [self.at(p) for p in range(start, end)]
+
+
+class LeaderboardIndex:
+    _lock = threading.RLock()
+    _boards = {}          # score_type -> _ScoreBoard
+    _profiles = {}        # user_id -> {"nickname", 점수들}
+    _ready = False
+    _replays = []         # 진행 중인 rebuild별로, DB를 읽는 동안 적용된 변경 목록 [("events" | "reset", 값), ...]
+    _stop = threading.Event()
+    _thread = None
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """
+        user_profiles 전체로 인덱스를 다시 만듭니다.
+        DB를 읽기 시작한 뒤 교체 전까지 적용된 이벤트/초기화는 모아 두었다가 교체와 같은 잠금 안에서 새 인덱스에 다시 적용합니다.
+        (읽기 직전에 커밋되어 이미 읽은 값에 포함된 이벤트가 중복 적용될 수 있으나 다음 재동기화에서 바로잡힘)
+        """
+        replay = []
+        with cls._lock:
+            cls._replays.append(replay)
+        try:
+            with engine.connect() as conn:
+                # 주간 점수는 점수 원장의 현재 주 집계에서 가져옴
+                rows = conn.execute(text("""
+                    SELECT p.user_id, p.nickname,
+                           COALESCE(w.weekly_score, 0) AS weekly_score,
+                           p.prediction_score, p.quiz_score
+                    FROM user_profiles p
+                    LEFT JOIN score_weekly_totals w
+                        ON w.user_id = p.user_id
+                       AND w.week_start = (SELECT current_week FROM score_ledger_state)
+                """)).fetchall()
+
+            boards = {score_type: _ScoreBoard() for score_type in SCORE_TYPES}
+            profiles = {}
+            for row in rows:
+                profiles[row.user_id] = {
+                    "nickname": row.nickname,
+                    **{score_type: getattr(row, score_type) or 0 for score_type in SCORE_TYPES},
+                }
+                for score_type in SCORE_TYPES:
+                    boards[score_type].set(row.user_id, profiles[row.user_id][score_type])
+
+            with cls._lock:
+                cls._boards = boards
+                cls._profiles = profiles
+                for kind, value in replay:
+                    if kind == "events":
+                        cls._apply(value)
+                    else:
+                        cls._reset(value)
+                cls._ready = True
+        finally:
+            with cls._lock:
+                cls._replays.remove(replay)
+        print(f"🏆 [Leaderboard] 인덱스 재구성 완료: {len(profiles)}명 (재적용 {len(replay)}건)")
+        return len(profiles)
+
+    @classmethod
+    def ensure_ready(cls):
+        if not cls._ready:
+            cls.rebuild()
+
+    @classmethod
+    def _apply(cls, events: list):
+        for e in events:
+            score_type = e["score_type"]
+            if score_type not in SCORE_TYPES or not e["delta"]:
+                continue
+            profile = cls._profiles.get(e["user_id"])
+            if profile is None:
+                # 신규 유저는 모든 점수 종류에 0점으로 등록
+                profile = {"nickname": e.get("nickname") or "익명", **{t: 0 for t in SCORE_TYPES}}
+                cls._profiles[e["user_id"]] = profile
+                for t in SCORE_TYPES:
+                    cls._boards[t].set(e["user_id"], 0)
+            profile[score_type] += int(e["delta"])
+            cls._boards[score_type].set(e["user_id"], profile[score_type])
+
+    @classmethod
+    def _reset(cls, score_type: str):
+        board = _ScoreBoard()
+        for user_id, profile in cls._profiles.items():
+            profile[score_type] = 0
+            board.set(user_id, 0)
+        cls._boards[score_type] = board
+
+    @classmethod
+    def apply_events(cls, events: list):
+        """
+        반영 완료된 점수 이벤트를 인덱스에 적용합니다. (ScoreOutbox 리스너)
+        apply_score_deltas와 같은 규칙으로, 이벤트의 score_type 점수만 증가시킵니다.
+        """
+        with cls._lock:
+            for replay in cls._replays:
+                replay.append(("events", events))
+            if cls._ready:
+                cls._apply(events)
+
+    @classmethod
+    def reset_score_type(cls, score_type: str):
+        """주간 초기화처럼 한 점수 종류를 모두 0으로 만듭니다."""
+        if score_type not in SCORE_TYPES:
+            return
+        with cls._lock:
+            for replay in cls._replays:
+                replay.append(("reset", score_type))
+            if cls._ready:
+                cls._reset(score_type)
+
+    @classmethod
+    def _entry(cls, user_id: str, rank: int) -> dict:
+        profile = cls._profiles.get(user_id, {})
+        return {
+            "rank": rank,
+            "user_id": user_id,
+            "nickname": profile.get("nickname") or "익명",
+            **{score_type: profile.get(score_type, 0) for score_type in SCORE_TYPES},
+        }
+
+    @classmethod
+    def _entries(cls, board: _ScoreBoard, start: int, count: int) -> list:
+        return [cls._entry(user_id, board.rank(user_id)) for user_id, _ in board.slice(start, count)]
+
+    @classmethod
+    def top(cls, limit: int = 10, score_type: str = "weekly_score", offset: int = 0) -> list:
+        """상위 N명을 반환합니다."""
+        cls.ensure_ready()
+        with cls._lock:
+            return cls._entries(cls._boards[score_type], offset, limit)
+
+    @classmethod
+    def me(cls, user_id: str, score_type: str = "weekly_score"):
+        """
+        유저의 순위와 백분위를 반환합니다. 등록되지 않은 유저면 None.
+        top_percent: 상위 몇 %인지 (1위 = 100 / 전체 인원)
+        """
+        cls.ensure_ready()
+        with cls._lock:
+            board = cls._boards[score_type]
+            rank = board.rank(user_id)
+            if rank is None:
+                return None
+            total = len(board)
+            entry = cls._entry(user_id, rank)
+            entry.update({
+                "score": board.scores[user_id],
+                "total_users": total,
+                "top_percent": round(rank / total * 100, 2),
+                "percentile": round((total - rank) / total * 100, 2),
+            })
+            return entry
+
+    @classmethod
+    def around(cls, user_id: str, radius: int = 5, score_type: str = "weekly_score"):
+        """유저 앞뒤 radius명씩의 순위를 반환합니다. 등록되지 않은 유저면 None."""
+        cls.ensure_ready()
+        with cls._lock:
+            board = cls._boards[score_type]
+            if user_id not in board.scores:
+                return None
+            position = board.position(user_id)
+            return cls._entries(board, position - radius, radius * 2 + 1)
+
+    @classmethod
+    def count_before(cls, user_id: str, score: int, score_type: str = "weekly_score"):
+        """
+        정렬 순서상 (score, user_id) 앞에 있는 인원을 (점수가 더 높은 수, 동점 중 앞선 수)로 반환합니다. O(log n)
+        인덱스가 아직 준비되지 않았거나 이 유저의 점수가 인덱스와 다르면(재동기화 전) None
+        """
+        if not cls._ready:
+            return None
+        with cls._lock:
+            board = cls._boards[score_type]
+            if board.scores.get(user_id) != score:
+                return None
+            return board.count_before(score, user_id)
+
+    @classmethod
+    def _run_resync(cls):
+        while not cls._stop.wait(LEADERBOARD_RESYNC_SECONDS):
+            try:
+                cls.rebuild()
+            except Exception as e:
+                print(f"⚠️ [Leaderboard] 재동기화 실패: {e}")
+
+    @classmethod
+    def start(cls):
+        """API 시작 시 인덱스를 만들고 주기적 재동기화 스레드를 실행합니다."""
+        try:
+            cls.rebuild()
+        except Exception as e:
+            print(f"⚠️ [Leaderboard] 초기 인덱스 구성 실패 (첫 조회 시 다시 시도): {e}")
+        if cls._thread and cls._thread.is_alive():
+            return
+        cls._stop.clear()
+        cls._thread = threading.Thread(target=cls._run_resync, name="leaderboard-resync", daemon=True)
+        cls._thread.start()
+
+    @classmethod
+    def stop(cls):
+        cls._stop.set()
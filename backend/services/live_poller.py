@@ -0,0 +1,210 @@
+# backend/services/live_poller.py
+"""
+경기일 라이브 폴링
+
+새벽 1시 일일 파이프라인만으로는 저녁 내내 경기 결과가 반영되지 않으므로,
+kbo_schedule에 등록된 오늘 경기 시간대에만 Daum 일정 페이지를 반복 수집합니다.
+
+- 경기 시작 PRE_GAME_MINUTES분 전부터 폴링을 시작하고, 모든 경기가 끝나면 종료합니다.
+- 변경이 없으면 폴링 간격을 LIVE_POLL_MIN_SECONDS → LIVE_POLL_MAX_SECONDS까지 늘리고,
+  변경이 감지되거나 예상 종료 시각(시작 + EXPECTED_GAME_MINUTES) 전후에는 최소 간격으로 폴링합니다.
+- 각 폴링은 크롤러의 조건부 요청(ETag/Last-Modified) + 본문 해시 + row_digest 비교를 그대로 사용하므로
+  페이지가 바뀌지 않았으면 파싱/DB 쓰기가 일어나지 않습니다.
+- 새 경기 결과가 들어오면 바로 리그 순위를 갱신하고 오늘 경기를 정산합니다.
+
+사용 예:
+    cd backend
+    python -m services.live_poller                    # 오늘 경기가 모두 끝날 때까지 폴링
+    python -m services.live_poller --max-minutes 300  # 최대 실행 시간 지정 (GitHub Actions 타임아웃 대비)
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from config import engine, CURRENT_DATE, KST, DEFAULT_GAME_TIME, FINAL_STATUSES
+from services.crawler_service import CrawlerService
+
+LIVE_POLL_MIN_SECONDS = 30        # 변경 감지 직후 / 종료 임박 시 폴링 간격
+LIVE_POLL_MAX_SECONDS = 300       # 변경이 없을 때 최대 폴링 간격
+LIVE_POLL_BACKOFF = 2.0           # 변경이 없을 때 간격 증가 배수
+PRE_GAME_MINUTES = 10             # 경기 시작 몇 분 전부터 폴링할지
+EXPECTED_GAME_MINUTES = 190       # 평균 경기 시간 (예상 종료 시각 계산용)
+NEAR_END_MINUTES = 30             # 예상 종료 전후 몇 분 동안 최소 간격으로 폴링할지
+GIVE_UP_MINUTES = 120             # 예상 종료 후 이 시간이 지나도 끝나지 않으면 폴링 중단 (서스펜디드 등)
+MAX_CONSECUTIVE_ERRORS = 10       # 연속으로 이 횟수만큼 실패하면 폴링 중단 (일시적 DB/네트워크 오류는 백오프 후 재시도)
+
+
+class LivePoller:
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(KST)
+
+    @staticmethod
+    def _load_today_games() -> list:
+        """오늘 경기 일정과 결과 반영 여부를 조회합니다."""
+        with engine.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT s.game_id, s.game_time, s.game_status,
+                       (g.game_id IS NOT NULL) AS has_result
+                FROM kbo_schedule s
+                LEFT JOIN kbo_games g ON g.game_id = s.game_id
+                WHERE s.game_date = :today
+            """), {"today": CURRENT_DATE}).fetchall()
+
+        games = []
+        for row in rows:
+            try:
+                start_time = datetime.strptime(row.game_time or DEFAULT_GAME_TIME, "%H:%M").time()
+            except ValueError:
+                start_time = datetime.strptime(DEFAULT_GAME_TIME, "%H:%M").time()
+            start = datetime.combine(CURRENT_DATE, start_time, tzinfo=KST)
+            status = row.game_status or ""
+            games.append({
+                "game_id": row.game_id,
+                "start": start,
+                "expected_end": start + timedelta(minutes=EXPECTED_GAME_MINUTES),
+                "is_final": row.has_result or any(s in status for s in FINAL_STATUSES),
+            })
+        return games
+
+    @staticmethod
+    def _on_new_results(game_ids: list) -> dict:
+        """새로 확정된 경기 결과를 피처, 리그 순위, 유저 점수에 반영합니다."""
+        from daily_pipeline import update_team_rankings
+        from services.feature_service import FeatureService
+        from services.ranking_service import RankingService
+
+        print(f"🏁 [Live] 새 경기 결과 {len(game_ids)}건: {game_ids}")
+        result = {}
+        # 새벽 파이프라인은 이미 반영된 결과를 변경으로 보지 않으므로, 다음 날 예측용 피처를 여기서 갱신
+        try:
+            result["features"] = FeatureService.build_all_features()
+        except Exception as e:
+            print(f"   ❌ [Live] 피처 재구축 실패: {e}")
+            result["features"] = {"error": str(e)}
+        result["standings"] = update_team_rankings()
+        try:
+            result["settle"] = RankingService.settle_daily_points(CURRENT_DATE)
+        except Exception as e:
+            print(f"   ❌ [Live] 점수 정산 실패: {e}")
+            result["settle"] = {"error": str(e)}
+        return result
+
+    @classmethod
+    def _next_interval(cls, interval: float, changed: bool, pending: list, now: datetime) -> float:
+        """변경 여부와 예상 종료 시각에 따라 다음 폴링 간격을 정합니다."""
+        if changed:
+            interval = LIVE_POLL_MIN_SECONDS
+        else:
+            interval = min(interval * LIVE_POLL_BACKOFF, LIVE_POLL_MAX_SECONDS)
+
+        # 예상 종료 시각 전후 NEAR_END_MINUTES분 동안만 최소 간격 (그 이후 지연 경기는 다시 백오프)
+        near_end = any(
+            abs(now - g["expected_end"]) <= timedelta(minutes=NEAR_END_MINUTES)
+            for g in pending
+        )
+        if near_end:
+            interval = LIVE_POLL_MIN_SECONDS
+        return interval
+
+    @classmethod
+    def run(cls, max_minutes: float = None) -> dict:
+        """
+        오늘 경기가 모두 끝날 때까지 경기 시간대에만 폴링합니다.
+
+        Args:
+            max_minutes: 최대 실행 시간 (분). None이면 제한 없음.
+
+        Returns:
+            dict: {"polls", "new_results", "stopped"}
+        """
+        started_at = cls._now()
+        deadline = started_at + timedelta(minutes=max_minutes) if max_minutes else None
+        interval = LIVE_POLL_MIN_SECONDS
+        polls = 0
+        errors = 0
+        new_results = []
+
+        print(f"📺 [Live] 라이브 폴링 시작 (기준일: {CURRENT_DATE})")
+        while True:
+            try:
+                # 1. 오늘 구간만 수집 (조건부 요청 + 변경 감지)
+                summary = CrawlerService.update_daily_pipeline(days_back=0, days_ahead=0)
+                polls += 1
+                changed_results = summary.get("changed_game_ids", [])
+                changed = bool(changed_results or summary.get("changed_schedule_ids"))
+                if changed_results:
+                    new_results.extend(changed_results)
+                    cls._on_new_results(changed_results)
+
+                # 2. 남은 경기 / 다음 폴링 시점 결정
+                games = cls._load_today_games()
+                errors = 0
+            except Exception as e:
+                # 일시적 오류 하나로 저녁 폴링 전체가 끝나지 않도록 백오프 후 재시도
+                errors += 1
+                now = cls._now()
+                if errors >= MAX_CONSECUTIVE_ERRORS:
+                    stopped = f"연속 오류 {errors}회"
+                    break
+                if deadline and now >= deadline:
+                    stopped = f"최대 실행 시간({max_minutes}분) 도달"
+                    break
+                interval = min(interval * LIVE_POLL_BACKOFF, LIVE_POLL_MAX_SECONDS)
+                wait = min(interval, max((deadline - now).total_seconds(), 0)) if deadline else interval
+                print(f"⚠️ [Live] 폴링 실패 ({errors}/{MAX_CONSECUTIVE_ERRORS}): {e} - {wait:.0f}초 후 재시도")
+                time.sleep(wait)
+                continue
+
+            now = cls._now()
+            pending = [g for g in games if not g["is_final"]]
+
+            if not games:
+                stopped = "오늘 경기 없음"
+                break
+            if not pending:
+                stopped = "모든 경기 종료"
+                break
+            if now > max(g["expected_end"] for g in pending) + timedelta(minutes=GIVE_UP_MINUTES):
+                stopped = f"예상 종료 후 {GIVE_UP_MINUTES}분 경과"
+                break
+            if deadline and now >= deadline:
+                stopped = f"최대 실행 시간({max_minutes}분) 도달"
+                break
+
+            upcoming = [
+                g["start"] - timedelta(minutes=PRE_GAME_MINUTES)
+                for g in pending if g["start"] - timedelta(minutes=PRE_GAME_MINUTES) > now
+            ]
+            live = [g for g in pending if g["start"] - timedelta(minutes=PRE_GAME_MINUTES) <= now]
+
+            if live:
+                interval = cls._next_interval(interval, changed, live, now)
+                wait = interval
+                if upcoming:
+                    wait = min(wait, (min(upcoming) - now).total_seconds())
+            else:
+                # 진행 중인 경기가 없으면 다음 경기 시작 전까지 대기
+                if deadline and min(upcoming) >= deadline:
+                    stopped = "최대 실행 시간 안에 시작하는 경기 없음"
+                    break
+                interval = LIVE_POLL_MIN_SECONDS
+                wait = (min(upcoming) - now).total_seconds()
+            if deadline:
+                wait = min(wait, max((deadline - now).total_seconds(), 0))
+
+            print(f"⏱️ [Live] 남은 경기 {len(pending)}개 (진행 {len(live)}개), {wait:.0f}초 후 다시 확인")
+            time.sleep(wait)
+
+        print(f"📺 [Live] 라이브 폴링 종료: {stopped} (폴링 {polls}회, 새 결과 {len(new_results)}건)")
+        return {"polls": polls, "new_results": new_results, "stopped": stopped}
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="오늘 경기 시간대에 경기 결과를 반복 수집합니다.")
+    parser.add_argument("--max-minutes", type=float, default=None, help="최대 실행 시간 (분, 기본값: 제한 없음)")
+    args = parser.parse_args()
+    LivePoller.run(max_minutes=args.max_minutes)
@@ -27,6 +27,17 @@ class ModelService:
                 print(f"⚠️ 모델 파일을 찾을 수 없습니다: {MODEL_PATH}")
         return cls._model
 
+    @staticmethod
+    def get_model_version() -> str:
+        """
+        현재 모델 파일의 버전 문자열을 반환합니다.
+        재학습 시 파일이 교체되므로 수정 시각(mtime)을 버전으로 사용합니다.
+        """
+        if not os.path.exists(MODEL_PATH):
+            return "none"
+        mtime = datetime.fromtimestamp(os.path.getmtime(MODEL_PATH))
+        return f"lgbm-{mtime.strftime('%Y%m%d%H%M%S')}"
+
     @classmethod
     def retrain_model(cls):
         """모델을 재학습하고 메모리의 모델 객체를 갱신합니다."""
@@ -0,0 +1,113 @@
+# backend/services/page_archive.py
+"""
+크롤러 원본 페이지 아카이브
+
+Daum Sports에서 새로 받은(200 응답) 월별 일정 페이지를 DB에 보관합니다.
+- crawler_page_blobs: 본문을 gzip으로 압축해 sha256 내용 해시 기준으로 한 번만 저장 (동일 페이지 중복 제거)
+- crawler_page_archive: (월, 수집 시각) → sha256 인덱스. 같은 월의 직전 페이지와 내용이 같으면 기록하지 않음
+
+테이블은 init_db.sql 3.3에서 생성합니다.
+파서가 바뀌면 stack_service/reingest_archive.py로 재수집 없이 전체 아카이브를 다시 적재할 수 있습니다.
+"""
+import gzip
+import os
+from datetime import date, datetime
+from sqlalchemy import text
+
+from config import engine
+
+# "false"로 설정하면 페이지를 보관하지 않음
+PAGE_ARCHIVE_ENABLED = os.getenv("CRAWLER_PAGE_ARCHIVE", "true").lower() in ["true", "1", "yes"]
+
+
+class PageArchive:
+    @staticmethod
+    def _month_of(target_date: date) -> date:
+        return date(target_date.year, target_date.month, 1)
+
+    @classmethod
+    def store(cls, target_date: date, body: str, digest: str, fetched_at: datetime = None) -> bool:
+        """
+        target_date가 속한 월의 페이지를 보관합니다.
+        크롤링을 방해하지 않도록 오류는 로그만 남깁니다.
+
+        Args:
+            target_date: 페이지 요청 기준일
+            body: HTML 본문
+            digest: 본문의 sha256 (DaumPageCache.digest)
+            fetched_at: 수집 시각 (기본값: 현재)
+
+        Returns:
+            bool: 인덱스에 새로 기록되었으면 True (직전 페이지와 동일하면 False)
+        """
+        if not PAGE_ARCHIVE_ENABLED:
+            return False
+        try:
+            raw = body.encode("utf-8")
+            with engine.begin() as conn:
+                conn.execute(text("""
+                    INSERT INTO crawler_page_blobs (sha256, body, raw_size)
+                    VALUES (:sha256, :body, :raw_size)
+                    ON CONFLICT (sha256) DO NOTHING
+                """), {"sha256": digest, "body": gzip.compress(raw), "raw_size": len(raw)})
+                # 같은 월의 가장 최근 페이지와 내용이 다를 때만 인덱스에 추가
+                inserted = conn.execute(text("""
+                    INSERT INTO crawler_page_archive (page_month, fetched_at, sha256)
+                    SELECT :page_month, :fetched_at, :sha256
+                    WHERE :sha256 IS DISTINCT FROM (
+                        SELECT sha256 FROM crawler_page_archive
+                        WHERE page_month = :page_month
+                        ORDER BY fetched_at DESC
+                        LIMIT 1
+                    )
+                    ON CONFLICT (page_month, fetched_at) DO NOTHING
+                """), {
+                    "page_month": cls._month_of(target_date),
+                    "fetched_at": fetched_at or datetime.now(),
+                    "sha256": digest,
+                }).rowcount
+            if inserted:
+                print(f"🗄️ [Archive] {target_date.year}-{target_date.month:02d} 페이지 보관 ({digest[:12]})")
+            return bool(inserted)
+        except Exception as e:
+            print(f"⚠️ [Archive] 페이지 보관 실패 ({target_date}): {e}")
+            return False
+
+    @classmethod
+    def list_pages(cls, start_month: date = None, end_month: date = None, latest_only: bool = True) -> list:
+        """
+        아카이브 인덱스를 조회합니다.
+
+        Args:
+            start_month, end_month: 조회할 월 범위 (포함, None이면 제한 없음)
+            latest_only: True면 월별로 가장 최근 페이지만 반환
+
+        Returns:
+            list[dict]: [{"page_month", "fetched_at", "sha256"}] (월, 수집 시각 오름차순)
+        """
+        distinct = "DISTINCT ON (page_month)" if latest_only else ""
+        order = "page_month, fetched_at DESC" if latest_only else "page_month, fetched_at"
+        with engine.connect() as conn:
+            rows = conn.execute(text(f"""
+                SELECT {distinct} page_month, fetched_at, sha256
+                FROM crawler_page_archive
+                WHERE (CAST(:start_month AS DATE) IS NULL OR page_month >= :start_month)
+                  AND (CAST(:end_month AS DATE) IS NULL OR page_month <= :end_month)
+                ORDER BY {order}
+            """), {
+                "start_month": cls._month_of(start_month) if start_month else None,
+                "end_month": cls._month_of(end_month) if end_month else None,
+            }).mappings().all()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def load_blobs(digests: list) -> dict:
+        """sha256 목록에 해당하는 압축 본문을 {sha256: gzip bytes}로 반환합니다."""
+        if not digests:
+            return {}
+        with engine.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT sha256, body FROM crawler_page_blobs
+                WHERE sha256 = ANY(:digests)
+            """), {"digests": list(digests)}).fetchall()
+        return {row.sha256: bytes(row.body) for row in rows}
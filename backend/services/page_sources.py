@@ -0,0 +1,104 @@
+# backend/services/page_sources.py
+"""
+Daum Sports 일정 페이지 소스
+
+CrawlerService는 기본적으로 Daum Sports에서 페이지를 가져오지만,
+source 인자로 아래 소스를 넘기면 같은 파싱/UPSERT 경로를 오프라인으로 재실행(replay)할 수 있습니다.
+
+소스 인터페이스:
+    fetch(target_date) -> (html, digest)   # 해당 월 페이지가 없으면 (None, None)
+"""
+import gzip
+import os
+import re
+from datetime import datetime
+
+from services.daum_page_cache import DaumPageCache
+
+# 페이지에 포함된 조회 구간 (예: <input ... name="param_fromDate" value="20260501">)
+_FROM_DATE_RE = re.compile(r'name="param_fromDate"\s+value="(\d{8})"')
+# 파일명에 포함된 기준일 (예: daumsports_20250511.html)
+_FILENAME_DATE_RE = re.compile(r"(\d{8})")
+# 조회 구간 정보가 없을 때 사용할 첫 경기 날짜
+_ROW_DATE_RE = re.compile(r'<tr[^>]*data-date="(\d{8})"')
+
+
+class ArchivedPageSource:
+    """
+    저장해 둔 Daum 일정 HTML 파일 디렉터리를 페이지 소스로 사용합니다.
+    각 파일이 담고 있는 월은 페이지의 param_fromDate → 파일명 날짜 → 첫 경기 날짜 순으로 판별하며,
+    같은 월의 파일이 여러 개면 파일명 날짜(없으면 수정 시각)가 가장 늦은 파일을 사용합니다.
+
+    사용 예:
+        source = ArchivedPageSource("../")   # daumsports.html, daumsports_20250511.html
+        CrawlerService.update_daily_pipeline(source=source)
+    """
+
+    def __init__(self, directory: str):
+        if not os.path.isdir(directory):
+            raise ValueError(f"아카이브 디렉터리를 찾을 수 없습니다: {directory}")
+        self.directory = directory
+        self._files = self._scan()
+        self._bodies = {}
+
+    @staticmethod
+    def _read(path: str) -> str:
+        if path.endswith(".gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return f.read()
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    @classmethod
+    def _detect_month(cls, path: str, html: str):
+        """파일이 담고 있는 (연도, 월)을 판별합니다."""
+        for pattern, text_value in (
+            (_FROM_DATE_RE, html),
+            (_FILENAME_DATE_RE, os.path.basename(path)),
+            (_ROW_DATE_RE, html),
+        ):
+            match = pattern.search(text_value)
+            if match:
+                try:
+                    parsed = datetime.strptime(match.group(1), "%Y%m%d")
+                    return parsed.year, parsed.month
+                except ValueError:
+                    continue
+        return None
+
+    def _scan(self) -> dict:
+        """디렉터리의 HTML 파일을 (연도, 월) → 파일 경로로 매핑합니다."""
+        candidates = {}
+        for name in sorted(os.listdir(self.directory)):
+            if not (name.endswith(".html") or name.endswith(".html.gz")):
+                continue
+            path = os.path.join(self.directory, name)
+            month = self._detect_month(path, self._read(path))
+            if not month:
+                print(f"⚠️ [Replay] 월을 판별할 수 없어 제외합니다: {name}")
+                continue
+            name_date = _FILENAME_DATE_RE.search(name)
+            rank = (name_date.group(1) if name_date else "", os.path.getmtime(path))
+            if month not in candidates or rank > candidates[month][0]:
+                candidates[month] = (rank, path)
+        return {month: path for month, (_, path) in candidates.items()}
+
+    def months(self) -> list:
+        """아카이브에 있는 (연도, 월) 목록"""
+        return sorted(self._files)
+
+    def path(self, year: int, month: int) -> str | None:
+        """(연도, 월) 페이지로 사용하는 파일 경로"""
+        return self._files.get((year, month))
+
+    def fetch(self, target_date):
+        """target_date가 속한 월의 저장된 페이지를 반환합니다."""
+        path = self._files.get((target_date.year, target_date.month))
+        if not path:
+            print(f"⚠️ [Replay] {target_date.year}-{target_date.month:02d} 페이지가 아카이브에 없습니다.")
+            return None, None
+        if path not in self._bodies:
+            body = self._read(path)
+            self._bodies[path] = (body, DaumPageCache.digest(body))
+        print(f"📂 [Replay] {os.path.basename(path)} 사용 (기준일: {target_date})")
+        return self._bodies[path]
@@ -0,0 +1,237 @@
+# backend/services/quiz_pool.py
+"""
+퀴즈 출제 풀 (API 프로세스 인메모리)
+
+samfan_quizzes 전체를 프로세스 안에 캐시하고 난이도별 퀴즈 id 목록을 유지합니다.
+- 랜덤 출제: ORDER BY RANDOM() 전체 정렬 대신 id 목록에서 O(1)로 뽑아 캐시에서 반환
+- 정답 채점: submit에서 정답/난이도를 DB 조회 없이 캐시에서 확인
+
+새 퀴즈 반영:
+- 같은 프로세스의 WeeklyQuizMaker.save_quizzes는 저장 직후 refresh(force=True)를 호출
+- 다른 프로세스(stack_service/quizmaker.py, 일일 파이프라인)가 추가한 퀴즈는
+  QUIZ_POOL_REFRESH_SECONDS마다 마지막으로 읽은 id 이후만 PK 범위로 읽어 반영
+- 캐시에 없는 id로 채점 요청이 오면 PK로 바로 조회하여 추가
+
+유저별 안 푼 퀴즈 출제:
+- SeenQuizzes가 유저가 푼 퀴즈를 quiz_id 비트맵(bytearray)으로 유지 (처음 조회 시 user_quizzes에서 1회 로드, 제출 시 갱신)
+- pick(user_id=...)은 난이도별 id 목록에서 무작위로 뽑아 비트맵으로 확인 (대부분 몇 번 안에 안 푼 퀴즈를 찾음)
+"""
+import random
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import text
+
+from config import engine
+
+QUIZ_DIFFICULTIES = ("easy", "medium", "hard")
+QUIZ_POOL_REFRESH_SECONDS = 60   # 다른 프로세스가 추가한 퀴즈 확인 주기
+UNSEEN_SAMPLE_ATTEMPTS = 16      # 무작위 추출로 안 푼 퀴즈를 찾는 최대 시도 횟수 (실패 시 목록 전체에서 찾음)
+SEEN_CACHE_MAX_USERS = 10000     # 메모리에 유지할 유저 비트맵 수 (LRU)
+SEEN_CACHE_TTL_SECONDS = 600     # 비트맵 재로드 주기 (다른 워커 프로세스의 제출 반영)
+
+
+class SeenQuizzes:
+    """유저별로 푼 퀴즈를 quiz_id 비트맵으로 관리합니다. (퀴즈 1,000개당 약 125바이트)"""
+    _lock = threading.Lock()
+    _bitmaps = OrderedDict()    # user_id -> (bytearray, 로드 시각)
+
+    @staticmethod
+    def _set(bitmap: bytearray, quiz_id: int):
+        byte = quiz_id >> 3
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte + 1 - len(bitmap)))
+        bitmap[byte] |= 1 << (quiz_id & 7)
+
+    @staticmethod
+    def contains(bitmap: bytearray, quiz_id: int) -> bool:
+        byte = quiz_id >> 3
+        return byte < len(bitmap) and bool(bitmap[byte] & (1 << (quiz_id & 7)))
+
+    @classmethod
+    def _load(cls, user_id: str) -> bytearray:
+        bitmap = bytearray()
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT DISTINCT quiz_id FROM user_quizzes WHERE user_id = :uid"),
+                {"uid": user_id}
+            ).fetchall()
+        for row in rows:
+            cls._set(bitmap, row.quiz_id)
+        return bitmap
+
+    @classmethod
+    def get(cls, user_id: str) -> bytearray:
+        """유저의 비트맵을 반환합니다. 없거나 오래되었으면 user_quizzes에서 다시 읽습니다."""
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._bitmaps.get(user_id)
+            if entry and now - entry[1] < SEEN_CACHE_TTL_SECONDS:
+                cls._bitmaps.move_to_end(user_id)
+                return entry[0]
+        bitmap = cls._load(user_id)
+        with cls._lock:
+            cls._bitmaps[user_id] = (bitmap, now)
+            cls._bitmaps.move_to_end(user_id)
+            while len(cls._bitmaps) > SEEN_CACHE_MAX_USERS:
+                cls._bitmaps.popitem(last=False)
+        return bitmap
+
+    @classmethod
+    def mark(cls, user_id: str, quiz_ids: list):
+        """제출이 커밋된 뒤 호출합니다. 비트맵이 메모리에 없으면 다음 조회 때 DB에서 함께 로드됩니다."""
+        with cls._lock:
+            entry = cls._bitmaps.get(user_id)
+            if entry:
+                for quiz_id in quiz_ids:
+                    cls._set(entry[0], quiz_id)
+
+
+class QuizPool:
+    _lock = threading.RLock()
+    _quizzes = {}        # quiz_id -> 퀴즈 dict (정답 포함)
+    _pools = {}          # difficulty -> [quiz_id, ...]
+    _all_ids = []        # 전체 quiz_id
+    _last_id = 0         # 증분 조회로 지금까지 읽은 가장 큰 id
+    _checked_at = 0.0    # 마지막 증분 확인 시각 (monotonic)
+
+    @staticmethod
+    def _to_quiz(row) -> dict:
+        difficulty = (row.get("difficulty") or "").lower()
+        return {
+            "id": row["id"],
+            "question": row["question"],
+            "options": row["options"],
+            "correct_answer": row["correct_answer"],
+            "difficulty": difficulty,
+            "explanation": row.get("explanation"),
+            "source_hint": row.get("source_hint"),
+        }
+
+    @classmethod
+    def _add(cls, quiz: dict):
+        if quiz["id"] in cls._quizzes:
+            cls._quizzes[quiz["id"]] = quiz
+            return
+        cls._quizzes[quiz["id"]] = quiz
+        cls._all_ids.append(quiz["id"])
+        cls._pools.setdefault(quiz["difficulty"], []).append(quiz["id"])
+
+    @classmethod
+    def refresh(cls, force: bool = False) -> int:
+        """
+        마지막으로 읽은 id 이후에 추가된 퀴즈를 읽어 풀에 반영합니다.
+        force가 아니면 QUIZ_POOL_REFRESH_SECONDS 안에 다시 호출되어도 DB를 조회하지 않습니다.
+
+        Returns:
+            int: 새로 추가된 퀴즈 수
+        """
+        now = time.monotonic()
+        if not force and now - cls._checked_at < QUIZ_POOL_REFRESH_SECONDS:
+            return 0
+        with cls._lock:
+            if not force and now - cls._checked_at < QUIZ_POOL_REFRESH_SECONDS:
+                return 0
+            with engine.connect() as conn:
+                # 배포 DB마다 부가 컬럼(source_hint 등)이 다를 수 있어 전체 컬럼을 읽음
+                rows = conn.execute(text("""
+                    SELECT * FROM samfan_quizzes
+                    WHERE id > :last_id
+                    ORDER BY id
+                """), {"last_id": cls._last_id}).mappings().all()
+            for row in rows:
+                cls._add(cls._to_quiz(row))
+            if rows:
+                cls._last_id = rows[-1]["id"]
+            cls._checked_at = time.monotonic()
+        if rows:
+            print(f"🧩 [QuizPool] 퀴즈 {len(rows)}개 추가 (총 {len(cls._quizzes)}개)")
+        return len(rows)
+
+    @classmethod
+    def reload(cls) -> int:
+        """풀을 비우고 전체를 다시 읽습니다. (퀴즈 삭제/수정 반영용)"""
+        with cls._lock:
+            cls._quizzes, cls._pools, cls._all_ids = {}, {}, []
+            cls._last_id = 0
+            return cls.refresh(force=True)
+
+    @classmethod
+    def pick(cls, difficulty: str = None, user_id: str = None):
+        """
+        랜덤 퀴즈 1개를 반환합니다. (difficulty 생략 시 전체에서, 없으면 None)
+        user_id를 주면 그 유저가 아직 풀지 않은 퀴즈를 우선 반환하고, 모두 풀었으면 아무 퀴즈나 반환합니다.
+        """
+        cls.refresh()
+        seen = SeenQuizzes.get(user_id) if user_id else None
+        with cls._lock:
+            ids = cls._pools.get(difficulty) if difficulty else cls._all_ids
+            if not ids:
+                return None
+            if seen:
+                for _ in range(UNSEEN_SAMPLE_ATTEMPTS):
+                    quiz_id = random.choice(ids)
+                    if not SeenQuizzes.contains(seen, quiz_id):
+                        return cls._quizzes[quiz_id]
+                # 대부분 푼 유저: 안 푼 퀴즈만 골라서 추출
+                unseen = [quiz_id for quiz_id in ids if not SeenQuizzes.contains(seen, quiz_id)]
+                if unseen:
+                    return cls._quizzes[random.choice(unseen)]
+            return cls._quizzes[random.choice(ids)]
+
+    @classmethod
+    def pick_many(cls, n: int, difficulty: str = None, user_id: str = None) -> list:
+        """
+        서로 다른 랜덤 퀴즈 최대 n개를 반환합니다.
+        user_id를 주면 안 푼 퀴즈를 먼저 채우고, 모자라면 이미 푼 퀴즈로 채웁니다.
+        """
+        cls.refresh()
+        seen = SeenQuizzes.get(user_id) if user_id else None
+        with cls._lock:
+            ids = cls._pools.get(difficulty, []) if difficulty else cls._all_ids
+            if n <= 0 or not ids:
+                return []
+            chosen = set()
+            if seen:
+                for _ in range(UNSEEN_SAMPLE_ATTEMPTS * n):
+                    if len(chosen) >= n:
+                        break
+                    quiz_id = random.choice(ids)
+                    if not SeenQuizzes.contains(seen, quiz_id):
+                        chosen.add(quiz_id)
+                if len(chosen) < n:
+                    unseen = [i for i in ids if i not in chosen and not SeenQuizzes.contains(seen, i)]
+                    chosen.update(random.sample(unseen, min(n - len(chosen), len(unseen))))
+            if len(chosen) < n:
+                rest = [i for i in ids if i not in chosen] if chosen else ids
+                chosen.update(random.sample(rest, min(n - len(chosen), len(rest))))
+            return [cls._quizzes[quiz_id] for quiz_id in chosen]
+
+    @classmethod
+    def get(cls, quiz_id: int):
+        """퀴즈 1개를 반환합니다. 캐시에 없으면 PK로 조회하여 추가합니다. (없는 id면 None)"""
+        quiz = cls._quizzes.get(quiz_id)
+        if quiz is not None:
+            return quiz
+        with engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT * FROM samfan_quizzes WHERE id = :id"),
+                {"id": quiz_id}
+            ).mappings().fetchone()
+        if not row:
+            return None
+        quiz = cls._to_quiz(row)
+        with cls._lock:
+            cls._add(quiz)
+        return quiz
+
+    @staticmethod
+    def public(quiz: dict) -> dict:
+        """정답/해설을 제외한 출제용 필드만 반환합니다."""
+        return {
+            "id": quiz["id"],
+            "question": quiz["question"],
+            "options": quiz["options"],
+            "difficulty": quiz["difficulty"],
+            "source_hint": quiz["source_hint"],
+        }
@@ -0,0 +1,46 @@
+# backend/services/quiz_quota.py
+"""
+하루 퀴즈 참여 횟수 제한 카운터
+
+(user_id, quiz_date)별 사용 횟수를 user_quiz_quota 한 행에 두고,
+제한 확인과 증가를 INSERT ... ON CONFLICT DO UPDATE ... WHERE 한 문장으로 처리합니다.
+- 제출마다 user_quizzes를 COUNT(*)하지 않음
+- 같은 유저의 동시 제출은 행 잠금으로 직렬화되어 제한을 넘길 수 없음
+- 호출자 트랜잭션 안에서 실행하므로 제출이 롤백되면 사용 횟수도 함께 롤백됨
+- 테이블은 init_db.sql 2.3.1에서 생성
+"""
+from sqlalchemy import text
+
+DAILY_QUIZ_LIMIT = 5
+
+
+class QuizQuota:
+    @staticmethod
+    def consume(conn, user_id: str, quiz_date, count: int = 1, limit: int = DAILY_QUIZ_LIMIT):
+        """
+        사용 횟수를 count만큼 늘립니다. 늘린 뒤 limit을 넘으면 아무것도 바꾸지 않습니다.
+
+        Args:
+            conn: 호출자 트랜잭션 connection
+
+        Returns:
+            int | None: 증가 후 사용 횟수 (제한 초과면 None)
+        """
+        return conn.execute(text("""
+            INSERT INTO user_quiz_quota (user_id, quiz_date, used)
+            SELECT :uid, :quiz_date, :count
+            WHERE :count <= :limit
+            ON CONFLICT (user_id, quiz_date) DO UPDATE
+                SET used = user_quiz_quota.used + EXCLUDED.used,
+                    updated_at = NOW()
+                WHERE user_quiz_quota.used + EXCLUDED.used <= :limit
+            RETURNING used
+        """), {"uid": user_id, "quiz_date": quiz_date, "count": count, "limit": limit}).scalar()
+
+    @staticmethod
+    def used(conn, user_id: str, quiz_date) -> int:
+        """현재 사용 횟수를 반환합니다. (제한 초과 안내용)"""
+        return conn.execute(
+            text("SELECT used FROM user_quiz_quota WHERE user_id = :uid AND quiz_date = :quiz_date"),
+            {"uid": user_id, "quiz_date": quiz_date}
+        ).scalar() or 0
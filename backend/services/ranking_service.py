@@ -6,10 +6,14 @@ Firebase Firestore 의존성을 제거하고 Supabase(PostgreSQL)로 통합합
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import text
 from datetime import datetime, timedelta
+import base64
+import json
 import logging
 
 from config import engine, CURRENT_DATE
-from supabase_config import upsert_user_score, get_user_rankings, reset_weekly_scores
+from supabase_config import upsert_user_score, reset_weekly_scores
+from services.leaderboard_index import LeaderboardIndex, SCORE_TYPES
+from services.crowd_picks import CrowdPicks
 
 router = APIRouter(prefix="/api/ranking", tags=["ranking"])
 logger = logging.getLogger(__name__)
@@ -25,83 +29,165 @@ SCORE_POLICY = {
     }
 }
 
+RANKING_PAGE_MAX = 100      # 페이지당 최대 인원
+RANKING_WINDOW_MAX = 50     # 유저 주변 조회 시 위/아래 최대 인원
+
+
+def _encode_cursor(score: int, user_id: str, rank: int, position: int) -> str:
+    """페이지 마지막 행의 (점수, user_id)와 순위 정보를 불투명한 커서 문자열로 만듭니다."""
+    raw = json.dumps({"s": score, "u": user_id, "r": rank, "p": position}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return {"s": int(data["s"]), "u": str(data["u"]), "r": int(data["r"]), "p": int(data["p"])}
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
 
 class RankingService:
     @staticmethod
     def settle_daily_points(target_date):
         """
         AI 예측 결과와 비교하여 유저 점수를 정산합니다.
-        Firestore 대신 Supabase user_profiles 테이블에 점수를 기록합니다.
+        하나의 SQL 문으로 처리합니다.
+        1. user_predictions를 kbo_games / ai_predictions와 조인하여 is_correct, points_earned를 기록
+        2. 유저별 합계를 apply_score_deltas로 user_profiles.prediction_score에 더함
+        3. 유저별 적중/AI 상대 승리 수와 연속 적중 상태를 user_prediction_stats에 증분 반영
+        아직 정산되지 않은 예측(is_correct IS NULL)만 대상으로 하므로, 같은 날짜를 다시 정산해도
+        (라이브 폴링 후 새벽 파이프라인 등) 점수가 중복 반영되지 않습니다.
         """
-        with engine.connect() as conn:
-            # 1. 경기 결과 + AI 예측 결과 한 번에 가져오기 (JOIN 사용)
-            query = text(f"""
+        with engine.begin() as conn:
+            row = conn.execute(text("""
+                WITH settled AS (
+                    UPDATE user_predictions up
+                    SET is_correct = (up.predicted_winner = g.winning_team),
+                        points_earned = CASE
+                            WHEN up.predicted_winner <> g.winning_team THEN 0
+                            -- 🚀 [가산점] AI가 틀렸는데(또는 예측이 없는데) 유저가 맞춘 경우
+                            WHEN a.predicted_winner IS DISTINCT FROM g.winning_team THEN :upset_points
+                            ELSE :base_points
+                        END
+                    FROM kbo_games g
+                    LEFT JOIN ai_predictions a ON a.game_id = g.game_id
+                    WHERE up.game_id = g.game_id
+                      AND g.game_date = :target_date
+                      AND g.winning_team IS NOT NULL
+                      AND g.winning_team != '무승부'
+                      AND up.is_correct IS NULL
+                    RETURNING up.user_id, up.game_id, up.is_correct, up.points_earned,
+                              (a.predicted_winner IS DISTINCT FROM g.winning_team) AS ai_missed
+                ),
+                ordered AS (
+                    -- 같은 날 여러 경기는 game_id 순으로 이어서 연속 적중을 계산 (run_id: 연속 구간 번호)
+                    SELECT user_id, is_correct, ai_missed,
+                           ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY game_id) AS rn,
+                           ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY game_id)
+                             - ROW_NUMBER() OVER (PARTITION BY user_id, is_correct ORDER BY game_id) AS run_id
+                    FROM settled
+                ),
+                runs AS (
+                    SELECT user_id, MIN(rn) AS first_rn, MAX(rn) AS last_rn, COUNT(*) AS len
+                    FROM ordered
+                    WHERE is_correct
+                    GROUP BY user_id, run_id
+                ),
+                day_stats AS (
+                    -- head_run: 첫 경기부터 이어진 적중 (이전 연속 적중에 이어짐), tail_run: 마지막 경기까지 이어진 적중
+                    SELECT d.user_id, d.total, d.correct, d.beat_ai,
+                           COALESCE(MAX(r.len) FILTER (WHERE r.first_rn = 1), 0) AS head_run,
+                           COALESCE(MAX(r.len) FILTER (WHERE r.last_rn = d.total), 0) AS tail_run,
+                           COALESCE(MAX(r.len), 0) AS max_run
+                    FROM (
+                        SELECT user_id, COUNT(*) AS total,
+                               COUNT(*) FILTER (WHERE is_correct) AS correct,
+                               COUNT(*) FILTER (WHERE is_correct AND ai_missed) AS beat_ai
+                        FROM ordered
+                        GROUP BY user_id
+                    ) d
+                    LEFT JOIN runs r ON r.user_id = d.user_id
+                    GROUP BY d.user_id, d.total, d.correct, d.beat_ai
+                ),
+                prev AS (
+                    SELECT s.user_id, s.current_streak, s.best_streak
+                    FROM user_prediction_stats s
+                    JOIN day_stats d ON d.user_id = s.user_id
+                    FOR UPDATE OF s
+                ),
+                stats AS (
+                    INSERT INTO user_prediction_stats AS s
+                        (user_id, total_predictions, correct_predictions, beat_ai,
+                         current_streak, best_streak, last_settled_date)
+                    SELECT d.user_id, d.total, d.correct, d.beat_ai,
+                           CASE WHEN d.correct = d.total THEN COALESCE(p.current_streak, 0) + d.total
+                                ELSE d.tail_run END,
+                           GREATEST(COALESCE(p.best_streak, 0), COALESCE(p.current_streak, 0) + d.head_run, d.max_run),
+                           :target_date
+                    FROM day_stats d
+                    LEFT JOIN prev p ON p.user_id = d.user_id
+                    ON CONFLICT (user_id) DO UPDATE SET
+                        total_predictions = s.total_predictions + EXCLUDED.total_predictions,
+                        correct_predictions = s.correct_predictions + EXCLUDED.correct_predictions,
+                        beat_ai = s.beat_ai + EXCLUDED.beat_ai,
+                        current_streak = EXCLUDED.current_streak,
+                        best_streak = GREATEST(s.best_streak, EXCLUDED.best_streak),
+                        last_settled_date = GREATEST(s.last_settled_date, EXCLUDED.last_settled_date),
+                        updated_at = NOW()
+                    RETURNING s.user_id
+                ),
+                totals AS (
+                    SELECT user_id, SUM(points_earned) AS points
+                    FROM settled
+                    GROUP BY user_id
+                    HAVING SUM(points_earned) > 0
+                ),
+                profiles AS (
+                    -- 유저별 합계를 원자적 일괄 증가 함수로 반영 (init_db.sql apply_score_deltas)
+                    SELECT apply_score_deltas(COALESCE(
+                        jsonb_agg(jsonb_build_object(
+                            'user_id', user_id,
+                            'score_type', 'prediction_score',
+                            'delta', points,
+                            'source', 'prediction'
+                        )),
+                        '[]'::jsonb
+                    )) AS updated_users
+                    FROM totals
+                )
                 SELECT
-                    g.game_id,
-                    g.winning_team,
-                    a.predicted_winner as ai_pick
-                FROM kbo_games g
-                LEFT JOIN ai_predictions a ON g.game_id = a.game_id
-                WHERE g.game_date = :target_date
-                  AND g.winning_team IS NOT NULL
-                  AND g.winning_team != '무승부'
-            """)
-            results = conn.execute(query, {"target_date": target_date}).fetchall()
-            
-            if not results:
-                return {"status": "skipped", "message": "정산할 결과 없음"}
-
-            # 정답지 생성: {game_id: {"winner": "삼성", "ai_wrong": True/False}}
-            truth_table = {}
-            for r in results:
-                truth_table[r.game_id] = {
-                    "winner": r.winning_team,
-                    "ai_wrong": r.ai_pick != r.winning_team
-                }
-
-            # 2. 유저들의 모든 예측 데이터 가져오기
-            game_ids = tuple(truth_table.keys())
-            if not game_ids:
-                return {"status": "skipped", "message": "정산할 game_ids가 없습니다."}
-            user_preds = conn.execute(text("""
-                SELECT user_id, game_id, predicted_winner
-                FROM user_predictions
-                WHERE game_id IN :game_ids
-            """), {"game_ids": game_ids}).fetchall()
-
-            # 3. 점수 계산 로직 (AI vs 인간 대결 반영)
-            user_points = {}
-            for row in user_preds:
-                truth = truth_table.get(row.game_id)
-                if not truth:
-                    continue
-
-                # 유저가 맞췄을 경우
-                if row.predicted_winner == truth["winner"]:
-                    points = SCORE_POLICY["PREDICTION_BASE"]
-                    # 🚀 [가산점] AI가 틀렸는데 유저가 맞췄다면?
-                    if truth["ai_wrong"]:
-                        points = SCORE_POLICY["PREDICTION_AI_UPSET"]
-                    
-                    user_points[row.user_id] = user_points.get(row.user_id, 0) + points
-
-            # 4. Supabase에 점수 반영 (Firestore 대체)
-            if user_points:
-                for uid, points in user_points.items():
-                    # user_profiles 테이블에서 닉네임 조회
-                    nickname = conn.execute(
-                        text("SELECT nickname FROM user_profiles WHERE user_id = :uid"),
-                        {"uid": uid}
-                    ).scalar() or uid[:8]
-                    
-                    upsert_user_score(
-                        user_id=uid,
-                        nickname=nickname,
-                        score_earned=points,
-                        score_type="prediction_score"
-                    )
-
-            return {"status": "ok", "updated_users": len(user_points)}
+                    (SELECT COUNT(*) FROM settled) AS settled_predictions,
+                    (SELECT updated_users FROM profiles) AS updated_users,
+                    (SELECT COUNT(*) FROM stats) AS updated_stats,
+                    (SELECT COALESCE(SUM(points), 0) FROM totals) AS total_points,
+                    (SELECT COALESCE(jsonb_agg(jsonb_build_object('user_id', user_id, 'points', points)), '[]'::jsonb)
+                     FROM totals) AS deltas
+            """), {
+                "target_date": target_date,
+                "base_points": SCORE_POLICY["PREDICTION_BASE"],
+                "upset_points": SCORE_POLICY["PREDICTION_AI_UPSET"],
+            }).fetchone()
+            # 같은 트랜잭션에서 경기별 최종 팬 예측 집계 저장 (팬 vs AI 적중률 통계용)
+            CrowdPicks.snapshot(conn, target_date)
+
+        if not row.settled_predictions:
+            return {"status": "skipped", "message": "정산할 예측 없음"}
+
+        # 커밋된 정산 결과를 리더보드 인덱스에 반영 (API 프로세스 밖에서 실행되면 주기적 재동기화가 반영)
+        LeaderboardIndex.apply_events([
+            {"user_id": d["user_id"], "score_type": "prediction_score", "delta": d["points"]}
+            for d in row.deltas
+        ])
+
+        return {
+            "status": "ok",
+            "settled_predictions": row.settled_predictions,
+            "updated_users": row.updated_users,
+            "updated_stats": row.updated_stats,
+            "total_points": int(row.total_points),
+        }
 
     @staticmethod
     def add_quiz_score(user_id: str, difficulty: str, nickname: str = "익명"):
@@ -123,24 +209,288 @@ class RankingService:
         return {"status": "ok", "earned_points": points}
 
     @staticmethod
-    def reset_weekly_ranking():
-        """주간 랭킹 초기화 (매주 월요일 0시 호출용)"""
-        success = reset_weekly_scores()
+    def reset_weekly_ranking(week_start=None):
+        """
+        주간 랭킹 초기화 (매주 월요일 0시 호출용)
+        점수 원장의 현재 주를 week_start가 속한 주로 전환합니다. (기본값: CURRENT_DATE)
+        """
+        week_start = week_start or CURRENT_DATE
+        week_start = week_start - timedelta(days=week_start.weekday())
+        success = reset_weekly_scores(week_start)
         if not success:
             raise HTTPException(status_code=500, detail="주간 점수 초기화 실패")
-        return {"status": "reset_done"}
+        LeaderboardIndex.reset_score_type("weekly_score")
+        return {"status": "reset_done", "week_start": week_start.isoformat()}
+
+    @staticmethod
+    def get_weekly_ranking(week_start=None, limit: int = 10, score_type: str = "weekly_score"):
+        """
+        주간 집계(score_weekly_totals)로 특정 주의 랭킹을 조회합니다. (기본값: 현재 주)
+        지난 주 랭킹도 주간 초기화 이후 그대로 조회됩니다.
+        """
+        with engine.connect() as conn:
+            if week_start is None:
+                week_start = conn.execute(text("SELECT current_week FROM score_ledger_state")).scalar()
+                if week_start is None:
+                    return {"week_start": None, "rankings": []}
+            else:
+                week_start = week_start - timedelta(days=week_start.weekday())
+
+            # score_type은 호출 전에 SCORE_TYPES로 검증된 컬럼명
+            rows = conn.execute(text(f"""
+                SELECT w.user_id, COALESCE(p.nickname, '익명') AS nickname,
+                       w.weekly_score, w.prediction_score, w.quiz_score,
+                       RANK() OVER (ORDER BY w.{score_type} DESC) AS rank
+                FROM score_weekly_totals w
+                LEFT JOIN user_profiles p ON p.user_id = w.user_id
+                WHERE w.week_start = :week_start
+                ORDER BY w.{score_type} DESC, w.user_id DESC
+                LIMIT :limit
+            """), {"week_start": week_start, "limit": limit}).mappings().all()
+
+        return {"week_start": week_start.isoformat(), "rankings": [dict(row) for row in rows]}
+
+
+    @staticmethod
+    def get_prediction_stats(user_id: str):
+        """유저의 예측 통계를 user_prediction_stats 한 행으로 조회합니다. (정산 이력이 없으면 None)"""
+        with engine.connect() as conn:
+            row = conn.execute(text("""
+                SELECT user_id, total_predictions, correct_predictions, beat_ai,
+                       current_streak, best_streak, last_settled_date
+                FROM user_prediction_stats
+                WHERE user_id = :uid
+            """), {"uid": user_id}).mappings().fetchone()
+        if not row:
+            return None
+        stats = dict(row)
+        stats["accuracy"] = round(row["correct_predictions"] / row["total_predictions"] * 100, 1) if row["total_predictions"] else None
+        stats["last_settled_date"] = row["last_settled_date"].isoformat() if row["last_settled_date"] else None
+        return stats
+
+    @staticmethod
+    def _ranking_source(conn, score_type: str) -> dict:
+        """
+        키셋 페이지네이션용 조회 대상을 만듭니다.
+        weekly_score는 현재 주의 주간 집계(score_weekly_totals), 나머지는 user_profiles의 누적 점수가 기준입니다.
+        정렬은 (점수 DESC, user_id DESC)이며 각 인덱스를 역방향으로 읽습니다. (init_db.sql 6. 인덱스)
+        """
+        week = conn.execute(text("SELECT current_week FROM score_ledger_state")).scalar()
+        if score_type == "weekly_score":
+            return {
+                "from": """score_weekly_totals w
+                    LEFT JOIN user_profiles p ON p.user_id = w.user_id""",
+                "where": "w.week_start = :week",
+                "score": "w.weekly_score",
+                "uid": "w.user_id",
+                "week": week,
+            }
+        # score_type은 호출 전에 SCORE_TYPES로 검증된 컬럼명
+        return {
+            "from": """user_profiles p
+                LEFT JOIN score_weekly_totals w ON w.user_id = p.user_id AND w.week_start = :week""",
+            "where": f"p.{score_type} IS NOT NULL",
+            "score": f"p.{score_type}",
+            "uid": "p.user_id",
+            "week": week,
+        }
+
+    @staticmethod
+    def _select_rows(conn, src: dict, condition: str, params: dict, limit: int, ascending: bool = False) -> list:
+        direction = "ASC" if ascending else "DESC"
+        rows = conn.execute(text(f"""
+            SELECT {src["uid"]} AS user_id,
+                   COALESCE(p.nickname, '익명') AS nickname,
+                   COALESCE(w.weekly_score, 0) AS weekly_score,
+                   COALESCE(p.prediction_score, 0) AS prediction_score,
+                   COALESCE(p.quiz_score, 0) AS quiz_score,
+                   {src["score"]} AS score
+            FROM {src["from"]}
+            WHERE {src["where"]} AND {condition}
+            ORDER BY {src["score"]} {direction}, {src["uid"]} {direction}
+            LIMIT :limit
+        """), {**params, "week": src["week"], "limit": limit}).mappings().all()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _with_ranks(rows: list, rank: int, position: int, prev_score=None) -> list:
+        """
+        정렬된 행에 순위를 붙입니다. (동점자는 같은 순위)
+        rank/position은 rows 바로 앞 행의 순위와 0부터 시작하는 위치이며, 앞 행이 없으면 0, -1
+        """
+        for row in rows:
+            position += 1
+            if row["score"] != prev_score:
+                rank = position + 1
+            prev_score = row["score"]
+            row["rank"] = rank
+            row["position"] = position
+        return rows
+
+    @staticmethod
+    def _page_result(rows: list, limit: int) -> dict:
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        last = rows[-1] if rows else None
+        next_cursor = None
+        if has_more and last:
+            next_cursor = _encode_cursor(last["score"], last["user_id"], last["rank"], last["position"])
+        for row in rows:
+            row.pop("position")
+        return {"rankings": rows, "next_cursor": next_cursor}
+
+    @staticmethod
+    def get_ranking_page(score_type: str = "weekly_score", limit: int = 20, cursor: str = None) -> dict:
+        """
+        키셋 방식으로 랭킹 한 페이지를 조회합니다.
+        OFFSET 없이 이전 페이지 마지막 행의 (점수, user_id) 다음부터 인덱스를 읽으므로 깊은 페이지도 비용이 같고,
+        커서에 마지막 행의 순위를 담아 다음 페이지의 순위를 COUNT 없이 이어서 계산합니다.
+        """
+        after = _decode_cursor(cursor) if cursor else None
+        with engine.connect() as conn:
+            src = RankingService._ranking_source(conn, score_type)
+            if after:
+                rows = RankingService._select_rows(
+                    conn, src, f"({src['score']}, {src['uid']}) < (:after_score, :after_uid)",
+                    {"after_score": after["s"], "after_uid": after["u"]}, limit + 1,
+                )
+                rows = RankingService._with_ranks(rows, after["r"], after["p"], after["s"])
+            else:
+                rows = RankingService._select_rows(conn, src, "TRUE", {}, limit + 1)
+                rows = RankingService._with_ranks(rows, 0, -1)
+        return RankingService._page_result(rows, limit)
+
+    @staticmethod
+    def get_ranking_window(user_id: str, radius: int = 5, score_type: str = "weekly_score"):
+        """
+        유저 X 주변의 랭킹을 조회합니다. 랭킹에 없는 유저면 None.
+        1. 유저의 점수를 찾고, 인덱스를 위쪽으로 radius명 읽어 창의 첫 행을 정함
+        2. 첫 행 앞의 인원을 리더보드 인덱스(Fenwick 트리, O(log n))에서 구해 순위를 정한 뒤,
+           첫 행부터 아래로 radius * 2 + 1명을 읽음
+           (인덱스가 준비되지 않았거나 아직 반영 전이면 DB에서 첫 행보다 높은 점수의 인원을 셈)
+        결과의 next_cursor로 get_ranking_page를 이어서 호출할 수 있습니다.
+        """
+        with engine.connect() as conn:
+            src = RankingService._ranking_source(conn, score_type)
+            me = RankingService._select_rows(conn, src, f"{src['uid']} = :uid", {"uid": user_id}, 1)
+            if not me:
+                return None
+            score = me[0]["score"]
+
+            above = RankingService._select_rows(
+                conn, src, f"({src['score']}, {src['uid']}) > (:score, :uid)",
+                {"score": score, "uid": user_id}, radius, ascending=True,
+            )
+            first = above[-1] if above else me[0]
+
+            counts = None
+            # 인덱스는 이번 주 점수가 없는 유저도 0점으로 가지고 있어 주간 0점 동점 그룹은 DB 기준으로 셈
+            if score_type != "weekly_score" or first["score"] > 0:
+                counts = LeaderboardIndex.count_before(first["user_id"], first["score"], score_type)
+            if counts is None:
+                counts = conn.execute(text(f"""
+                    SELECT COUNT(*) FILTER (WHERE {src["score"]} > :score) AS higher,
+                           COUNT(*) FILTER (WHERE {src["score"]} = :score AND {src["uid"]} > :uid) AS tied_before
+                    FROM {src["from"]}
+                    WHERE {src["where"]} AND {src["score"]} >= :score
+                """), {"score": first["score"], "uid": first["user_id"], "week": src["week"]}).fetchone()
+            higher, tied_before = counts
+
+            rows = RankingService._select_rows(
+                conn, src, f"({src['score']}, {src['uid']}) <= (:score, :uid)",
+                {"score": first["score"], "uid": first["user_id"]}, radius * 2 + 2,
+            )
+        # 첫 행 바로 앞 행의 위치 = higher + tied_before - 1, 첫 행이 동점 그룹 중간이면 그 그룹의 순위를 이어받음
+        position = higher + tied_before - 1
+        if tied_before:
+            rows = RankingService._with_ranks(rows, higher + 1, position, first["score"])
+        else:
+            rows = RankingService._with_ranks(rows, 0, position)
+        result = RankingService._page_result(rows, radius * 2 + 1)
+        result["me"] = next((r for r in result["rankings"] if r["user_id"] == user_id), None)
+        return result
 
 
 # ============================================================
 # API Endpoints
 # ============================================================
 
+def _check_score_type(score_type: str):
+    if score_type not in SCORE_TYPES:
+        raise HTTPException(status_code=400, detail=f"score_type은 {', '.join(SCORE_TYPES)} 중 하나여야 합니다.")
+
+
 @router.get("/top")
-def get_top_ranking(limit: int = 10):
-    """Supabase에서 주간 랭킹 상위 N명을 조회합니다. (weekly_score 기준)"""
+def get_top_ranking(limit: int = 10, score_type: str = "weekly_score"):
+    """리더보드 인덱스에서 랭킹 상위 N명을 조회합니다. (기본: weekly_score 기준)"""
+    _check_score_type(score_type)
     try:
-        rankings = get_user_rankings(limit=limit, order_by="weekly_score")
+        rankings = LeaderboardIndex.top(limit=max(min(limit, 100), 1), score_type=score_type)
         return {"status": "ok", "rankings": rankings}
     except Exception as e:
         logger.error(f"랭킹 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"랭킹 조회 실패: {str(e)}")
+
+
+@router.get("/page")
+def get_ranking_page(score_type: str = "weekly_score", limit: int = 20, cursor: str = None):
+    """
+    랭킹을 키셋 방식으로 페이지 단위 조회합니다. (깊은 페이지도 일정한 비용)
+    다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다.
+    """
+    _check_score_type(score_type)
+    result = RankingService.get_ranking_page(score_type, limit=max(min(limit, RANKING_PAGE_MAX), 1), cursor=cursor)
+    return {"status": "ok", **result}
+
+
+@router.get("/window")
+def get_ranking_window(user_id: str, radius: int = 5, score_type: str = "weekly_score"):
+    """유저 위/아래 radius명의 랭킹을 DB 인덱스에서 조회합니다."""
+    _check_score_type(score_type)
+    result = RankingService.get_ranking_window(user_id, radius=max(min(radius, RANKING_WINDOW_MAX), 0), score_type=score_type)
+    if result is None:
+        raise HTTPException(status_code=404, detail="랭킹에 등록되지 않은 유저입니다.")
+    return {"status": "ok", **result}
+
+
+@router.get("/weekly")
+def get_weekly_ranking(week: str = None, limit: int = 10, score_type: str = "weekly_score"):
+    """특정 주(week: YYYY-MM-DD, 해당 주의 아무 날짜)의 랭킹을 조회합니다. 생략하면 현재 주"""
+    _check_score_type(score_type)
+    week_start = None
+    if week:
+        try:
+            week_start = datetime.strptime(week, "%Y-%m-%d").date()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="날짜 형식은 YYYY-MM-DD 입니다.")
+    result = RankingService.get_weekly_ranking(week_start, limit=max(min(limit, 100), 1), score_type=score_type)
+    return {"status": "ok", **result}
+
+
+@router.get("/me")
+def get_my_ranking(user_id: str, score_type: str = "weekly_score"):
+    """내 순위와 백분위를 조회합니다."""
+    _check_score_type(score_type)
+    entry = LeaderboardIndex.me(user_id, score_type=score_type)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="랭킹에 등록되지 않은 유저입니다.")
+    return {"status": "ok", "ranking": entry}
+
+
+@router.get("/stats")
+def get_prediction_stats(user_id: str):
+    """내 예측 통계(적중률, AI 상대 승리 수, 연속 적중)를 조회합니다."""
+    stats = RankingService.get_prediction_stats(user_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="정산된 예측이 없는 유저입니다.")
+    return {"status": "ok", "stats": stats}
+
+
+@router.get("/around")
+def get_ranking_around(user_id: str, radius: int = 5, score_type: str = "weekly_score"):
+    """내 앞뒤 radius명의 순위를 조회합니다."""
+    _check_score_type(score_type)
+    rankings = LeaderboardIndex.around(user_id, radius=max(min(radius, 50), 0), score_type=score_type)
+    if rankings is None:
+        raise HTTPException(status_code=404, detail="랭킹에 등록되지 않은 유저입니다.")
+    return {"status": "ok", "rankings": rankings}
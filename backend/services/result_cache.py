@@ -0,0 +1,125 @@
+# backend/services/result_cache.py
+"""
+계산 결과 캐시 (Single-flight + Stale-While-Revalidate)
+
+시뮬레이션/포스트시즌 대진처럼 DB 조회 + 모델 추론이 필요한 결과를
+(데이터 버전, 모델 버전) 키로 캐싱합니다.
+
+- 같은 키에 대해 동시에 들어온 요청은 하나의 계산만 수행하고 결과를 공유합니다.
+- 키가 바뀌면(새 경기 결과 반영, 모델 재학습) 이전 결과를 즉시 반환하고
+  새 결과는 백그라운드에서 계산합니다.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from sqlalchemy import text
+
+import config as config_module
+from config import engine
+
+# 데이터 버전 조회 주기 (초) - 이 시간 동안은 DB에 버전을 다시 묻지 않습니다.
+DATA_VERSION_TTL_SECONDS = 30
+
+
+class ResultCache:
+    _lock = threading.Lock()
+    _entries = {}    # name -> (key, value)
+    _inflight = {}   # (name, key) -> Future
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="result-cache")
+
+    _data_version = None
+    _data_version_checked_at = 0.0
+
+    @classmethod
+    def get_data_version(cls) -> str:
+        """
+        결과에 영향을 주는 테이블들의 상태를 요약한 데이터 버전 문자열을 반환합니다.
+        경기/일정 테이블은 행 수(삽입/삭제)와 updated_at 최대값(크롤러가 내용이 바뀐 행만 갱신)으로
+        제자리 수정까지 감지하고, 피처/순위 테이블은 파이프라인에서 전체 재삽입되므로 created_at 최대값이
+        갱신 시점을 나타냅니다.
+        """
+        now = time.monotonic()
+        if cls._data_version and now - cls._data_version_checked_at < DATA_VERSION_TTL_SECONDS:
+            return cls._data_version
+
+        try:
+            with engine.connect() as conn:
+                row = conn.execute(text("""
+                    SELECT
+                        (SELECT COUNT(*) FROM kbo_games) AS games,
+                        (SELECT MAX(updated_at) FROM kbo_games) AS games_at,
+                        (SELECT COUNT(*) FROM kbo_schedule) AS schedules,
+                        (SELECT MAX(updated_at) FROM kbo_schedule) AS schedules_at,
+                        (SELECT MAX(created_at) FROM match_features) AS features_at,
+                        (SELECT MAX(created_at) FROM team_rank) AS rank_at
+                """)).fetchone()
+            version = (
+                f"{config_module.CURRENT_DATE}|{row.games}|{row.games_at}|{row.schedules}|{row.schedules_at}"
+                f"|{row.features_at}|{row.rank_at}"
+            )
+        except Exception as e:
+            print(f"⚠️ [Cache] 데이터 버전 조회 실패: {e}")
+            version = cls._data_version or f"{config_module.CURRENT_DATE}|unknown"
+
+        cls._data_version = version
+        cls._data_version_checked_at = now
+        return version
+
+    @classmethod
+    def _run(cls, name, key, compute, future: Future):
+        """결과를 계산하여 캐시에 저장하고 대기 중인 요청들에게 전달합니다."""
+        try:
+            value = compute()
+            with cls._lock:
+                cls._entries[name] = (key, value)
+            future.set_result(value)
+        except Exception as e:
+            print(f"⚠️ [Cache] '{name}' 계산 실패: {e}")
+            future.set_exception(e)
+        finally:
+            with cls._lock:
+                cls._inflight.pop((name, key), None)
+
+    @classmethod
+    def get_or_compute(cls, name: str, key, compute):
+        """
+        캐시된 결과를 반환하거나, 없으면 계산합니다.
+
+        Args:
+            name: 결과 이름 (예: "season_projection")
+            key: 캐시 키 (데이터 버전, 모델 버전 등)
+            compute: 인자 없는 계산 함수
+
+        Returns:
+            계산 결과. 키가 바뀐 경우 새 결과가 준비될 때까지 이전 결과를 반환합니다.
+        """
+        with cls._lock:
+            entry = cls._entries.get(name)
+            if entry and entry[0] == key:
+                return entry[1]
+
+            future = cls._inflight.get((name, key))
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                cls._inflight[(name, key)] = future
+
+        if entry is not None:
+            # 이전 결과가 있으면 바로 반환하고, 갱신은 백그라운드에서 1회만 수행
+            if is_owner:
+                cls._executor.submit(cls._run, name, key, compute, future)
+            return entry[1]
+
+        if is_owner:
+            cls._run(name, key, compute, future)
+        return future.result()
+
+    @classmethod
+    def invalidate(cls, name: str = None):
+        """캐시를 비웁니다. name을 생략하면 전체를 비우고 데이터 버전도 다시 조회합니다."""
+        with cls._lock:
+            if name:
+                cls._entries.pop(name, None)
+            else:
+                cls._entries.clear()
+                cls._data_version = None
@@ -0,0 +1,206 @@
+# backend/services/score_outbox.py
+"""
+점수 반영 아웃박스 (Transactional Outbox)
+
+퀴즈 정답 등 점수 이벤트를 요청 처리 트랜잭션 안에서 score_outbox 테이블에 기록만 하고,
+Supabase 점수 반영(increment_user_scores)은 백그라운드 디스패처가 트랜잭션 밖에서 일괄 처리합니다.
+요청 지연 시간과 DB 커넥션 점유 시간이 Supabase API 지연과 무관해집니다.
+
+처리 흐름:
+1. enqueue(conn, events): 호출자 트랜잭션 안에서 INSERT (커밋되면 이벤트도 함께 확정)
+2. 디스패처: 짧은 트랜잭션으로 이벤트를 임대(claim) → 트랜잭션 밖에서 일괄 RPC → 성공/실패 기록
+3. 실패한 이벤트는 지수 백오프 후 재시도 (at-least-once)
+4. apply_score_deltas가 outbox_id로 중복을 걸러내므로, 재전송되어도 점수는 한 번만 반영 (effectively-once)
+
+테이블은 init_db.sql 2.1.3에서 생성합니다.
+"""
+import threading
+from sqlalchemy import text
+
+from config import engine
+from supabase_config import increment_user_scores
+
+DISPATCH_BATCH_SIZE = 200         # 1회 RPC로 반영할 최대 이벤트 수
+DISPATCH_INTERVAL_SECONDS = 2.0   # 대기 중인 이벤트가 없을 때 확인 주기
+CLAIM_LEASE_SECONDS = 60          # 임대 만료 시간 (디스패처가 중단되면 이후 다른 디스패처가 다시 가져감)
+MAX_BACKOFF_SECONDS = 600         # 재시도 간격 상한
+OUTBOX_RETENTION_DAYS = 7         # 반영 완료된 이벤트 보관 기간
+
+
+class ScoreOutbox:
+    _wake = threading.Event()
+    _stop = threading.Event()
+    _thread = None
+    _listeners = []
+
+    @classmethod
+    def add_listener(cls, listener):
+        """반영에 성공한 이벤트 배치를 받을 콜백을 등록합니다. (예: 리더보드 인덱스)"""
+        if listener not in cls._listeners:
+            cls._listeners.append(listener)
+
+    @classmethod
+    def enqueue(cls, conn, events: list, source: str = None) -> int:
+        """
+        점수 이벤트를 호출자의 트랜잭션 안에서 기록합니다.
+        커밋 후 notify()를 호출하면 디스패처가 바로 처리합니다.
+
+        Args:
+            conn: 호출자 트랜잭션 connection
+            events: [{"user_id", "score_type", "delta", "nickname"(선택)}, ...]
+            source: 이벤트 출처 (예: "quiz")
+
+        Returns:
+            int: 기록한 이벤트 수
+        """
+        rows = [
+            {
+                "uid": e["user_id"],
+                "nickname": e.get("nickname"),
+                "score_type": e["score_type"],
+                "delta": int(e["delta"]),
+                "source": source,
+            }
+            for e in events
+            if e["delta"]
+        ]
+        if not rows:
+            return 0
+        conn.execute(text("""
+            INSERT INTO score_outbox (user_id, nickname, score_type, delta, source)
+            VALUES (:uid, :nickname, :score_type, :delta, :source)
+        """), rows)
+        return len(rows)
+
+    @classmethod
+    def notify(cls):
+        """디스패처를 깨워 대기 중인 이벤트를 바로 처리하게 합니다."""
+        cls._wake.set()
+
+    @classmethod
+    def _claim(cls, batch_size: int) -> list:
+        """처리할 이벤트를 짧은 트랜잭션으로 임대합니다. (여러 디스패처가 동시에 실행되어도 중복 임대되지 않음)"""
+        with engine.begin() as conn:
+            rows = conn.execute(text("""
+                UPDATE score_outbox o
+                SET claimed_until = NOW() + make_interval(secs => :lease),
+                    attempts = o.attempts + 1
+                WHERE o.id IN (
+                    SELECT id FROM score_outbox
+                    WHERE dispatched_at IS NULL
+                      AND next_attempt_at <= NOW()
+                      AND (claimed_until IS NULL OR claimed_until < NOW())
+                    ORDER BY id
+                    LIMIT :limit
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING o.id, o.user_id, o.nickname, o.score_type, o.delta, o.source
+            """), {"lease": CLAIM_LEASE_SECONDS, "limit": batch_size}).mappings().all()
+        return [dict(row) for row in rows]
+
+    @classmethod
+    def dispatch_batch(cls, batch_size: int = DISPATCH_BATCH_SIZE) -> dict:
+        """
+        대기 중인 이벤트를 한 배치 임대하여 한 번의 RPC로 반영합니다.
+
+        Returns:
+            dict: {"claimed", "dispatched", "failed"}
+        """
+        events = cls._claim(batch_size)
+        if not events:
+            return {"claimed": 0, "dispatched": 0, "failed": 0}
+
+        ids = [e["id"] for e in events]
+        # 네트워크 호출은 트랜잭션 밖에서 수행 (outbox_id로 재전송 시 중복 반영 방지)
+        success = increment_user_scores([{**e, "outbox_id": e["id"]} for e in events])
+
+        with engine.begin() as conn:
+            if success:
+                conn.execute(text("""
+                    UPDATE score_outbox
+                    SET dispatched_at = NOW(), claimed_until = NULL, last_error = NULL
+                    WHERE id = ANY(:ids)
+                """), {"ids": ids})
+            else:
+                conn.execute(text("""
+                    UPDATE score_outbox
+                    SET claimed_until = NULL,
+                        next_attempt_at = NOW() + make_interval(secs => LEAST(POWER(2, attempts), :max_backoff)),
+                        last_error = :error
+                    WHERE id = ANY(:ids)
+                """), {"ids": ids, "max_backoff": MAX_BACKOFF_SECONDS, "error": "increment_user_scores 실패"})
+
+        if success:
+            for listener in cls._listeners:
+                try:
+                    listener(events)
+                except Exception as e:
+                    print(f"⚠️ [Outbox] 리스너 오류: {e}")
+        else:
+            print(f"⚠️ [Outbox] 점수 이벤트 {len(ids)}건 반영 실패, 재시도 예정")
+
+        return {
+            "claimed": len(events),
+            "dispatched": len(events) if success else 0,
+            "failed": 0 if success else len(events),
+        }
+
+    @classmethod
+    def drain(cls, max_batches: int = 100) -> dict:
+        """지금 처리 가능한 이벤트를 모두 반영합니다. (일일 파이프라인 / 수동 실행용)"""
+        total = {"claimed": 0, "dispatched": 0, "failed": 0}
+        for _ in range(max_batches):
+            result = cls.dispatch_batch()
+            for key in total:
+                total[key] += result[key]
+            if result["claimed"] < DISPATCH_BATCH_SIZE or result["failed"]:
+                break
+        return total
+
+    @classmethod
+    def purge(cls, keep_days: int = OUTBOX_RETENTION_DAYS) -> int:
+        """반영 완료 후 보관 기간이 지난 이벤트와 반영 기록(score_applied_outbox)을 삭제합니다."""
+        with engine.begin() as conn:
+            conn.execute(text("""
+                DELETE FROM score_applied_outbox a
+                WHERE a.applied_at < NOW() - make_interval(days => :days)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM score_outbox o
+                      WHERE o.id = a.outbox_id AND o.dispatched_at IS NULL
+                  )
+            """), {"days": keep_days})
+            return conn.execute(text("""
+                DELETE FROM score_outbox
+                WHERE dispatched_at < NOW() - make_interval(days => :days)
+            """), {"days": keep_days}).rowcount
+
+    @classmethod
+    def _run_dispatcher(cls):
+        print("📤 [Outbox] 점수 디스패처 시작")
+        while not cls._stop.is_set():
+            try:
+                result = cls.dispatch_batch()
+                if result["claimed"] == DISPATCH_BATCH_SIZE and not result["failed"]:
+                    continue  # 더 남아 있으면 바로 다음 배치 처리
+            except Exception as e:
+                print(f"⚠️ [Outbox] 디스패처 오류: {e}")
+            cls._wake.wait(DISPATCH_INTERVAL_SECONDS)
+            cls._wake.clear()
+        print("📤 [Outbox] 점수 디스패처 종료")
+
+    @classmethod
+    def start_dispatcher(cls):
+        """API 프로세스 시작 시 백그라운드 디스패처 스레드를 실행합니다."""
+        if cls._thread and cls._thread.is_alive():
+            return
+        cls._stop.clear()
+        cls._thread = threading.Thread(target=cls._run_dispatcher, name="score-outbox", daemon=True)
+        cls._thread.start()
+
+    @classmethod
+    def stop_dispatcher(cls, timeout: float = 5.0):
+        """디스패처를 멈춥니다. (처리 중인 배치는 마치고 종료)"""
+        cls._stop.set()
+        cls._wake.set()
+        if cls._thread:
+            cls._thread.join(timeout)
@@ -1,10 +1,13 @@
 # backend/services/simulation_service.py
 from fastapi import APIRouter, HTTPException
+from datetime import date, datetime
+import numpy as np
 import pandas as pd
 from sqlalchemy import text
 from config import engine, TEAMS, FEATURE_CONFIG, CURRENT_DATE
 from services.model_service import ModelService
 from services.model_preprocessor import ModelPreprocessor
+from services.result_cache import ResultCache
 
 router = APIRouter(prefix="/api/simulation", tags=["simulation"])
 
@@ -16,15 +19,21 @@ POSTSEASON_SERIES = [
     {"key": "ks", "name": "한국시리즈", "sort_key": 4},
 ]
 
+# Monte Carlo 시즌 시뮬레이션 설정
+DEFAULT_N_SIMS = 10000
+HOME_GAMES_PER_OPPONENT = 8   # 상대팀별 홈 8경기 + 원정 8경기 = 16경기 (팀당 144경기)
+POSTSEASON_SLOTS = 5          # 정규시즌 1~5위 포스트시즌 진출
+
 
 class SimulationService:
     @classmethod
-    def _get_team_latest_features(cls, team: str) -> dict | None:
+    def _get_team_latest_features(cls, team: str, as_of=None) -> dict | None:
         """
         특정 팀의 가장 최신 match_features 레코드를 조회합니다.
 
         Args:
             team: 팀명 (예: "삼성")
+            as_of: 기준일 (지정하면 이 날짜까지의 경기 중 최신, 기본값: 제한 없음)
 
         Returns:
             dict: {"team": 팀명, "elo": ..., "form": ..., "streak": ..., "pyth": ..., "recent_rd": ...}
@@ -33,9 +42,10 @@ class SimulationService:
         with engine.connect() as conn:
             res = conn.execute(text("""
                 SELECT * FROM match_features
-                WHERE home_team = :team OR away_team = :team
+                WHERE (home_team = :team OR away_team = :team)
+                  AND (CAST(:as_of AS DATE) IS NULL OR game_date <= :as_of)
                 ORDER BY game_date DESC LIMIT 1
-            """), {"team": team}).fetchone()
+            """), {"team": team, "as_of": as_of}).fetchone()
 
         if not res:
             return None
@@ -81,6 +91,30 @@ class SimulationService:
             "rest_diff": 0,
         }
 
+    @classmethod
+    def _predict_virtual_matches(cls, model, latest_stats: list) -> pd.DataFrame:
+        """
+        모든 팀 쌍(홈/원정 구분)의 가상 대진을 만들고 홈팀 승률(win_prob)을 예측합니다.
+
+        Args:
+            model: 학습된 LightGBM 모델
+            latest_stats: _get_team_latest_features 반환값 리스트
+
+        Returns:
+            DataFrame: 가상 대진 행 + win_prob 컬럼
+        """
+        virtual_matches = []
+        for home in latest_stats:
+            for away in latest_stats:
+                if home['team'] == away['team']:
+                    continue
+                virtual_matches.append(cls._build_virtual_match_row(home, away))
+
+        v_df = pd.DataFrame(virtual_matches)
+        X = ModelPreprocessor.preprocess_data(v_df)
+        v_df['win_prob'] = model.predict_proba(X)[:, 1]
+        return v_df
+
     @classmethod
     def get_season_projection(cls):
         """모든 팀 간의 가상 대진을 시뮬레이션하여 최종 기대 순위를 계산합니다."""
@@ -98,19 +132,8 @@ class SimulationService:
         if not latest_stats:
             return []
 
-        # 2. 모든 팀 쌍(Pair)에 대한 가상 대진 생성 (총 90개 조합)
-        virtual_matches = []
-        for home in latest_stats:
-            for away in latest_stats:
-                if home['team'] == away['team']:
-                    continue
-                virtual_matches.append(cls._build_virtual_match_row(home, away))
-
-        v_df = pd.DataFrame(virtual_matches)
-
-        # 3. 승률 예측 및 팀별 평균 기대 승률 계산
-        X = ModelPreprocessor.preprocess_data(v_df)
-        v_df['win_prob'] = model.predict_proba(X)[:, 1]
+        # 2~3. 모든 팀 쌍(Pair)에 대한 가상 대진 승률 예측 (총 90개 조합)
+        v_df = cls._predict_virtual_matches(model, latest_stats)
 
         # 각 팀이 홈/원정일 때의 모든 기대 승률을 평균내어 시즌 기대 승률 도출
         projection = v_df.groupby("home_team")['win_prob'].mean().reset_index()
@@ -123,6 +146,253 @@ class SimulationService:
 
         return projection.to_dict(orient="records")
 
+    @staticmethod
+    def _cache_key():
+        """시뮬레이션 결과 캐시 키: (데이터 버전, 모델 버전)"""
+        return (ResultCache.get_data_version(), ModelService.get_model_version())
+
+    @classmethod
+    def get_cached_season_projection(cls):
+        """get_season_projection 결과를 데이터/모델 버전 기준으로 캐싱하여 반환합니다."""
+        return ResultCache.get_or_compute("season_projection", cls._cache_key(), cls.get_season_projection)
+
+    @classmethod
+    def get_cached_postseason_bracket(cls):
+        """get_postseason_bracket 결과를 데이터/모델 버전 기준으로 캐싱하여 반환합니다."""
+        return ResultCache.get_or_compute("postseason_bracket", cls._cache_key(), cls.get_postseason_bracket)
+
+    @staticmethod
+    def _get_season_records(year: int, today) -> dict:
+        """
+        당해 정규시즌 (홈팀, 원정팀) 쌍별 경기 수와 승/패/무를 집계합니다.
+
+        Returns:
+            dict: {(home_team, away_team): {"games", "home_wins", "away_wins", "draws"}}
+        """
+        with engine.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT
+                    home_team,
+                    away_team,
+                    COUNT(*) AS games,
+                    SUM(CASE WHEN winning_team = home_team THEN 1 ELSE 0 END) AS home_wins,
+                    SUM(CASE WHEN winning_team = away_team THEN 1 ELSE 0 END) AS away_wins,
+                    SUM(CASE WHEN winning_team = '무승부' THEN 1 ELSE 0 END) AS draws
+                FROM kbo_games
+                WHERE is_postseason = FALSE
+                  AND EXTRACT(YEAR FROM game_date) = :year
+                  AND game_date <= :today
+                GROUP BY home_team, away_team
+            """), {"year": year, "today": today}).fetchall()
+
+        return {
+            (r.home_team, r.away_team): {
+                "games": r.games or 0,
+                "home_wins": r.home_wins or 0,
+                "away_wins": r.away_wins or 0,
+                "draws": r.draws or 0,
+            }
+            for r in rows
+        }
+
+    @classmethod
+    def simulate_season_odds(cls, n_sims: int = DEFAULT_N_SIMS, seed: int = None, as_of=None):
+        """
+        현재 성적 + 남은 잔여 경기를 Monte Carlo 방식으로 시뮬레이션하여
+        팀별 포스트시즌 진출 확률과 최종 순위 분포를 계산합니다.
+
+        잔여 경기는 KBO 일정 규칙(상대팀별 홈 8경기 + 원정 8경기)에서
+        이미 치른 경기 수를 빼서 산출하고, 각 경기의 승률은 가상 대진 예측값을 사용합니다.
+
+        Args:
+            n_sims: 시뮬레이션 반복 횟수
+            seed: 난수 시드 (재현용)
+            as_of: 시뮬레이션 기준일 (이 날짜까지의 성적/피처 사용, 기본값: CURRENT_DATE)
+
+        Returns:
+            list[dict]: 팀별 {"team", "wins", "losses", "draws", "expected_wins",
+                        "expected_rank", "playoff_prob", "first_prob", "rank_dist"}
+        """
+        model = ModelService.get_model()
+        if not model:
+            return []
+
+        as_of = as_of or CURRENT_DATE
+        latest_stats = [s for s in (cls._get_team_latest_features(t, as_of) for t in TEAMS) if s]
+        if len(latest_stats) < 2:
+            return []
+
+        v_df = cls._predict_virtual_matches(model, latest_stats)
+        win_probs = {(r.home_team, r.away_team): float(r.win_prob) for r in v_df.itertuples()}
+
+        teams = [s["team"] for s in latest_stats]
+        idx = {t: i for i, t in enumerate(teams)}
+        n_teams = len(teams)
+
+        # 1. 현재 승/패/무 집계
+        records = cls._get_season_records(as_of.year, as_of)
+        base_wins = np.zeros(n_teams)
+        base_losses = np.zeros(n_teams)
+        base_draws = np.zeros(n_teams)
+        for (home, away), rec in records.items():
+            if home not in idx or away not in idx:
+                continue
+            base_wins[idx[home]] += rec["home_wins"]
+            base_losses[idx[home]] += rec["away_wins"]
+            base_wins[idx[away]] += rec["away_wins"]
+            base_losses[idx[away]] += rec["home_wins"]
+            base_draws[idx[home]] += rec["draws"]
+            base_draws[idx[away]] += rec["draws"]
+
+        # 2. 잔여 경기 시뮬레이션 (쌍별 이항분포로 벡터화)
+        rng = np.random.default_rng(seed)
+        wins = np.tile(base_wins, (n_sims, 1))
+        losses = np.tile(base_losses, (n_sims, 1))
+        for (home, away), prob in win_probs.items():
+            played = records.get((home, away), {}).get("games", 0)
+            remaining = max(HOME_GAMES_PER_OPPONENT - played, 0)
+            if remaining == 0:
+                continue
+            home_w = rng.binomial(remaining, prob, size=n_sims)
+            wins[:, idx[home]] += home_w
+            losses[:, idx[home]] += remaining - home_w
+            wins[:, idx[away]] += remaining - home_w
+            losses[:, idx[away]] += home_w
+
+        # 3. 승률 기준 순위 산출 (동률은 무작위로 분리)
+        decided = wins + losses
+        win_rate = np.divide(wins, decided, out=np.zeros_like(wins), where=decided > 0)
+        order = np.argsort(-(win_rate + rng.random(win_rate.shape) * 1e-9), axis=1)
+        ranks = np.empty_like(order)
+        ranks[np.arange(n_sims)[:, None], order] = np.arange(1, n_teams + 1)
+
+        # 4. 팀별 요약 (확률/분포는 소수 4자리로 압축)
+        results = []
+        for team, i in idx.items():
+            rank_dist = np.bincount(ranks[:, i], minlength=n_teams + 1)[1:] / n_sims
+            results.append({
+                "team": team,
+                "wins": int(base_wins[i]),
+                "losses": int(base_losses[i]),
+                "draws": int(base_draws[i]),
+                "expected_wins": round(float(wins[:, i].mean()), 1),
+                "expected_rank": round(float(ranks[:, i].mean()), 2),
+                "playoff_prob": round(float(rank_dist[:POSTSEASON_SLOTS].sum()), 4),
+                "first_prob": round(float(rank_dist[0]), 4),
+                "rank_dist": [round(float(p), 4) for p in rank_dist],
+            })
+
+        results.sort(key=lambda r: r["expected_rank"])
+        return results
+
+    @classmethod
+    def save_odds_snapshot(cls, snapshot_date=None, n_sims: int = DEFAULT_N_SIMS, conn=None) -> int:
+        """
+        시즌 확률 시뮬레이션 결과를 season_odds_history 테이블에 저장합니다.
+        (snapshot_date, model_version, team_name) 기준으로 UPSERT하므로 같은 날 재실행해도 안전합니다.
+
+        Args:
+            snapshot_date: 스냅샷 기준일 (이 날짜 기준으로 시뮬레이션, 기본값: CURRENT_DATE)
+            n_sims: 시뮬레이션 반복 횟수
+            conn: 외부 트랜잭션 connection (관리자 모드용). None이면 자체 트랜잭션 사용.
+
+        Returns:
+            int: 저장된 팀 수
+        """
+        snapshot_date = snapshot_date or CURRENT_DATE
+        odds = cls.simulate_season_odds(n_sims=n_sims, as_of=snapshot_date)
+        if not odds:
+            return 0
+
+        model_version = ModelService.get_model_version()
+        params = [
+            {
+                "snapshot_date": snapshot_date,
+                "model_version": model_version,
+                "team_name": o["team"],
+                "wins": o["wins"],
+                "losses": o["losses"],
+                "draws": o["draws"],
+                "expected_wins": o["expected_wins"],
+                "expected_rank": o["expected_rank"],
+                "playoff_prob": o["playoff_prob"],
+                "first_prob": o["first_prob"],
+                "rank_dist": o["rank_dist"],
+                "n_sims": n_sims,
+            }
+            for o in odds
+        ]
+        upsert_sql = text("""
+            INSERT INTO season_odds_history (
+                snapshot_date, model_version, team_name, wins, losses, draws,
+                expected_wins, expected_rank, playoff_prob, first_prob, rank_dist, n_sims
+            )
+            VALUES (
+                :snapshot_date, :model_version, :team_name, :wins, :losses, :draws,
+                :expected_wins, :expected_rank, :playoff_prob, :first_prob, :rank_dist, :n_sims
+            )
+            ON CONFLICT (snapshot_date, model_version, team_name) DO UPDATE SET
+                wins = EXCLUDED.wins,
+                losses = EXCLUDED.losses,
+                draws = EXCLUDED.draws,
+                expected_wins = EXCLUDED.expected_wins,
+                expected_rank = EXCLUDED.expected_rank,
+                playoff_prob = EXCLUDED.playoff_prob,
+                first_prob = EXCLUDED.first_prob,
+                rank_dist = EXCLUDED.rank_dist,
+                n_sims = EXCLUDED.n_sims,
+                created_at = NOW()
+        """)
+
+        if conn:
+            conn.execute(upsert_sql, params)
+        else:
+            with engine.begin() as write_conn:
+                write_conn.execute(upsert_sql, params)
+        return len(params)
+
+    @staticmethod
+    def get_odds_history(start_date, end_date, team: str = None, model_version: str = None):
+        """
+        season_odds_history에서 기간별 팀 확률 추이를 조회합니다.
+        model_version을 지정하지 않으면 날짜·팀별로 가장 최근에 저장된 스냅샷을 사용합니다.
+        """
+        conditions = ["snapshot_date BETWEEN :start_date AND :end_date"]
+        params = {"start_date": start_date, "end_date": end_date}
+        if team:
+            conditions.append("team_name = :team")
+            params["team"] = team
+        if model_version:
+            conditions.append("model_version = :model_version")
+            params["model_version"] = model_version
+
+        with engine.connect() as conn:
+            rows = conn.execute(text(f"""
+                SELECT DISTINCT ON (snapshot_date, team_name)
+                    snapshot_date, team_name, model_version, wins, losses, draws,
+                    expected_wins, expected_rank, playoff_prob, first_prob, rank_dist
+                FROM season_odds_history
+                WHERE {" AND ".join(conditions)}
+                ORDER BY snapshot_date ASC, team_name ASC, created_at DESC
+            """), params).fetchall()
+
+        return [
+            {
+                "snapshot_date": str(r.snapshot_date),
+                "team": r.team_name,
+                "model_version": r.model_version,
+                "wins": r.wins,
+                "losses": r.losses,
+                "draws": r.draws,
+                "expected_wins": r.expected_wins,
+                "expected_rank": r.expected_rank,
+                "playoff_prob": r.playoff_prob,
+                "first_prob": r.first_prob,
+                "rank_dist": list(r.rank_dist or []),
+            }
+            for r in rows
+        ]
+
     @classmethod
     def get_postseason_bracket(cls):
         """
@@ -445,15 +715,39 @@ class SimulationService:
 @router.get("/projection")
 def get_projection():
     """AI가 예측한 시즌 최종 순위 리포트를 반환합니다."""
-    result = SimulationService.get_season_projection()
+    result = SimulationService.get_cached_season_projection()
     return {"status": "ok", "data": result}
 
 
+@router.get("/odds-history")
+def get_odds_history(
+    start_date: str = None,
+    end_date: str = None,
+    team: str = None,
+    model_version: str = None,
+):
+    """
+    일별 시즌 확률(포스트시즌 진출/1위/순위 분포) 스냅샷 추이를 반환합니다.
+    기간을 생략하면 당해 1월 1일부터 기준일까지 조회합니다. (YYYY-MM-DD)
+    """
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else date(CURRENT_DATE.year, 1, 1)
+        end = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else CURRENT_DATE
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 날짜 형식입니다. YYYY-MM-DD 형식이어야 합니다.")
+
+    try:
+        history = SimulationService.get_odds_history(start, end, team, model_version)
+        return {"status": "ok", "data": history}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"시즌 확률 추이 조회 실패: {str(e)}")
+
+
 @router.get("/postseason")
 def get_postseason():
     """포스트시즌 대진표와 AI 예측 결과를 반환합니다."""
     try:
-        result = SimulationService.get_postseason_bracket()
+        result = SimulationService.get_cached_postseason_bracket()
         if not result:
             return {"status": "ok", "data": None, "message": "포스트시즌 데이터가 없습니다."}
         return {"status": "ok", "data": result}
@@ -0,0 +1,142 @@
+# backend/services/user_prediction_service.py
+"""
+유저 승리 예측 저장 서비스
+
+하루 경기 전체(슬레이트)의 예측을 한 번의 요청/트랜잭션으로 저장합니다.
+- kbo_schedule로 경기 날짜, 팀, 시작 여부를 한 번에 검증 (이미 시작한 경기는 거절)
+- user_predictions는 unnest 다중 행 upsert 한 문장으로 저장
+- 이 프로세스에서 이미 프로필을 확인한 유저는 user_profiles INSERT를 생략
+"""
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import text
+
+import config as config_module
+from config import KST, DEFAULT_GAME_TIME, FINAL_STATUSES
+
+KNOWN_USERS_MAX = 50000   # 프로필 존재를 기억할 최대 유저 수 (LRU)
+
+
+class UserPredictionService:
+    _lock = threading.Lock()
+    _known_users = OrderedDict()   # user_id -> None (프로필이 있는 것으로 확인된 유저)
+
+    @classmethod
+    def _is_known(cls, user_id: str) -> bool:
+        with cls._lock:
+            if user_id in cls._known_users:
+                cls._known_users.move_to_end(user_id)
+                return True
+            return False
+
+    @classmethod
+    def remember_user(cls, user_id: str):
+        """트랜잭션 커밋 후 호출합니다. (롤백된 프로필 생성을 기억하지 않도록)"""
+        with cls._lock:
+            cls._known_users[user_id] = None
+            cls._known_users.move_to_end(user_id)
+            while len(cls._known_users) > KNOWN_USERS_MAX:
+                cls._known_users.popitem(last=False)
+
+    @classmethod
+    def ensure_profile(cls, conn, user_id: str, nickname: str = None):
+        """user_profiles에 유저가 없으면 생성합니다. 이미 확인한 유저는 DB를 거치지 않습니다."""
+        if cls._is_known(user_id):
+            return
+        conn.execute(
+            text("""
+                INSERT INTO user_profiles (user_id, nickname)
+                VALUES (:uid, :nick)
+                ON CONFLICT (user_id) DO NOTHING
+            """),
+            {"uid": user_id, "nick": nickname or user_id[:8]}
+        )
+
+    @staticmethod
+    def _now():
+        """현재 시각 (KST). 관리자 모드에서는 시뮬레이션 날짜(CURRENT_DATE)의 같은 시각"""
+        now = datetime.now(KST)
+        if config_module.ADMIN_MODE:
+            now = datetime.combine(config_module.CURRENT_DATE, now.time(), tzinfo=KST)
+        return now
+
+    @classmethod
+    def _validate_slate(cls, conn, game_date, picks: list) -> list:
+        """
+        예측을 kbo_schedule과 한 번에 대조합니다.
+
+        Returns:
+            list: 거절 사유 목록 [{"game_id", "reason"}] (모두 유효하면 빈 리스트)
+        """
+        rows = conn.execute(text("""
+            SELECT s.game_id, s.game_date, s.game_time, s.home_team, s.away_team, s.game_status,
+                   (g.game_id IS NOT NULL) AS has_result
+            FROM kbo_schedule s
+            LEFT JOIN kbo_games g ON g.game_id = s.game_id
+            WHERE s.game_id = ANY(:gids)
+        """), {"gids": [p["game_id"] for p in picks]}).fetchall()
+        games = {row.game_id: row for row in rows}
+
+        now = cls._now()
+        errors = []
+        for p in picks:
+            game = games.get(p["game_id"])
+            if not game:
+                errors.append({"game_id": p["game_id"], "reason": "일정에 없는 경기"})
+                continue
+            if game.game_date != game_date:
+                errors.append({"game_id": p["game_id"], "reason": f"{game_date} 경기가 아님"})
+                continue
+            if p["predicted_winner"] not in (game.home_team, game.away_team):
+                errors.append({"game_id": p["game_id"], "reason": "경기에 참여하지 않는 팀"})
+                continue
+            try:
+                start_time = datetime.strptime(game.game_time or DEFAULT_GAME_TIME, "%H:%M").time()
+            except ValueError:
+                start_time = datetime.strptime(DEFAULT_GAME_TIME, "%H:%M").time()
+            started = (
+                game.has_result
+                or any(s in (game.game_status or "") for s in FINAL_STATUSES)
+                or now >= datetime.combine(game.game_date, start_time, tzinfo=KST)
+            )
+            if started:
+                errors.append({"game_id": p["game_id"], "reason": "이미 시작한 경기"})
+        return errors
+
+    @classmethod
+    def submit_slate(cls, conn, user_id: str, game_date, picks: list, nickname: str = None) -> int:
+        """
+        하루 경기 예측을 검증한 뒤 한 문장으로 저장합니다. (호출자 트랜잭션 안에서 실행)
+        하나라도 유효하지 않으면 아무것도 저장하지 않고 400을 반환합니다.
+
+        Args:
+            picks: [{"game_id", "predicted_winner"}, ...]
+
+        Returns:
+            int: 저장한 예측 수
+        """
+        if not picks:
+            raise HTTPException(status_code=400, detail="제출할 예측이 없습니다.")
+        if len({p["game_id"] for p in picks}) != len(picks):
+            raise HTTPException(status_code=400, detail="같은 경기를 중복 제출할 수 없습니다.")
+
+        errors = cls._validate_slate(conn, game_date, picks)
+        if errors:
+            raise HTTPException(status_code=400, detail={"message": "유효하지 않은 예측이 있습니다.", "errors": errors})
+
+        cls.ensure_profile(conn, user_id, nickname)
+        conn.execute(text("""
+            INSERT INTO user_predictions (user_id, game_id, predicted_winner)
+            SELECT :uid, p.game_id, p.predicted_winner
+            FROM unnest(CAST(:gids AS VARCHAR[]), CAST(:winners AS VARCHAR[])) AS p(game_id, predicted_winner)
+            ORDER BY p.game_id  -- 팬 예측 카운터(트리거) 행을 항상 같은 순서로 잠금
+            ON CONFLICT (user_id, game_id)
+            DO UPDATE SET predicted_winner = EXCLUDED.predicted_winner, created_at = NOW()
+        """), {
+            "uid": user_id,
+            "gids": [p["game_id"] for p in picks],
+            "winners": [p["predicted_winner"] for p in picks],
+        })
+        return len(picks)
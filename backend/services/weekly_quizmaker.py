@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 import google.generativeai as genai
 
 from config import engine, CURRENT_DATE
+from services.quiz_pool import QuizPool
 
 load_dotenv()
 
@@ -239,6 +240,10 @@ class WeeklyQuizMaker:
             except Exception as e:
                 print(f"   ❌ DB 저장 실패: {e}")
 
+        # 같은 프로세스의 퀴즈 풀에 바로 반영 (다른 프로세스는 주기적 증분 확인으로 반영)
+        if success_count:
+            QuizPool.refresh(force=True)
+
         return success_count
 
     @classmethod
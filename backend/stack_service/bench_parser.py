@@ -0,0 +1,101 @@
+# backend/stack_service/bench_parser.py
+"""
+Daum Sports 일정 파서 벤치마크
+저장된 Daum HTML 페이지로 기존 파서(BeautifulSoup + CSS 셀렉터)와
+고속 파서(lxml 단일 순회)의 결과 동일성과 처리 속도를 비교합니다.
+
+사용 예:
+    cd backend
+    python -m stack_service.bench_parser                          # 기본 fixture(daumsports*.html) 사용
+    python -m stack_service.bench_parser --repeat 20              # 반복 횟수 지정
+    python -m stack_service.bench_parser ../daumsports.html       # 특정 파일만
+
+결과가 하나라도 다르면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from services.crawler_service import CrawlerService
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+DEFAULT_FIXTURES = sorted(glob.glob(os.path.join(PROJECT_ROOT, "daumsports*.html")))
+
+
+def _parse_reference(html: str):
+    """기존 경로: 전체 페이지 BeautifulSoup 파싱 + 행별 select_one"""
+    return CrawlerService._parse_daum_rows(BeautifulSoup(html, "lxml"))
+
+
+def _parse_fast(html: str):
+    """고속 경로: #scheduleList 구간만 lxml 파싱 + 1회 순회"""
+    return CrawlerService._parse_daum_rows_fast(html)
+
+
+def _time_parser(parser, html: str, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(html)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmark(paths: list[str], repeat: int) -> bool:
+    """
+    각 파일에 대해 두 파서의 결과를 비교하고 실행 시간을 측정합니다.
+
+    Returns:
+        bool: 모든 파일에서 결과가 동일하면 True
+    """
+    all_equal = True
+    print(f"{'파일':<32} {'경기':>5} {'기존(ms)':>10} {'고속(ms)':>10} {'배속':>7}  결과")
+    print("-" * 80)
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        reference = _parse_reference(html)
+        fast = _parse_fast(html)
+        equal = reference == fast
+        all_equal = all_equal and equal
+
+        ref_ms = statistics.median(_time_parser(_parse_reference, html, repeat)) * 1000
+        fast_ms = statistics.median(_time_parser(_parse_fast, html, repeat)) * 1000
+        speedup = ref_ms / fast_ms if fast_ms > 0 else float("inf")
+
+        print(f"{os.path.basename(path):<32} {len(reference):>5} {ref_ms:>10.1f} {fast_ms:>10.1f} {speedup:>6.1f}x  {'✅ 동일' if equal else '❌ 불일치'}")
+
+        if not equal:
+            for ref_row, fast_row in zip(reference, fast):
+                if ref_row != fast_row:
+                    print(f"   기존: {ref_row}")
+                    print(f"   고속: {fast_row}")
+                    break
+            if len(reference) != len(fast):
+                print(f"   경기 수 불일치: 기존 {len(reference)}개, 고속 {len(fast)}개")
+
+    return all_equal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Daum Sports 일정 파서 결과 비교 및 벤치마크")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_FIXTURES, help="비교할 HTML 파일 (기본값: 프로젝트 루트의 daumsports*.html)")
+    parser.add_argument("--repeat", type=int, default=10, help="파서별 반복 실행 횟수 (기본값: 10, 중앙값 사용)")
+    args = parser.parse_args()
+
+    if not args.paths:
+        print("❌ 비교할 HTML 파일이 없습니다.")
+        return 1
+
+    all_equal = run_benchmark(args.paths, args.repeat)
+    return 0 if all_equal else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
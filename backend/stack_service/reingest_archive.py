@@ -0,0 +1,131 @@
+# backend/stack_service/reingest_archive.py
+"""
+원본 페이지 아카이브 재적재 스크립트
+crawler_page_archive에 보관된 Daum 월별 페이지를 현재 파서로 다시 파싱하여
+kbo_games / kbo_schedule에 적재합니다. 파서를 고친 뒤 Daum을 다시 크롤링하지 않고 과거 데이터를 갱신할 때 사용합니다.
+
+- 월별로 가장 최근에 보관된 페이지를 사용합니다.
+- 압축 해제 + 파싱은 CPU 코어 수만큼 프로세스로 병렬 처리합니다.
+- 저장은 크롤러와 같은 row_digest 비교 UPSERT(CrawlerService._write_games)를 하나의 트랜잭션으로 수행합니다.
+
+사용 예:
+    cd backend
+    python -m stack_service.reingest_archive                                  # 전체 아카이브
+    python -m stack_service.reingest_archive --start 2024-03 --end 2024-11    # 월 범위 지정
+    python -m stack_service.reingest_archive --dry-run                        # 저장 없이 파싱 결과만 확인
+    python -m stack_service.reingest_archive --import-dir ../archive          # 저장된 HTML 파일을 아카이브에 추가
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+from config import engine, CURRENT_DATE
+from services.crawler_service import CrawlerService
+from services.page_archive import PageArchive
+from services.page_sources import ArchivedPageSource
+
+# 한 번에 DB에서 읽어 올 페이지 수 (메모리 사용량 제한)
+BLOB_BATCH_SIZE = 50
+
+
+def _parse_blob(item: tuple) -> tuple:
+    """(page_month, gzip 본문)을 받아 (page_month, 경기 리스트)를 반환합니다. (worker 프로세스에서 실행)"""
+    page_month, blob = item
+    html = gzip.decompress(blob).decode("utf-8")
+    return page_month, CrawlerService._parse_daum_rows_fast(html)
+
+
+def _parse_month(value: str):
+    return datetime.strptime(value, "%Y-%m").date() if value else None
+
+
+def import_directory(directory: str) -> int:
+    """
+    저장된 HTML 파일(*.html, *.html.gz)을 아카이브에 추가합니다.
+    수집 시각은 파일 수정 시각을 사용합니다.
+
+    Returns:
+        int: 인덱스에 새로 기록된 페이지 수
+    """
+    source = ArchivedPageSource(directory)
+    imported = 0
+    for year, month in source.months():
+        page_month = date(year, month, 1)
+        body, digest = source.fetch(page_month)
+        fetched_at = datetime.fromtimestamp(os.path.getmtime(source.path(year, month)))
+        if PageArchive.store(page_month, body, digest, fetched_at=fetched_at):
+            imported += 1
+    return imported
+
+
+def reingest(start_month=None, end_month=None, workers: int = None, dry_run: bool = False) -> dict:
+    """
+    아카이브의 월별 최신 페이지를 다시 파싱하여 적재합니다.
+
+    Args:
+        start_month, end_month: 재적재할 월 범위 (None이면 전체)
+        workers: 파싱 프로세스 수 (기본값: CPU 코어 수)
+        dry_run: True면 DB 저장 없이 파싱 결과만 집계
+
+    Returns:
+        dict: {"pages", "games", "results", "schedules"}
+    """
+    pages = PageArchive.list_pages(start_month, end_month, latest_only=True)
+    if not pages:
+        print("⚠️ 재적재할 페이지가 아카이브에 없습니다.")
+        return {"pages": 0, "games": 0}
+
+    print(f"🗄️ 아카이브 페이지 {len(pages)}개 ({pages[0]['page_month']:%Y-%m} ~ {pages[-1]['page_month']:%Y-%m})")
+
+    started = time.perf_counter()
+    parsed = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for i in range(0, len(pages), BLOB_BATCH_SIZE):
+            batch = pages[i:i + BLOB_BATCH_SIZE]
+            blobs = PageArchive.load_blobs({p["sha256"] for p in batch})
+            items = [(p["page_month"], blobs[p["sha256"]]) for p in batch if p["sha256"] in blobs]
+            parsed.extend(executor.map(_parse_blob, items))
+
+    games = CrawlerService._merge_pages(parsed)
+    print(f"⚙️ 파싱 완료: {len(games)}경기 ({time.perf_counter() - started:.1f}초)")
+
+    summary = {"pages": len(parsed), "games": len(games)}
+    if dry_run:
+        return summary
+
+    result_rows = [row for row in (CrawlerService._to_result_row(g) for g in games) if row]
+    schedule_rows = [CrawlerService._to_schedule_row(g) for g in games if g["game_date"] >= CURRENT_DATE]
+    with engine.begin() as conn:
+        written = CrawlerService._write_games(conn, result_rows, schedule_rows)
+    summary["results"] = written["results"]
+    summary["schedules"] = written["schedules"]
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 Daum 페이지를 현재 파서로 다시 적재합니다.")
+    parser.add_argument("--start", default=None, help="시작 월 (YYYY-MM, 기본값: 제한 없음)")
+    parser.add_argument("--end", default=None, help="종료 월 (YYYY-MM, 기본값: 제한 없음)")
+    parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--dry-run", action="store_true", help="DB 저장 없이 파싱 결과만 확인")
+    parser.add_argument("--import-dir", default=None, help="재적재 전에 이 디렉터리의 HTML 파일을 아카이브에 추가")
+    args = parser.parse_args()
+
+    if args.import_dir:
+        imported = import_directory(args.import_dir)
+        print(f"📥 {imported}개 페이지를 아카이브에 추가했습니다.")
+
+    summary = reingest(_parse_month(args.start), _parse_month(args.end), workers=args.workers, dry_run=args.dry_run)
+
+    print(f"\n{'='*60}")
+    print(f"{'🔍 DRY-RUN' if args.dry_run else '✅ 재적재'} 완료: {summary}")
+    print(f"{'='*60}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# backend/stack_service/seed_box_scores.py
+"""
+과거 경기 박스스코어 시딩 스크립트
+kbo_games에 있지만 박스스코어가 없는 경기의 Daum 상세 페이지를 배치 단위로 수집합니다.
+중단 후 재실행하면 이미 저장된 경기는 건너뜁니다.
+
+사용 예:
+    cd backend
+    python -m stack_service.seed_box_scores                              # 남은 경기 전체 수집
+    python -m stack_service.seed_box_scores --max-games 500              # 최대 500경기만
+    python -m stack_service.seed_box_scores --workers 8 --processes 4    # 동시 요청 8개, 파싱 프로세스 4개
+    python -m stack_service.seed_box_scores --retry-unavailable          # 스코어보드를 못 찾았던 경기 재시도
+"""
+import argparse
+import sys
+
+from services.box_score_service import BoxScoreService, BOX_SCORE_BATCH_LIMIT, BOX_SCORE_FETCH_WORKERS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="박스스코어가 없는 과거 경기의 상세 페이지를 수집합니다.")
+    parser.add_argument("--max-games", type=int, default=None, help="최대 수집 경기 수 (기본값: 제한 없음)")
+    parser.add_argument("--batch-size", type=int, default=BOX_SCORE_BATCH_LIMIT, help=f"배치당 경기 수 (기본값: {BOX_SCORE_BATCH_LIMIT})")
+    parser.add_argument("--workers", type=int, default=BOX_SCORE_FETCH_WORKERS, help=f"동시 요청 수 (기본값: {BOX_SCORE_FETCH_WORKERS})")
+    parser.add_argument("--processes", type=int, default=None, help="파싱 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--retry-unavailable", action="store_true", help="스코어보드를 찾지 못했던 경기도 다시 수집")
+    args = parser.parse_args()
+
+    total = {"requested": 0, "ok": 0, "unavailable": 0, "failed": 0}
+    retry_unavailable = args.retry_unavailable
+    while args.max_games is None or total["requested"] < args.max_games:
+        limit = args.batch_size
+        if args.max_games is not None:
+            limit = min(limit, args.max_games - total["requested"])
+
+        summary = BoxScoreService.ingest(
+            limit=limit,
+            fetch_workers=args.workers,
+            parse_workers=args.processes,
+            retry_unavailable=retry_unavailable,
+        )
+        for key in total:
+            total[key] += summary[key]
+
+        # 한 배치가 전부 요청 실패면 네트워크 문제로 보고 중단 (실패한 경기는 다음 실행에서 다시 시도)
+        if summary["requested"] == 0 or summary["failed"] == summary["requested"]:
+            break
+        # 재시도 대상은 첫 배치에서만 포함 (다시 unavailable이 된 경기를 반복 요청하지 않도록)
+        retry_unavailable = False
+
+    print(f"\n{'='*60}")
+    print(f"✅ 박스스코어 수집 완료: {total}")
+    print(f"{'='*60}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
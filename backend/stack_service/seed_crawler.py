@@ -11,88 +11,236 @@ Daum Sports는 2007년부터 데이터를 제공하므로,
     python -m stack_service.seed_crawler                         # 2007~2025 전체 수집
     python -m stack_service.seed_crawler --dry-run                # 미리보기
     python -m stack_service.seed_crawler --start-year 2020        # 2020~2025만 수집
+    python -m stack_service.seed_crawler --workers 8 --rate 4     # 동시 수집 (worker 8개, 초당 4회)
+    python -m stack_service.seed_crawler --reset                  # 체크포인트 무시하고 처음부터
+    python -m stack_service.seed_crawler --replay-dir ../archive  # 저장된 HTML 페이지로 오프라인 적재
+
+중단 후 재실행하면 seed_crawl_checkpoints(init_db.sql 3.2)에 기록된 (연도, 월)은 건너뜁니다.
+진행 중인 월은 기록하지 않으므로 재실행 시 다시 수집합니다.
 """
 import argparse
+import random
 import sys
-from datetime import date
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
 from sqlalchemy import text
 
 from config import engine
 from services.crawler_service import CrawlerService
+from services.page_sources import ArchivedPageSource
 
 # Daum Sports가 제공하는 가장 오래된 연도
 EARLIEST_YEAR = 2007
 DEFAULT_END_YEAR = 2025
 
+# KBO 시즌 월 범위 (3월 개막 ~ 11월 한국시리즈)
+SEASON_MONTHS = range(3, 12)
+
+# 동시 수집 기본값
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 2.0          # 초당 최대 요청 수 (모든 worker 공유)
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 2.0
+
+INSERT_GAME_SQL = text("""
+    INSERT INTO kbo_games (game_id, game_date, home_team, away_team, home_score, away_score, winning_team, is_postseason, sort_text)
+    VALUES (:game_id, :game_date, :home_team, :away_team, :home_score, :away_score, :winning_team, :is_postseason, :sort_text)
+    ON CONFLICT (game_id) DO NOTHING
+""")
+
+
+class RateLimiter:
+    """여러 worker가 공유하는 요청 간격 제한기 (초당 최대 rate회)."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+def _load_completed_months(start_year: int, end_year: int) -> set:
+    """이미 수집이 끝난 (연도, 월) 목록을 조회합니다."""
+    with engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT year, month FROM seed_crawl_checkpoints
+            WHERE year BETWEEN :start_year AND :end_year
+        """), {"start_year": start_year, "end_year": end_year}).fetchall()
+    return {(r.year, r.month) for r in rows}
+
+
+def _reset_checkpoints(start_year: int, end_year: int):
+    """지정 범위의 체크포인트를 삭제하여 처음부터 다시 수집하게 합니다."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            DELETE FROM seed_crawl_checkpoints
+            WHERE year BETWEEN :start_year AND :end_year
+        """), {"start_year": start_year, "end_year": end_year})
 
-def seed_historical_data(start_year: int, end_year: int, dry_run: bool = False) -> int:
+
+def _to_game_row(game: dict) -> dict | None:
+    """파싱된 경기 dict를 kbo_games 행으로 변환합니다. 미경기/점수 오류는 None."""
+    # 점수가 '-'인 경기(미경기)는 저장하지 않음
+    if game["home_score"] == "-" or game["away_score"] == "-":
+        return None
+
+    try:
+        home_score = int(game["home_score"])
+        away_score = int(game["away_score"])
+    except ValueError:
+        return None
+
+    # 승리팀 결정
+    if home_score > away_score:
+        winning_team = game["home_team"]
+    elif away_score > home_score:
+        winning_team = game["away_team"]
+    else:
+        winning_team = "무승부"
+
+    return {
+        "game_id": game["game_id"],
+        "game_date": game["game_date"],
+        "home_team": game["home_team"],
+        "away_team": game["away_team"],
+        "home_score": home_score,
+        "away_score": away_score,
+        "winning_team": winning_team,
+        "is_postseason": game["is_postseason"],
+        "sort_text": game["sort_text"],
+    }
+
+
+def _fetch_month_rows(year: int, month: int, limiter: RateLimiter, max_retries: int, source=None) -> list[dict] | None:
+    """
+    한 달치 페이지를 가져와 kbo_games 행 리스트로 변환합니다.
+    실패 시 지수 백오프(+지터)로 재시도하며, 모두 실패하면 None을 반환합니다.
+    """
+    target_date = date(year, month, 1)
+    for attempt in range(max_retries + 1):
+        limiter.wait()
+        games = CrawlerService.fetch_games(target_date, source)
+        if games is not None:
+            return [row for row in (_to_game_row(g) for g in games) if row]
+
+        if attempt < max_retries:
+            delay = BACKOFF_BASE_SECONDS * (2 ** attempt) + random.uniform(0, 1)
+            print(f"   ↻ {year}-{month:02d} 재시도 {attempt + 1}/{max_retries} ({delay:.1f}초 후)")
+            time.sleep(delay)
+    return None
+
+
+def _save_month(year: int, month: int, rows: list[dict], checkpoint: bool = True) -> int:
+    """한 달치 경기를 하나의 트랜잭션으로 저장하고, checkpoint가 True면 체크포인트를 기록합니다."""
+    with engine.begin() as conn:
+        inserted = 0
+        if rows:
+            inserted = conn.execute(INSERT_GAME_SQL, rows).rowcount or 0
+        if not checkpoint:
+            return inserted
+        conn.execute(text("""
+            INSERT INTO seed_crawl_checkpoints (year, month, game_count)
+            VALUES (:year, :month, :game_count)
+            ON CONFLICT (year, month) DO UPDATE SET
+                game_count = EXCLUDED.game_count,
+                completed_at = NOW()
+        """), {"year": year, "month": month, "game_count": len(rows)})
+    return inserted
+
+
+def seed_historical_data(
+    start_year: int,
+    end_year: int,
+    dry_run: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    rate: float = DEFAULT_RATE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    reset: bool = False,
+    replay_dir: str = None,
+) -> int:
     """
     과거 경기 데이터를 Daum Sports에서 수집하여 DB에 저장합니다.
-    월별로 각 월의 1일을 기준일로 요청합니다.
+    월별로 각 월의 1일을 기준일로 요청하며, 여러 월을 동시에 수집합니다.
+    완료된 (연도, 월)은 seed_crawl_checkpoints에 기록되어 중단 후 재실행 시 건너뜁니다.
 
     Args:
         start_year: 수집 시작 연도 (예: 2007)
         end_year: 수집 종료 연도 (예: 2025)
-        dry_run: True면 DB 저장 없이 수집 결과만 출력
+        dry_run: True면 DB 저장 없이 수집 결과만 출력 (체크포인트 미사용)
+        workers: 동시 수집 worker 수 (1이면 순차 수집)
+        rate: 초당 최대 요청 수 (모든 worker 공유)
+        max_retries: 월별 최대 재시도 횟수
+        reset: True면 지정 범위의 체크포인트를 지우고 처음부터 수집
+        replay_dir: 지정 시 Daum Sports 대신 해당 디렉터리의 저장된 HTML 페이지를 사용
 
     Returns:
         int: 저장된 경기 개수
     """
+    months = [(year, month) for year in range(start_year, end_year + 1) for month in SEASON_MONTHS]
+
+    source = None
+    if replay_dir:
+        # 오프라인 재생: 아카이브에 있는 월만 대상으로 하며 네트워크 요청이 없으므로 재시도/요청 간격 제한 없음
+        # 아카이브가 일부만 있을 수 있으므로 체크포인트를 읽거나 기록하지 않음 (이후 네트워크 수집이 해당 월을 건너뛰지 않도록)
+        source = ArchivedPageSource(replay_dir)
+        archived = set(source.months())
+        months = [m for m in months if m in archived]
+        max_retries = 0
+        rate = 0
+        print(f"📂 오프라인 재생: {replay_dir} ({len(months)}개 월, 체크포인트 미사용)")
+
+    if not dry_run and not replay_dir:
+        if reset:
+            _reset_checkpoints(start_year, end_year)
+        completed = _load_completed_months(start_year, end_year)
+        if completed:
+            print(f"⏭️ 체크포인트 {len(completed)}개 월은 건너뜁니다.")
+        months = [m for m in months if m not in completed]
+
+    limiter = RateLimiter(rate)
     total_count = 0
-    for year in range(start_year, end_year + 1):
-        for month in range(3, 12):
-            target_date = date(year, month, 1)
-            soup = CrawlerService._fetch_from_daum(target_date)
-            if not soup:
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = {
+            executor.submit(_fetch_month_rows, year, month, limiter, max_retries, source): (year, month)
+            for year, month in months
+        }
+        # 저장은 메인 스레드에서 월 단위 트랜잭션으로 수행
+        for future in as_completed(futures):
+            year, month = futures[future]
+            try:
+                rows = future.result()
+            except Exception as e:
+                print(f"⚠️ {year}-{month:02d} 수집 중 오류: {e}")
+                rows = None
+
+            if rows is None:
+                failed.append((year, month))
                 continue
 
-            games = CrawlerService._parse_daum_rows(soup)
-            for game in games:
-                # 점수가 '-'인 경기(미경기)는 저장하지 않음
-                if game["home_score"] == "-" or game["away_score"] == "-":
-                    continue
-
-                try:
-                    home_score = int(game["home_score"])
-                    away_score = int(game["away_score"])
-                except ValueError:
-                    continue
-
-                # 승리팀 결정
-                if home_score > away_score:
-                    winning_team = game["home_team"]
-                elif away_score > home_score:
-                    winning_team = game["away_team"]
-                else:
-                    winning_team = "무승부"
-
-                parsed = {
-                    "game_id": game["game_id"],
-                    "game_date": game["game_date"],
-                    "home_team": game["home_team"],
-                    "away_team": game["away_team"],
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "winning_team": winning_team,
-                    "is_postseason": game["is_postseason"],
-                    "sort_text": game["sort_text"],
-                }
-
-                if dry_run:
-                    print(f"  [DRY-RUN] {game['game_date']} {game['away_team']} vs {game['home_team']} ({home_score}-{away_score})")
-                    total_count += 1
-                else:
-                    with engine.begin() as conn:
-                        insert_query = text("""
-                            INSERT INTO kbo_games (game_id, game_date, home_team, away_team, home_score, away_score, winning_team, is_postseason, sort_text)
-                            VALUES (:game_id, :game_date, :home_team, :away_team, :home_score, :away_score, :winning_team, :is_postseason, :sort_text)
-                            ON CONFLICT (game_id) DO NOTHING
-                        """)
-                        result = conn.execute(insert_query, parsed)
-                        if result.rowcount > 0:
-                            total_count += 1
-
-        print(f"✅ {year}년 수집 완료. 현재 누적: {total_count}개")
+            if dry_run:
+                for row in rows:
+                    print(f"  [DRY-RUN] {row['game_date']} {row['away_team']} vs {row['home_team']} ({row['home_score']}-{row['away_score']})")
+                total_count += len(rows)
+            else:
+                # 아직 끝나지 않은(또는 마감 유예 기간 중인) 월은 다음 실행에서 다시 수집하도록 체크포인트를 남기지 않음
+                closed = CrawlerService._is_closed_month(date(year, month, 1), datetime.now().isoformat())
+                total_count += _save_month(year, month, rows, checkpoint=closed and not replay_dir)
+
+            print(f"✅ {year}-{month:02d} 수집 완료 ({len(rows)}경기). 현재 누적: {total_count}개")
+
+    if failed:
+        print(f"⚠️ 수집 실패 {len(failed)}개 월 (재실행 시 다시 시도): {sorted(failed)}")
 
     return total_count
 
@@ -113,15 +261,45 @@ def main():
         "--dry-run", action="store_true",
         help="DB 저장 없이 수집 결과만 미리보기"
     )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"동시 수집 worker 수 (기본값: {DEFAULT_WORKERS}, 1이면 순차 수집)"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_RATE,
+        help=f"초당 최대 요청 수 (기본값: {DEFAULT_RATE})"
+    )
+    parser.add_argument(
+        "--max-retries", type=int, default=DEFAULT_MAX_RETRIES,
+        help=f"월별 최대 재시도 횟수 (기본값: {DEFAULT_MAX_RETRIES})"
+    )
+    parser.add_argument(
+        "--reset", action="store_true",
+        help="체크포인트를 무시하고 지정 범위를 처음부터 다시 수집"
+    )
+    parser.add_argument(
+        "--replay-dir", default=None,
+        help="Daum Sports 대신 저장된 HTML 페이지(*.html, *.html.gz) 디렉터리에서 적재"
+    )
     args = parser.parse_args()
 
     print(f"\n{'='*60}")
     print(f"📡 과거 경기 데이터 수집 시작")
     print(f"   대상: {args.start_year}년 ~ {args.end_year}년")
     print(f"   모드: {'🔍 DRY-RUN (미리보기)' if args.dry_run else '💾 실제 저장'}")
+    print(f"   동시성: worker {args.workers}개, 초당 최대 {args.rate}회 요청")
     print(f"{'='*60}\n")
 
-    count = seed_historical_data(args.start_year, args.end_year, args.dry_run)
+    count = seed_historical_data(
+        args.start_year,
+        args.end_year,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        rate=args.rate,
+        max_retries=args.max_retries,
+        reset=args.reset,
+        replay_dir=args.replay_dir,
+    )
 
     print(f"\n{'='*60}")
     if args.dry_run:
@@ -32,6 +32,53 @@ def get_supabase_client() -> Client:
     return _supabase_client
 
 
+SCORE_TYPES = ("weekly_score", "prediction_score", "quiz_score")
+
+
+def increment_user_scores(events: list) -> bool:
+    """
+    여러 사용자 점수 증가분을 한 번의 호출로 원자적으로 반영합니다.
+    DB 함수 apply_score_deltas(init_db.sql)가 유저별로 합산한 뒤
+    INSERT ... ON CONFLICT DO UPDATE SET score = score + EXCLUDED.score로 적용하므로
+    동시에 제출된 점수도 유실되지 않습니다.
+
+    Args:
+        events: [{"user_id", "score_type", "delta", "nickname"(선택), "source"(선택)}, ...]
+            - score_type: weekly_score, prediction_score, quiz_score
+            - nickname: 신규 사용자 프로필 생성 시 사용 (기존 사용자는 변경하지 않음)
+            - source: 점수 원장(score_events)에 남길 이벤트 출처
+            - outbox_id: score_outbox id (같은 id는 재전송되어도 한 번만 반영)
+
+    Returns:
+        성공 여부
+    """
+    deltas = [
+        {
+            "user_id": e["user_id"],
+            "nickname": e.get("nickname") or "",
+            "score_type": e["score_type"],
+            "delta": int(e["delta"]),
+            "source": e.get("source") or "",
+            "outbox_id": e.get("outbox_id"),
+        }
+        for e in events
+        if e["score_type"] in SCORE_TYPES and e["delta"]
+    ]
+    if not deltas:
+        return True
+
+    client = get_supabase_client()
+    if not client:
+        return False
+
+    try:
+        client.rpc("apply_score_deltas", {"deltas": deltas}).execute()
+        return True
+    except Exception as e:
+        print(f"⚠️ [Supabase] 점수 일괄 반영 실패: {e}")
+        return False
+
+
 def upsert_user_score(
     user_id: str,
     nickname: str,
@@ -39,7 +86,8 @@ def upsert_user_score(
     score_type: str = "weekly_score"
 ) -> bool:
     """
-    사용자 점수를 Supabase user_profiles 테이블에 UPSERT합니다.
+    사용자 점수를 Supabase user_profiles 테이블에 원자적으로 더합니다.
+    (increment_user_scores의 단건 버전, 프로필이 없으면 생성)
     
     Args:
         user_id: Firebase UID 또는 Supabase Auth UID
@@ -50,43 +98,12 @@ def upsert_user_score(
     Returns:
         성공 여부
     """
-    client = get_supabase_client()
-    if not client:
-        return False
-
-    try:
-        # 기존 사용자 조회
-        existing = client.table("user_profiles").select("*").eq("user_id", user_id).execute()
-        
-        if existing.data:
-            # 기존 사용자: 점수 업데이트
-            current = existing.data[0]
-            from datetime import datetime
-            now_iso = datetime.utcnow().isoformat()
-            updates = {
-                score_type: (current.get(score_type, 0) or 0) + score_earned,
-                "updated_at": now_iso
-            }
-            # weekly_score는 score_type이 "weekly_score"일 때만 증가
-            if score_type == "weekly_score":
-                updates["weekly_score"] = (current.get("weekly_score", 0) or 0) + score_earned
-            client.table("user_profiles").update(updates).eq("user_id", user_id).execute()
-        else:
-            # 신규 사용자: 프로필 생성
-            new_profile = {
-                "user_id": user_id,
-                "nickname": nickname,
-                score_type: score_earned,
-                "weekly_score": score_earned if score_type == "weekly_score" else 0,
-                "prediction_score": score_earned if score_type == "prediction_score" else 0,
-                "quiz_score": score_earned if score_type == "quiz_score" else 0,
-            }
-            client.table("user_profiles").insert(new_profile).execute()
-        
-        return True
-    except Exception as e:
-        print(f"⚠️ [Supabase] 점수 업데이트 실패: {e}")
-        return False
+    return increment_user_scores([{
+        "user_id": user_id,
+        "nickname": nickname,
+        "score_type": score_type,
+        "delta": score_earned,
+    }])
 
 
 def get_user_rankings(limit: int = 10, order_by: str = "weekly_score"):
@@ -127,21 +144,21 @@ def get_user_rankings(limit: int = 10, order_by: str = "weekly_score"):
         return []
 
 
-def reset_weekly_scores():
-    """주간 점수를 초기화합니다. (매주 월요일 호출)"""
+def reset_weekly_scores(week_start) -> bool:
+    """
+    주간 점수를 초기화합니다. (매주 월요일 호출)
+    DB 함수 start_score_week(init_db.sql)가 점수 원장의 현재 주 키만 바꾸므로
+    user_profiles 전체를 UPDATE하지 않고, 지난 주 점수는 score_weekly_totals에 그대로 남습니다.
+
+    Args:
+        week_start: 새 주에 속한 날짜 (해당 주 월요일로 맞춰짐)
+    """
     client = get_supabase_client()
     if not client:
         return False
 
     try:
-        # updated_at에 "now()" 문자열이 아닌 실제 DB now() 함수를 사용하기 위해
-        # Supabase의 raw SQL 실행 기능을 활용
-        from datetime import datetime
-        now_iso = datetime.utcnow().isoformat()
-        client.table("user_profiles") \
-            .update({"weekly_score": 0, "updated_at": now_iso}) \
-            .gte("weekly_score", 1) \
-            .execute()
+        client.rpc("start_score_week", {"p_week": week_start.isoformat()}).execute()
         return True
     except Exception as e:
         print(f"⚠️ [Supabase] 주간 점수 초기화 실패: {e}")
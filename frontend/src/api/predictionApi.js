@@ -11,5 +11,10 @@ export const submitUserPrediction = (userId, gameId, predictedWinner) => apiClie
     params: { user_id: userId, game_id: gameId, predicted_winner: predictedWinner }
 });
 
+// 하루 경기 예측 한 번에 제출하기 (picks: [{game_id, predicted_winner}, ...], gameDate 생략 시 오늘)
+export const submitPredictionSlate = (userId, picks, gameDate, displayName) => apiClient.post('/api/predict/slate', {
+    user_id: userId, picks: picks, game_date: gameDate, display_name: displayName
+});
+
 // 포스트시즌 대진표 및 AI 예측 결과 가져오기 (백엔드: GET /api/simulation/postseason)
 export const getPostseasonBracket = () => apiClient.get('/api/simulation/postseason');
@@ -2,10 +2,11 @@
 // 퀴즈 관련 API
 import apiClient from './apiClient';
 
-// 퀴즈 가져오기 (difficulty: easy / medium / hard, 생략 시 전체)
-export const getQuiz = (difficulty) => {
+// 퀴즈 가져오기 (difficulty: easy / medium / hard, 생략 시 전체 / userId를 주면 안 푼 퀴즈 우선)
+export const getQuiz = (difficulty, userId) => {
     const params = {};
     if (difficulty) params.difficulty = difficulty;
+    if (userId) params.user_id = userId;
     return apiClient.get('/api/quiz', { params });
 };
 
@@ -13,3 +14,16 @@ export const getQuiz = (difficulty) => {
 export const submitQuiz = (userId, quizId, answer, displayName) => apiClient.post('/api/quiz/submit', null, {
     params: { user_id: userId, quiz_id: quizId, answer: answer, display_name: displayName }
 });
+
+// 오늘 풀 퀴즈 세트 한 번에 가져오기 (n개, userId를 주면 안 푼 퀴즈 우선 / 남은 참여 횟수만큼)
+export const getQuizBatch = (n, difficulty, userId) => {
+    const params = { n };
+    if (difficulty) params.difficulty = difficulty;
+    if (userId) params.user_id = userId;
+    return apiClient.get('/api/quiz/batch', { params });
+};
+
+// 여러 퀴즈 답안 한 번에 제출하기 (answers: [{quiz_id, answer}, ...])
+export const submitQuizBatch = (userId, answers, displayName) => apiClient.post('/api/quiz/submit/batch', {
+    user_id: userId, display_name: displayName, answers: answers
+});
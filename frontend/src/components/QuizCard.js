@@ -19,6 +19,8 @@ export default function QuizCard({ user }) {
   const [difficulty, setDifficulty] = useState(null);
   const [dailyCount, setDailyCount] = useState(0);
 
+  const quizUserId = user?.id || user?.user?.id || user?.uid;
+
   const fetchNewQuiz = useCallback(async (selectedDifficulty) => {
     setLoading(true);
     setResult(null);
@@ -26,7 +28,7 @@ export default function QuizCard({ user }) {
     setQuiz(null);
     try {
       const diff = selectedDifficulty || difficulty;
-      const response = await getQuiz(diff);
+      const response = await getQuiz(diff, quizUserId);
       // API 응답: {status: "ok", quiz: {id, question, options, difficulty, source_hint}}
       const quizData = response.data?.quiz || response.data;
       setQuiz(quizData);
@@ -35,7 +37,7 @@ export default function QuizCard({ user }) {
     } finally {
       setLoading(false);
     }
-  }, [difficulty]);
+  }, [difficulty, quizUserId]);
 
   useEffect(() => {
     fetchNewQuiz();
@@ -23,6 +23,8 @@ export const API_ENDPOINTS = {
   SEASON_PROJECTION: '/api/simulation/projection',
   QUIZ: '/api/quiz',
   QUIZ_SUBMIT: '/api/quiz/submit',
+  QUIZ_BATCH: '/api/quiz/batch',
+  QUIZ_SUBMIT_BATCH: '/api/quiz/submit/batch',
   AI_PERFORMANCE: '/api/performance/',
   SIMULATION_REPORT: '/api/performance/simulation-report'
 };